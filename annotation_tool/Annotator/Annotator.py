@@ -5,6 +5,7 @@ import random
 from xlsxwriter import Workbook
 import pandas as pd
 from .constants import DATA_TYPES, DATA_QUALITY_CLASSES, ROW_LIMIT, UNITS
+from .data_files import count_data_rows, is_data_file, read_data_file, strip_data_file_extension
 
 
 class Annotator:
@@ -69,7 +70,7 @@ class Annotator:
         self._write_text_file()
 
     def _get_data_files(self):
-        return [f for f in os.listdir(self.input_directory) if f.endswith('.csv')]
+        return [f for f in os.listdir(self.input_directory) if is_data_file(f)]
 
     def _get_row_names(self, data):
         return list(data.columns.str.strip())
@@ -77,28 +78,27 @@ class Annotator:
     def _create_sheet(self, input_file):
         # Use only the table name (last dot-separated segment before the extension)
         # to avoid exceeding Excel's 31-character sheet name limit
-        base = os.path.splitext(os.path.basename(input_file))[0]
+        base = strip_data_file_extension(os.path.basename(input_file))
         sheet_name = base.split(".")[-1][:31]
         sheet = self.wb.add_worksheet(sheet_name)
 
         self._create_header(sheet, input_file)
 
         filepath = os.path.join(self.input_directory, input_file)
-        with open(filepath) as f:
-            total_rows = sum(1 for _ in f) - 1  # subtract header row
+        total_rows = count_data_rows(filepath)
 
         if total_rows <= ROW_LIMIT:
-            data = pd.read_csv(filepath, low_memory=False)
+            data = read_data_file(filepath)
         else:
             skip_prob = 1 - ROW_LIMIT / total_rows
             skip_rows = lambda i: i > 0 and random.random() < skip_prob
-            data = pd.read_csv(filepath, skiprows=skip_rows, low_memory=False)
+            data = read_data_file(filepath, skiprows=skip_rows)
             # For columns that appear entirely null in the sample, fall back to the
             # full column so sparse entries (e.g. a single "REDACTED" value) are not
             # silently dropped and misclassified as (none).
             null_cols = [col for col in data.columns if data[col].isna().all()]
             if null_cols:
-                full_sparse = pd.read_csv(filepath, usecols=null_cols, low_memory=False)
+                full_sparse = read_data_file(filepath, usecols=null_cols)
                 for col in null_cols:
                     data[col] = full_sparse[col]
         row_names = self._get_row_names(data)
@@ -2,7 +2,8 @@
 
 import os
 import random
-import pandas as pd
+
+from .data_files import count_data_rows, is_data_file, read_data_file, strip_data_file_extension
 
 
 ROW_LIMIT = 10000
@@ -14,22 +15,21 @@ def create_counts(input_directory, output_directory):
     # Now we can go through and get all the value counts...
     for file in os.listdir(input_directory):
         file = os.path.join(input_directory, file)
-        if file.endswith('.csv'):
+        if is_data_file(file):
             base_name = os.path.basename(file)
-            file_base = os.path.splitext(base_name)[0]
+            file_base = strip_data_file_extension(base_name)
             out_path = os.path.join(output_directory, f"{file_base}_data_counts.txt")
 
             with open(out_path, "w+") as out_file:
                 out_file.write(f"Contents of {base_name}:\n")
 
-                with open(file) as f:
-                    total_rows = sum(1 for _ in f) - 1
+                total_rows = count_data_rows(file)
                 if total_rows <= ROW_LIMIT:
-                    tmp = pd.read_csv(file, low_memory=False)
+                    tmp = read_data_file(file)
                 else:
                     skip_prob = 1 - ROW_LIMIT / total_rows
                     skip_rows = lambda i: i > 0 and random.random() < skip_prob
-                    tmp = pd.read_csv(file, skiprows=skip_rows, low_memory=False)
+                    tmp = read_data_file(file, skiprows=skip_rows)
 
                 columns = tmp.columns.to_list()
                 columns.sort()
@@ -0,0 +1,83 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import gzip
+import bz2
+import pandas as pd
+
+
+# Delimited text, optionally compressed, and columnar data files. Compressed files are
+# decompressed while they are streamed, zstd needs the zstandard package and the
+# columnar formats need pyarrow.
+COMPRESSION_EXTENSIONS = [".gz", ".bz2", ".zst"]
+COLUMNAR_EXTENSIONS = [".parquet", ".feather"]
+DATA_FILE_EXTENSIONS = [".csv"] + [".csv" + ext for ext in COMPRESSION_EXTENSIONS] + COLUMNAR_EXTENSIONS
+
+
+def get_data_file_extension(file_name):
+    # Longest match first so data.csv.gz is .csv.gz rather than .gz
+    for ext in sorted(DATA_FILE_EXTENSIONS, key=len, reverse=True):
+        if file_name.lower().endswith(ext):
+            return ext
+    return None
+
+
+def is_data_file(file_name):
+    return get_data_file_extension(file_name) is not None
+
+
+def strip_data_file_extension(file_name):
+    ext = get_data_file_extension(file_name)
+    if ext is None:
+        return os.path.splitext(file_name)[0]
+    return file_name[: -len(ext)]
+
+
+def open_data_file(filepath):
+    """Opens a delimited data file as text, decompressing it on the fly."""
+    ext = get_data_file_extension(filepath)
+    if ext == ".csv.gz":
+        return gzip.open(filepath, "rt")
+    if ext == ".csv.bz2":
+        return bz2.open(filepath, "rt")
+    if ext == ".csv.zst":
+        import zstandard
+
+        return zstandard.open(filepath, "rt")
+    return open(filepath)
+
+
+def count_data_rows(filepath):
+    """Number of data rows, without the header."""
+    ext = get_data_file_extension(filepath)
+    if ext == ".parquet":
+        from pyarrow import parquet
+
+        return parquet.ParquetFile(filepath).metadata.num_rows
+    if ext == ".feather":
+        from pyarrow import feather
+
+        return feather.read_table(filepath, memory_map=True).num_rows
+    with open_data_file(filepath) as f:
+        return sum(1 for _ in f) - 1  # subtract header row
+
+
+def read_data_file(filepath, skiprows=None, usecols=None):
+    """
+    Reads a data file like pd.read_csv. skiprows is a callable taking the line number,
+    line 0 being the header, so columnar files sample their rows the same way.
+    """
+    ext = get_data_file_extension(filepath)
+    if ext not in COLUMNAR_EXTENSIONS:
+        # The parser infers the compression from the extension
+        return pd.read_csv(filepath, skiprows=skiprows, usecols=usecols, low_memory=False)
+
+    if ext == ".parquet":
+        data = pd.read_parquet(filepath, columns=usecols)
+    else:
+        data = pd.read_feather(filepath, columns=usecols)
+    # A stored index named like a column is data, an unnamed one is dropped
+    data = data.reset_index(drop=all(name is None for name in data.index.names))
+    if skiprows is not None:
+        data = data[[not skiprows(i + 1) for i in range(len(data))]].reset_index(drop=True)
+    return data
@@ -39,7 +39,19 @@ def run_metadata_generation(
     n_rows=-1,
     processes=1,
     annotations='False',
-    pdf_engine='playwright'
+    pdf_engine='playwright',
+    typed_loading='false',
+    csv_engine='pandas',
+    memory_budget=-1,
+    lazy_loading='false',
+    memory_ceiling=-1,
+    streaming_statistics='false',
+    statistics_chunk_rows=-1,
+    median_error_bound=-1,
+    table_cache=None,
+    staging_mode='copy',
+    seed=None,
+    sample_fraction=-1
 ):
     """
     Generate Low Level Metadata (LLMD) for Livewire Project.
@@ -57,9 +69,21 @@ def run_metadata_generation(
         input_path (str): Path to Input Directory
         output_path (str): Path to Output Directory
         n_rows (int): Max Row Count
-        processes (int): Number of Processes to spawn for Sampling
+        processes (int): Number of Processes to spawn for Sampling and workers for loading data files, computing LLMD columns and running rules
         annotations (str): Use manual annotations, no inference
         pdf_engine (str): PDF rendering engine ('playwright' or 'weasyprint')
+        typed_loading (str): Load data files with the dtypes described in the annotations
+        csv_engine (str): CSV reader used to load data files ('pandas' or 'pyarrow')
+        memory_budget (int): Memory budget in MB for data files being loaded, LLMD columns computed or tables running rules at the same time, -1 for no limit
+        lazy_loading (str): Read each data file when it is first needed instead of up front
+        memory_ceiling (int): Memory ceiling in MB for lazily loaded data files kept in memory, -1 for no limit
+        streaming_statistics (str): Compute the LLMD statistics from chunked passes over the data files rather than the loaded tables, reading the tables lazily
+        statistics_chunk_rows (int): Rows read at a time with streaming statistics, -1 for the default
+        median_error_bound (float): Rank error allowed for the medians of large columns with streaming statistics, -1 for exact medians
+        table_cache (str): Directory of the parsed data file and annotations cache, None to always parse the data files
+        staging_mode (str): How the input directory is staged ('copy', 'in_place', 'symlink' or 'hardlink')
+        seed (int): Seed for sampling data files, None for a different sample every run
+        sample_fraction (float): Fraction of rows to sample keeping foreign keys consistent across tables, -1 for no key sampling
     """
 
     settings = MetadataGenerationSettings()
@@ -71,9 +95,27 @@ def run_metadata_generation(
     settings.n_rows = int(n_rows)
     settings.output_path = output_path
     settings.processes = int(processes)
+    settings.typed_loading = convert_string_to_bool(typed_loading)
+    settings.csv_engine = csv_engine
+    if int(memory_budget) > 0:
+        settings.memory_budget = int(memory_budget) * 2**20
+    settings.lazy_loading = convert_string_to_bool(lazy_loading)
+    if int(memory_ceiling) > 0:
+        settings.memory_ceiling = int(memory_ceiling) * 2**20
+    settings.streaming_statistics = convert_string_to_bool(streaming_statistics)
+    if int(statistics_chunk_rows) > 0:
+        settings.statistics_chunk_rows = int(statistics_chunk_rows)
+    if float(median_error_bound) > 0:
+        settings.median_error_bound = float(median_error_bound)
+    settings.table_cache_directory_path = table_cache
+    settings.staging_mode = staging_mode
+    if seed != None:
+        settings.sampling_seed = int(seed)
+    settings.sample_fraction = float(sample_fraction)
 
     file_locs = DefaultFileLocations()
-    file_locs.set_input(settings.input_path, settings.n_rows, settings.processes)
+    file_locs.set_input(settings.input_path, settings.n_rows, settings.processes, settings.staging_mode, settings.sampling_seed,
+                        settings.sample_fraction, settings.delimiter)
     file_locs.set_output(settings.output_path)
     InsightFilePaths().init()
     VeritasFilePaths().init()
@@ -90,14 +132,15 @@ def run_metadata_generation(
     metadata_generation_input = MetadataGenerationInput(settings)
 
     if skip_to_veritas_bool == skip_to_schema_validation_bool == skip_to_pdf_creation_bool == False:
-        llmd_factory.create_llmd(metadata_generation_input, use_annotations=convert_string_to_bool(annotations))
+        llmd_factory.create_llmd(metadata_generation_input, use_annotations=convert_string_to_bool(annotations),
+                                 processes=settings.processes, memory_budget=settings.memory_budget)
     if skip_to_schema_validation_bool == skip_to_pdf_creation_bool == False:
         if mode == 'full' or mode == 'f':
             full_analysis_driver = FullAnalysisDriver()
             full_analysis_driver.set_input_file_paths()
             full_analysis_driver.set_veritas_file_writer(error_when_files_exist)
             full_analysis_driver.generate_data_quality_rules(metadata_generation_input)
-            full_analysis_driver.execute_rules(metadata_generation_input)
+            full_analysis_driver.execute_rules(metadata_generation_input, settings.processes, settings.memory_budget)
             full_analysis_driver.distill_data_quality_characterization(metadata_generation_input)
         elif mode == 'distill' or mode == 'd':
             distillation_driver = DistillationDriver()
@@ -141,8 +184,20 @@ def main():
     parser.add_argument('-i', '--input_path', help="Path to Input Directory (overridden by --project/--dataset if both are set)", default=None, required=False)
     parser.add_argument('-o', '--output_path', help="Path to Output Directory (overridden by --project/--dataset if both are set)", default=None, required=False)
     parser.add_argument("-n", "--n_rows", help="Max Row Count", default=-1, required=False)
-    parser.add_argument("-p", "--processes", help="Number of Processes to spawn for Sampling", default=1, required=False)
+    parser.add_argument("-frac", "--sample_fraction", help="Fraction of rows to sample with foreign keys kept consistent across tables, using the keys in the annotations (-1 to disable)", default=-1, required=False)
+    parser.add_argument("--seed", help="Seed for sampling data files with -n or -frac so the sample can be reproduced", default=None, required=False)
+    parser.add_argument("-p", "--processes", help="Number of Processes to spawn for Sampling and workers for loading data files, computing LLMD columns and running rules", default=1, required=False)
+    parser.add_argument("-mem", "--memory_budget", help="Memory budget in MB for data files being loaded, LLMD columns computed or tables running rules at the same time (-1 for no limit)", default=-1, required=False)
+    parser.add_argument("-lazy", "--lazy_loading", help="Read each data file when it is first needed and evict tables under the memory ceiling", default='false', required=False)
+    parser.add_argument("-ceil", "--memory_ceiling", help="Memory ceiling in MB for lazily loaded data files kept in memory (-1 for no limit)", default=-1, required=False)
+    parser.add_argument("-stream", "--streaming_statistics", help="Compute the LLMD statistics from chunked passes over the data files, with memory growing with the columns rather than the rows; implies lazy loading of the tables", default='false', required=False)
+    parser.add_argument("--statistics_chunk_rows", help="Rows read at a time with streaming statistics (-1 for the default)", default=-1, required=False)
+    parser.add_argument("--median_error_bound", help="Rank error allowed for the medians of large columns with streaming statistics, which are then estimated by a quantile sketch (-1 for exact medians)", default=-1, required=False)
+    parser.add_argument("-cache", "--table_cache", help="Directory used to cache parsed data files and annotations between runs (no cache if omitted)", default=None, required=False)
+    parser.add_argument("--staging_mode", help="How the input directory is staged: 'copy' (default) copies it, 'in_place' reads it where it is, 'symlink' and 'hardlink' link its files", choices=['copy', 'in_place', 'symlink', 'hardlink'], default='copy')
     parser.add_argument("-a", "--annotations", help="Use manual annotations, no inference.", default='False', required=False)
+    parser.add_argument("-typed", "--typed_loading", help="Load data files with the column types, date columns and columns listed in the annotations", default='false', required=False)
+    parser.add_argument("--csv_engine", help="CSV reader used to load data files: 'pandas' (default) or 'pyarrow' (multithreaded, requires pyarrow)", choices=['pandas', 'pyarrow'], default='pandas')
     parser.add_argument("--pdf_engine", help="PDF rendering engine to use: 'playwright' (default) or 'weasyprint' (recommended for Linux headless environments)", choices=['playwright', 'weasyprint'], default='playwright')
 
     # Annotation tool options
@@ -237,6 +292,18 @@ def main():
         processes=args.processes,
         annotations=args.annotations,
         pdf_engine=args.pdf_engine,
+        typed_loading=args.typed_loading,
+        csv_engine=args.csv_engine,
+        memory_budget=args.memory_budget,
+        lazy_loading=args.lazy_loading,
+        memory_ceiling=args.memory_ceiling,
+        streaming_statistics=args.streaming_statistics,
+        statistics_chunk_rows=args.statistics_chunk_rows,
+        median_error_bound=args.median_error_bound,
+        table_cache=args.table_cache,
+        staging_mode=args.staging_mode,
+        seed=args.seed,
+        sample_fraction=args.sample_fraction,
     )
 
 
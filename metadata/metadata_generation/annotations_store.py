@@ -0,0 +1,82 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os, pickle, tempfile
+import hashlib
+import warnings
+import pandas as pd
+
+
+"""
+    The annotations workbook read in one pass. Every sheet is parsed once into a DataFrame
+    kept in memory, and every later lookup of a sheet is answered from there. With a cache
+    directory the parsed sheets are also written to a sidecar file keyed by the workbook
+    content hash, so later runs load them instead of parsing the workbook again.
+"""
+
+ANNOTATIONS_CACHE_FORMAT_VERSION = 1
+CONTENT_HASH_CHUNK_BYTES = 2**22
+
+
+class AnnotationsStore:
+
+    def __init__(self, annotations_file_path, cache_directory_path=None):
+        self._annotations_file_path = annotations_file_path
+        self._cache_directory_path = cache_directory_path
+        self._sheets = None
+        if cache_directory_path != None:
+            self._sheets = self._load_cached_sheets()
+        if self._sheets == None:
+            # sheet_name=None parses every sheet of the workbook in a single pass, in sheet order
+            self._sheets = pd.read_excel(annotations_file_path, sheet_name=None)
+            if cache_directory_path != None:
+                self._store_cached_sheets()
+
+    @property
+    def annotations_file_path(self):
+        return self._annotations_file_path
+
+    @property
+    def sheet_names(self) -> list:
+        return list(self._sheets.keys())
+
+    def get_sheet(self, sheet_name) -> pd.DataFrame:
+        # A copy, callers reorder and modify the annotations they are given
+        return self._sheets[sheet_name].copy()
+
+    def get_cache_file_path(self) -> str:
+        content_hash = hashlib.blake2b(digest_size=20)
+        for key_part in [ANNOTATIONS_CACHE_FORMAT_VERSION, pd.__version__]:
+            content_hash.update(repr(key_part).encode())
+        with open(self._annotations_file_path, 'rb') as annotations_file:
+            for chunk in iter(lambda: annotations_file.read(CONTENT_HASH_CHUNK_BYTES), b''):
+                content_hash.update(chunk)
+        file_name = os.path.splitext(os.path.basename(self._annotations_file_path))[0]
+        return os.path.join(self._cache_directory_path, '{}.{}.pkl'.format(file_name, content_hash.hexdigest()))
+
+    def _load_cached_sheets(self) -> dict | None:
+        cache_file_path = self.get_cache_file_path()
+        if not os.path.exists(cache_file_path):
+            return None
+
+        try:
+            with open(cache_file_path, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as error:
+            warnings.warn("Ignoring unreadable annotations cache '{}': {}".format(cache_file_path, error))
+            return None
+
+    def _store_cached_sheets(self) -> None:
+        cache_file_path = self.get_cache_file_path()
+        staging_file_path = None
+        try:
+            os.makedirs(self._cache_directory_path, exist_ok=True)
+            # Written to a temporary file first so a partially written cache is never loaded
+            staging_file_descriptor, staging_file_path = tempfile.mkstemp(prefix=os.path.basename(cache_file_path) + '.',
+                                                                          dir=self._cache_directory_path)
+            with os.fdopen(staging_file_descriptor, 'wb') as staging_file:
+                pickle.dump(self._sheets, staging_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(staging_file_path, cache_file_path)
+        except OSError as error:
+            warnings.warn("Could not write annotations cache '{}': {}".format(cache_file_path, error))
+            if staging_file_path != None and os.path.exists(staging_file_path):
+                os.remove(staging_file_path)
@@ -1,6 +1,6 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
-import os, csv
+import os, csv, pickle, shutil, tempfile, weakref
 import dateutil.parser
 import numpy as np
 import pandas as pd
@@ -9,15 +9,24 @@ import dateutil, datetime
 import warnings
 
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
 
 from .settings import ErrorAnnotatedDataFilePaths
+from .key_index import KeyIndex
 
-from .utils.statistics import monotonicity_ratio
+from .utils.statistics import EXACT_MEDIAN, CategoryProfile, ColumnProfile, monotonicity_ratio, profile_category_counts, profile_numeric_values
 from .utils.sequential_outlier_detection import OutlierClassifier, SequentialOutlierDetector
 
 from .utils.constraints import ConstraintRange
-from .utils.datatype_conversion import int_to_multiples_of_2
+from .utils.datatype_conversion import convert_integer_values, int_to_multiples_of_2
 from .utils.file_writer import DirectoryCreator
+from .utils.data_file_formats import (
+    get_compression,
+    is_columnar_data_file,
+    read_columnar_data_file,
+    read_data_file_columns,
+    strip_data_file_extension,
+)
 
 from .veritas.error_catalog_generation.error_state import (
     ErrorState,
@@ -28,11 +37,51 @@ from .veritas.scorecard_distillation.scorecard_distiller import (
     DataQuality,
 )
 
-from .veritas.datatypes import ForeignKey
+from .veritas.datatypes import ErroneousRecords, ForeignKey
+from .insight.formatting.json_formatting import FrequencyFormatter
 
 from _strptime import TimeRE
 
 
+CSV_ENGINES = ['pandas', 'pyarrow']
+# Values the pandas parser reads as missing by default, plus infinities
+ARROW_NULL_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                     '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                     'n/a', 'nan', 'null', 'inf', '-inf']
+# Views PandasDatasetFile coerces columns to
+NUMERIC_COERCION = 'numeric'
+DATETIME_COERCION = 'datetime'
+ERRORS_COLUMNS = ["table_name", "attribute_name", "error_state", "probability", "num_affected", "example_affected_value"]
+ERRORS_DTYPES = {"table_name": object, "attribute_name": object, "error_state": object, "probability": "float64",
+                 "num_affected": "int64", "example_affected_value": object}
+
+
+def replace_infinite_values(df: pd.DataFrame, columns: typing.Iterable[str] | None = None,
+                            with_value = pd.NA) -> None:
+    """
+    Replace ±inf with a finite placeholder (default: missing).
+    Restrict to numeric columns by default.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    # Only columns holding ±inf are rewritten, the others keep their memory, which is
+    # mapped from disk for a cached table
+    for column_name in columns:
+        if df[column_name].isin([np.inf, -np.inf]).any():
+            df[column_name] = df[column_name].replace([np.inf, -np.inf], with_value)
+
+
+def parse_columnar_dates(df: pd.DataFrame, column_names: list) -> None:
+    # Date columns of columnar files are usually typed already, strings are parsed if they can be
+    for column_name in column_names:
+        if pd.api.types.is_datetime64_any_dtype(df[column_name]):
+            continue
+        try:
+            df[column_name] = pd.to_datetime(df[column_name])
+        except (ValueError, TypeError):
+            pass
+
+
 class Dataset:
 
     def __init__(self):
@@ -43,15 +92,26 @@ class Dataset:
         for dataset_file_name, dataset_file in self._dataset_files.items():
             yield dataset_file_name, dataset_file
 
-    def add_dataset_file(self, dataset_file_path, delimiter, dataframe_type='Pandas'):
+    def add_dataset_file(self, dataset_file_path, delimiter, dataframe_type='Pandas', read_plan=None, csv_engine='pandas', table_cache=None):
+        dataset_file = Dataset.read_dataset_file(dataset_file_path, delimiter, dataframe_type, read_plan, csv_engine, table_cache)
+        self.insert_dataset_file(dataset_file_path, dataset_file)
+
+    @staticmethod
+    def read_dataset_file(dataset_file_path, delimiter, dataframe_type='Pandas', read_plan=None, csv_engine='pandas', table_cache=None):
         if dataframe_type == "Pandas":
-            dataset_file = PandasDatasetFile(dataset_file_path, delimiter)
+            dataset_file = PandasDatasetFile(dataset_file_path, delimiter, read_plan, csv_engine, table_cache)
         else:
             raise TypeError("Dataframe type not recognized")
+        return dataset_file
 
+    def insert_dataset_file(self, dataset_file_path, dataset_file):
+        self._dataset_files[Dataset.get_dataset_file_name(dataset_file_path)] = dataset_file
+
+    @staticmethod
+    def get_dataset_file_name(dataset_file_path):
         file_name = os.path.basename(dataset_file_path)
-        file_name_no_ext = os.path.splitext(file_name)[0]
-        self._dataset_files[file_name_no_ext] = dataset_file
+        file_name_no_ext = strip_data_file_extension(file_name)
+        return file_name_no_ext
 
     def get_dataset_file_names(self):
         table_names = self._dataset_files.keys()
@@ -62,6 +122,13 @@ class Dataset:
         dataset_file = self._dataset_files[file_name]
         return dataset_file
 
+    def pin_dataset_file(self, file_name):
+        # Every table stays in memory, nothing to pin
+        pass
+
+    def unpin_dataset_file(self, file_name):
+        pass
+
     def print_dataset(self, specified_output_dir: str = None):
         if specified_output_dir == None:
             output_data_dir = (
@@ -74,6 +141,104 @@ class Dataset:
             dataset_file.print_table(output_data_dir)
 
 
+class LazyDataset(Dataset):
+    """
+        Reads each dataset file on its first get_dataset_file call and keeps the loaded
+        tables under a memory ceiling (bytes, None for no limit). When the ceiling is
+        exceeded the least recently used tables are evicted: unmodified tables are dropped
+        and read again on their next access, modified tables are pickled to a spill directory.
+        Pinned tables, such as the tables of a foreign key group, are never evicted.
+    """
+
+    def __init__(self, memory_ceiling=None, spill_directory_path=None):
+        super().__init__()
+        self._memory_ceiling = memory_ceiling
+        self._spill_directory_path = spill_directory_path
+        self._loaded_dataset_files = OrderedDict()
+        self._loaded_memory = {}
+        self._spilled_dataset_file_paths = {}
+        self._pin_counts = Counter()
+
+    @property
+    def dataset_files(self):
+        for dataset_file_name in list(self._dataset_files.keys()):
+            yield dataset_file_name, self.get_dataset_file(dataset_file_name)
+
+    @property
+    def loaded_dataset_file_names(self):
+        return list(self._loaded_dataset_files.keys())
+
+    @property
+    def memory_in_use(self):
+        return sum(self._loaded_memory.values())
+
+    def add_dataset_file(self, dataset_file_path, delimiter, dataframe_type='Pandas', read_plan=None, csv_engine='pandas', table_cache=None):
+        # Only the read arguments are kept, the file is read on first access
+        dataset_file_name = Dataset.get_dataset_file_name(dataset_file_path)
+        self._dataset_files[dataset_file_name] = (dataset_file_path, delimiter, dataframe_type, read_plan, csv_engine, table_cache)
+
+    def insert_dataset_file(self, dataset_file_path, dataset_file):
+        raise TypeError("Tables of a lazy dataset are read from their file, use add_dataset_file")
+
+    def get_dataset_file(self, file_name):
+        assert file_name in self._dataset_files.keys()
+        if file_name in self._loaded_dataset_files:
+            self._loaded_dataset_files.move_to_end(file_name)
+            return self._loaded_dataset_files[file_name]
+
+        if file_name in self._spilled_dataset_file_paths:
+            spill_file_path = self._spilled_dataset_file_paths.pop(file_name)
+            with open(spill_file_path, 'rb') as spill_file:
+                dataset_file = pickle.load(spill_file)
+            os.remove(spill_file_path)
+        else:
+            dataset_file = Dataset.read_dataset_file(*self._dataset_files[file_name])
+
+        self._loaded_dataset_files[file_name] = dataset_file
+        self._loaded_memory[file_name] = dataset_file.memory_usage
+        self._enforce_memory_ceiling()
+        return dataset_file
+
+    def pin_dataset_file(self, file_name):
+        self._pin_counts[file_name] += 1
+
+    def unpin_dataset_file(self, file_name):
+        self._pin_counts[file_name] -= 1
+        if self._pin_counts[file_name] <= 0:
+            del self._pin_counts[file_name]
+            self._enforce_memory_ceiling()
+
+    def _enforce_memory_ceiling(self):
+        if self._memory_ceiling == None:
+            return
+        # Tables grow as they are used, with coerced views, key indices and error rows. A table
+        # pinned by a running worker keeps its last measure until it is released
+        for file_name, dataset_file in self._loaded_dataset_files.items():
+            if self._pin_counts[file_name] == 0:
+                self._loaded_memory[file_name] = dataset_file.memory_usage
+        # The most recently used table is the one being handed out and is never evicted
+        eviction_candidates = [file_name for file_name in list(self._loaded_dataset_files.keys())[:-1]
+                               if self._pin_counts[file_name] == 0]
+        for file_name in eviction_candidates:
+            if self.memory_in_use <= self._memory_ceiling:
+                break
+            self._evict_dataset_file(file_name)
+
+    def _evict_dataset_file(self, file_name):
+        dataset_file = self._loaded_dataset_files.pop(file_name)
+        del self._loaded_memory[file_name]
+        if not dataset_file.modified:
+            return
+
+        if self._spill_directory_path == None:
+            self._spill_directory_path = tempfile.mkdtemp(prefix='dataset_spill_')
+            weakref.finalize(self, shutil.rmtree, self._spill_directory_path, True)
+        spill_file_path = os.path.join(self._spill_directory_path, file_name + '.pkl')
+        with open(spill_file_path, 'wb') as spill_file:
+            pickle.dump(dataset_file, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled_dataset_file_paths[file_name] = spill_file_path
+
+
 class DatasetFile(ABC):
 
     @property
@@ -81,6 +246,46 @@ class DatasetFile(ABC):
     def dataframe_library(self):
         pass
 
+    @abstractmethod
+    def get_records_outside_std_dev(
+        self, attribute_name: str, lower_std_dev: ConstraintRange, higher_std_dev: ConstraintRange
+    ) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def get_records_outside_numerical_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def get_records_outside_date_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def get_records_outside_format_constraint(self, attribute_name: str, format_regex: str) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def get_records_where_attribute_values_equal(self, attribute_name: str, values: list) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def get_records_outside_frequency_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> tuple[ErroneousRecords | None, int]:
+        pass
+
+    @abstractmethod
+    def get_records_with_duplicate_values(self, attribute_name: str) -> ErroneousRecords | None:
+        pass
+
+    @abstractmethod
+    def identify_sequential_outlier_records(self, attribute_name: str) -> ErroneousRecords | None:
+        pass
+
     @abstractmethod
     def get_rows_outside_numerical_constraint(
         self, attribute_name: str, constraint_range: ConstraintRange
@@ -119,6 +324,10 @@ class DatasetFile(ABC):
     def get_list_of_values(self, attribute_name: str) -> list:
         pass
 
+    @abstractmethod
+    def get_key_index(self, attribute_name: str) -> KeyIndex:
+        pass
+
     @abstractmethod
     def identify_sequential_outliers(self, attribute_name: str) -> typing.Any:
         pass
@@ -147,6 +356,10 @@ class DatasetFile(ABC):
     def median(self, column_name: str) -> float:
         pass
 
+    @abstractmethod
+    def median_mode(self, column_name: str) -> str:
+        pass
+
     @abstractmethod
     def skewness(self, column_name: str) -> float:
         pass
@@ -155,6 +368,14 @@ class DatasetFile(ABC):
     def kurtosis(self, column_name: str) -> float:
         pass
 
+    @abstractmethod
+    def profile(self, column_name: str) -> ColumnProfile:
+        pass
+
+    @abstractmethod
+    def category_profile(self, column_name: str) -> CategoryProfile:
+        pass
+
     @abstractmethod
     def delta(self, column_name: str, drop_first_row: bool = True) -> typing.Any:
         pass
@@ -178,26 +399,21 @@ class DatasetFile(ABC):
 
 class PandasDatasetFile(DatasetFile):
 
-    def __init__(self, dataset_file_path, delimiter):
+    def __init__(self, dataset_file_path, delimiter, read_plan=None, csv_engine='pandas', table_cache=None):
         self._table_name = os.path.basename(dataset_file_path)
-        self._df = pd.read_csv(dataset_file_path, 
-                               delimiter=delimiter, 
-                               na_values=['inf', '-inf'])
+        self._df = PandasDatasetFile._read_cached_dataframe(dataset_file_path, delimiter, read_plan, csv_engine, table_cache)
+        # Numeric and datetime views of columns, coerced once and shared by statistics and rules
+        self._coerced_columns = {}
+        # Key indices of columns, built once and shared by the uniqueness and reference checks
+        self._key_indices = {}
         self._replace_infinite() 
         self._data_order = self._df.columns
         self._missing_records = 0.0
+        self._modified = False
         self._df["error_state"] = 0b0
         self._df["probability_error"] = 0.0
-        self._errors = pd.DataFrame(
-            columns=[
-                "table_name",
-                "attribute_name",
-                "error_state",
-                "probability",
-                "num_affected",
-                "example_affected_value",
-            ]
-        )
+        # Appended to once per error found, made into a DataFrame when the table is printed
+        self._error_rows = {column_name: [] for column_name in ERRORS_COLUMNS}
 
 
 
@@ -213,6 +429,45 @@ class PandasDatasetFile(DatasetFile):
     def dataframe(self) -> pd.DataFrame:
         return self._df
 
+    @property
+    def modified(self) -> bool:
+        # Set once errors, missing records or keys have been written to the table
+        return self._modified
+
+    @property
+    def errors(self) -> pd.DataFrame:
+        # Built in one step, example values of every type share an object column
+        return pd.DataFrame({column_name: pd.Series(self._error_rows[column_name], dtype=ERRORS_DTYPES[column_name])
+                             for column_name in ERRORS_COLUMNS}, columns=ERRORS_COLUMNS)
+
+    @property
+    def memory_usage(self) -> int:
+        coerced_columns_memory = 0
+        for (column_name, _), (coerced_column, valid_mask) in self._coerced_columns.items():
+            coerced_columns_memory += valid_mask.nbytes
+            # A view that is the column itself is already counted with the table
+            if not self._shares_column_memory(coerced_column, column_name):
+                coerced_columns_memory += coerced_column.memory_usage(deep=True)
+        key_indices_memory = sum(key_index.nbytes for key_index in self._key_indices.values())
+        return int(self._df.memory_usage(deep=True).sum() + coerced_columns_memory + key_indices_memory)
+
+    def _shares_column_memory(self, coerced_column: pd.Series, column_name: str) -> bool:
+        if column_name not in self._df.columns:
+            return False
+        column = self._df[column_name]
+        if coerced_column is column:
+            return True
+        if not isinstance(coerced_column.dtype, np.dtype) or not isinstance(column.dtype, np.dtype):
+            return False
+        return np.may_share_memory(coerced_column.to_numpy(), column.to_numpy())
+
+    def __getstate__(self):
+        # Coerced views and key indices are derived from the table and are built again after a spill
+        state = self.__dict__.copy()
+        state['_coerced_columns'] = {}
+        state['_key_indices'] = {}
+        return state
+
     @property
     def data_quality(self) -> DataQuality:
         record_count = len(self._df)
@@ -232,34 +487,153 @@ class PandasDatasetFile(DatasetFile):
         )
 
 
-    def _replace_infinite(self, columns: typing.Iterable[str] | None = None,
-                          with_value = pd.NA) -> None:
+    @staticmethod
+    def _read_cached_dataframe(dataset_file_path, delimiter, read_plan=None, csv_engine='pandas', table_cache=None) -> pd.DataFrame:
+        if table_cache == None:
+            return PandasDatasetFile._read_dataframe(dataset_file_path, delimiter, read_plan, csv_engine)
+
+        cache_key = table_cache.get_cache_key(dataset_file_path, {'delimiter': delimiter, 'read_plan': read_plan, 'csv_engine': csv_engine})
+        df = table_cache.load(cache_key)
+        if df is None:
+            df = PandasDatasetFile._read_dataframe(dataset_file_path, delimiter, read_plan, csv_engine)
+            table_cache.store(cache_key, df)
+        return df
+
+    @staticmethod
+    def _read_dataframe(dataset_file_path, delimiter, read_plan=None, csv_engine='pandas') -> pd.DataFrame:
+        if csv_engine not in CSV_ENGINES:
+            raise ValueError("CSV engine not recognized: {}".format(csv_engine))
+
+        if is_columnar_data_file(dataset_file_path):
+            return PandasDatasetFile._read_columnar_dataframe(dataset_file_path, read_plan)
+
+        # Compressed files are decompressed by the parsers, which infer the compression from the extension
+        if read_plan != None and not read_plan.is_empty:
+            header_columns = read_data_file_columns(dataset_file_path, delimiter)
+            planned_read_csv_arguments = read_plan.get_read_csv_arguments(header_columns)
+            try:
+                if csv_engine == 'pyarrow':
+                    df = PandasDatasetFile._read_csv_with_arrow(dataset_file_path, delimiter, **planned_read_csv_arguments)
+                else:
+                    df = pd.read_csv(dataset_file_path,
+                                     delimiter=delimiter,
+                                     na_values=['inf', '-inf'],
+                                     **planned_read_csv_arguments)
+                read_plan.normalize_dtypes(df)
+                return df
+            except (ValueError, TypeError) as error:
+                warnings.warn("Typed read of '{}' failed, falling back to inferred dtypes: {}".format(dataset_file_path, error))
+
+        if csv_engine == 'pyarrow':
+            return PandasDatasetFile._read_csv_with_arrow(dataset_file_path, delimiter)
+        return pd.read_csv(dataset_file_path,
+                           delimiter=delimiter,
+                           na_values=['inf', '-inf'])
+
+    @staticmethod
+    def _read_columnar_dataframe(dataset_file_path, read_plan=None) -> pd.DataFrame:
+        # Columnar files carry their own types, the read plan only projects the
+        # columns to read and the dates to parse
+        if read_plan == None or read_plan.is_empty:
+            return read_columnar_data_file(dataset_file_path)
+
+        planned_read_csv_arguments = read_plan.get_read_csv_arguments(read_data_file_columns(dataset_file_path))
+        df = read_columnar_data_file(dataset_file_path, planned_read_csv_arguments['usecols'])
+        parse_columnar_dates(df, planned_read_csv_arguments['parse_dates'])
+        return df
+
+    @staticmethod
+    def _read_csv_with_arrow(dataset_file_path, delimiter, usecols=None, dtype=None, parse_dates=()) -> pd.DataFrame:
         """
-        Replace ±inf with a finite placeholder (default: missing).
-        Restrict to numeric columns by default.
+        Multithreaded Arrow CSV reader. Columns come back with the dtypes the pandas
+        parser would have produced, except strings which stay Arrow backed.
         """
-        if columns is None:
-            columns = self._df.select_dtypes(include=[np.number]).columns
-        # Only operate on columns present (guard against empty selection)
-        if len(columns) == 0:
-            return
-        self._df[columns] = self._df[columns].replace([np.inf, -np.inf], with_value)
-
-    def _add_new_errors_row(self, attribute_name: str, erroneous_records_df: pd.DataFrame, error_state: ErrorState, logging_column_name: str):
-        new_errors_row = pd.DataFrame(
-            {
-                "table_name": self.table_name,
-                "attribute_name": logging_column_name,
-                "error_state": error_state.description,
-                "probability": error_state.probability_for_state,
-                "num_affected": len(erroneous_records_df.index),
-                "example_affected_value": erroneous_records_df[attribute_name].iloc[0],
-            },
-            index=[0],
-        )
-        with warnings.catch_warnings(action="ignore"):
-            self._errors = pd.concat([self._errors, new_errors_row], ignore_index=True)
-   
+        import pyarrow as pa
+        from pyarrow import csv as arrow_csv
+
+        # Integers are left to inference, Arrow rejects integral floats such as '3.0' that pandas accepts
+        arrow_types = {'float64': pa.float64(), 'str': pa.string(), 'category': pa.string()}
+        column_types = {}
+        if dtype != None:
+            column_types = {column_name: arrow_types[column_dtype] for column_name, column_dtype in dtype.items()
+                            if column_dtype in arrow_types}
+
+        def read_table(column_types):
+            return arrow_csv.read_csv(
+                dataset_file_path,
+                parse_options=arrow_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                convert_options=arrow_csv.ConvertOptions(column_types=column_types,
+                                                         null_values=ARROW_NULL_VALUES,
+                                                         strings_can_be_null=True,
+                                                         include_columns=usecols))
+
+        table = read_table(column_types)
+        # Arrow infers ISO dates on its own, the pandas parser only parses the dates it is asked to
+        unrequested_date_columns = [column.name for column in table.schema 
+                                    if pa.types.is_temporal(column.type) and column.name not in parse_dates]
+        if len(unrequested_date_columns) != 0:
+            column_types.update({column_name: pa.string() for column_name in unrequested_date_columns})
+            table = read_table(column_types)
+
+        arrow_string_dtypes = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+        df = table.to_pandas(types_mapper=arrow_string_dtypes.get)
+
+        for column in table.schema:
+            if pa.types.is_null(column.type):
+                df[column.name] = df[column.name].astype('float64')
+            elif column.name in parse_dates:
+                try:
+                    df[column.name] = pd.to_datetime(df[column.name].astype(object))
+                except (ValueError, TypeError):
+                    pass
+            elif dtype != None and dtype.get(column.name) in ['Int64', 'category']:
+                df[column.name] = df[column.name].astype(dtype[column.name])
+
+        return df
+
+    def _coerced_column(self, column_name: str, coercion: str) -> tuple[pd.Series, np.ndarray]:
+        cache_key = (column_name, coercion)
+        if cache_key not in self._coerced_columns:
+            column = self._df[column_name]
+            if coercion == NUMERIC_COERCION:
+                if not pd.api.types.is_numeric_dtype(column):
+                    column = pd.to_numeric(column, errors='coerce')
+            else:
+                column = pd.to_datetime(column, errors='coerce')
+            self._coerced_columns[cache_key] = (column, column.notna().to_numpy())
+        return self._coerced_columns[cache_key]
+
+    def _numeric_column(self, column_name: str) -> pd.Series:
+        # A numeric column is its own view, others are coerced with unparsable values missing
+        return self._coerced_column(column_name, NUMERIC_COERCION)[0]
+
+    def _numeric_mask(self, column_name: str) -> np.ndarray:
+        return self._coerced_column(column_name, NUMERIC_COERCION)[1]
+
+    def _datetime_column(self, column_name: str) -> pd.Series:
+        return self._coerced_column(column_name, DATETIME_COERCION)[0]
+
+    def _invalidate_column_caches(self, column_name: str) -> None:
+        for coercion in [NUMERIC_COERCION, DATETIME_COERCION]:
+            self._coerced_columns.pop((column_name, coercion), None)
+        self._key_indices.pop(column_name, None)
+
+    def _replace_infinite(self, columns: typing.Iterable[str] | None = None,
+                          with_value = pd.NA) -> None:
+        replace_infinite_values(self._df, columns, with_value)
+        if columns == None:
+            self._coerced_columns.clear()
+            self._key_indices.clear()
+        for column_name in columns or []:
+            self._invalidate_column_caches(column_name)
+
+    def _add_new_errors_row(self, num_affected: int, example_affected_value, error_state: ErrorState, logging_column_name: str):
+        new_errors_row = [self.table_name, logging_column_name, error_state.description,
+                          error_state.probability_for_state, num_affected, example_affected_value]
+        for column_name, value in zip(ERRORS_COLUMNS, new_errors_row):
+            self._error_rows[column_name].append(value)
+        self._modified = True
+
     """
         TODO: Check efficiency for up front probability assignment for atomic error probabilities versus delayed
     """
@@ -278,7 +652,9 @@ class PandasDatasetFile(DatasetFile):
             missing_records_df[result_column_name]
         )
         self._df.loc[affected_records_mask, "error_state"] |= error_state.error_state
-        self._add_new_errors_row(result_column_name, missing_records_df, error_state, logging_column_name)
+        self._invalidate_column_caches("error_state")
+        self._add_new_errors_row(len(missing_records_df.index), missing_records_df[result_column_name].iloc[0],
+                                 error_state, logging_column_name)
         if error_state.probability_for_state == 0:
             return
         probability_lower_than_new_mask = affected_records_mask & (
@@ -287,18 +663,20 @@ class PandasDatasetFile(DatasetFile):
         self._df.loc[probability_lower_than_new_mask, "probability_error"] = (
             error_state.probability_for_state
         )
+        self._invalidate_column_caches("probability_error")
 
     def change_record_probability_lookup_index(
         self,
         attribute_name: str,
-        erroneous_records_df: pd.DataFrame,
+        erroneous_records: ErroneousRecords,
         error_state: ErrorState,
     ) -> None:
-        if erroneous_records_df is None:
+        if erroneous_records is None:
             return
-        affected_records_mask = self._df.index.isin(erroneous_records_df.index)
+        affected_records_mask = erroneous_records.mask
         self._df.loc[affected_records_mask, "error_state"] |= error_state.error_state
-        self._add_new_errors_row(attribute_name, erroneous_records_df, error_state, attribute_name)
+        self._invalidate_column_caches("error_state")
+        self._add_new_errors_row(erroneous_records.num_records, erroneous_records.example_value, error_state, attribute_name)
         if error_state.probability_for_state == 0:
             return
         probability_lower_than_new_mask = affected_records_mask & (
@@ -307,9 +685,11 @@ class PandasDatasetFile(DatasetFile):
         self._df.loc[probability_lower_than_new_mask, "probability_error"] = (
             error_state.probability_for_state
         )
+        self._invalidate_column_caches("probability_error")
 
     def add_missing(self, amount_missing: float) -> None:
         self._missing_records += amount_missing
+        self._modified = True
 
     @property
     def missing(self) -> float:
@@ -330,72 +710,87 @@ class PandasDatasetFile(DatasetFile):
     def get_dataset_table_name(self) -> str:
         return os.path.basename(self._table_name)
 
+    def _get_erroneous_records(self, values: pd.Series, values_mask, rows_mask=None) -> ErroneousRecords | None:
+        # values_mask is over values, the values of the rows rows_mask sets or of every row
+        values_mask = np.asarray(values_mask, dtype=bool)
+        num_records = int(np.count_nonzero(values_mask))
+        if num_records == 0:
+            return None
+        example_value = values.iloc[int(np.argmax(values_mask))]
+        if rows_mask is None:
+            return ErroneousRecords(values_mask, num_records, example_value)
+        mask = np.zeros(len(self._df.index), dtype=bool)
+        mask[np.asarray(rows_mask, dtype=bool)] = values_mask
+        return ErroneousRecords(mask, num_records, example_value)
+
+    def _get_rows(self, erroneous_records: ErroneousRecords | None) -> pd.DataFrame | None:
+        if erroneous_records is None:
+            return None
+        return self._df[erroneous_records.mask]
+
+    def get_records_outside_std_dev(
+        self,
+        attribute_name: str,
+        lower_std_dev: ConstraintRange,
+        higher_std_dev: ConstraintRange,
+    ) -> ErroneousRecords | None:
+        numeric_mask = self._numeric_mask(attribute_name)
+        values = self._df[attribute_name][numeric_mask]
+        outside_mask = (
+            ((values >= lower_std_dev.lower_bound) & (values < lower_std_dev.upper_bound))
+            | ((values > higher_std_dev.lower_bound) & (values <= higher_std_dev.upper_bound))
+        )
+        return self._get_erroneous_records(values, outside_mask, numeric_mask)
+
     def get_values_outside_std_dev(
         self,
         attribute_name: str,
         lower_std_dev: ConstraintRange,
         higher_std_dev: ConstraintRange,
     ):
-        numeric_mask = pd.to_numeric(self._df[attribute_name], errors="coerce").isna()
-        df_numeric = self._df[numeric_mask == False]
-        df_outside_numerical_constraint = df_numeric[
-            (
-                (df_numeric[attribute_name] >= lower_std_dev.lower_bound)
-                & (df_numeric[attribute_name] < lower_std_dev.upper_bound)
-            )
-            | (
-                (df_numeric[attribute_name] > higher_std_dev.lower_bound)
-                & (df_numeric[attribute_name] <= higher_std_dev.upper_bound)
-            )
-        ]
-        if len(df_outside_numerical_constraint.index) == 0:
-            return None
+        return self._get_rows(self.get_records_outside_std_dev(attribute_name, lower_std_dev, higher_std_dev))
 
-        return df_outside_numerical_constraint
+    def get_records_outside_numerical_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> ErroneousRecords | None:
+        numeric_mask = self._numeric_mask(attribute_name)
+        values = self._df[attribute_name][numeric_mask]
+        outside_mask = (values < constraint_range.lower_bound) | (values > constraint_range.upper_bound)
+        return self._get_erroneous_records(values, outside_mask, numeric_mask)
 
     def get_rows_outside_numerical_constraint(
         self, attribute_name: str, constraint_range: ConstraintRange
     ):
-        numeric_mask = pd.to_numeric(self._df[attribute_name], errors="coerce").isna()
-        df_numeric = self._df[numeric_mask == False]
-        df_outside_numerical_constraint = df_numeric[
-            (df_numeric[attribute_name] < constraint_range.lower_bound)
-            | (df_numeric[attribute_name] > constraint_range.upper_bound)
-        ]
-        if len(df_outside_numerical_constraint.index) == 0:
-            return None
+        return self._get_rows(self.get_records_outside_numerical_constraint(attribute_name, constraint_range))
 
-        return df_outside_numerical_constraint
+    def get_records_outside_date_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> ErroneousRecords | None:
+        # The example value is the parsed date
+        not_null_mask = self._df[attribute_name].notnull().to_numpy()
+        values = self._datetime_column(attribute_name)[not_null_mask]
+        outside_mask = (values.dt.year < constraint_range.lower_bound) | (values.dt.year > constraint_range.upper_bound)
+        return self._get_erroneous_records(values, outside_mask, not_null_mask)
 
     def get_rows_outside_date_constraint(
         self, attribute_name: str, constraint_range: ConstraintRange
     ):
-        df_null_excluded = self._df[self._df[attribute_name].notnull()]
-        df_null_excluded[attribute_name] = pd.to_datetime(
-            df_null_excluded[attribute_name], errors="coerce"
-        )
-        df_outside_date_constraint = df_null_excluded[
-            (df_null_excluded[attribute_name].dt.year < constraint_range.lower_bound)
-            | (df_null_excluded[attribute_name].dt.year > constraint_range.upper_bound)
-        ]
-        if len(df_outside_date_constraint.index) == 0:
-            return None
+        return self._get_rows(self.get_records_outside_date_constraint(attribute_name, constraint_range))
 
-        return df_outside_date_constraint
-    
-    def get_rows_outside_format_constraint(
+    def get_records_outside_format_constraint(
         self, attribute_name: str, format_regex: str
-    ):
-        df_null_excluded = self._df[self._df[attribute_name].notnull()]
-        invalid_rows = df_null_excluded[attribute_name].apply(
+    ) -> ErroneousRecords | None:
+        not_null_mask = self._df[attribute_name].notnull().to_numpy()
+        values = self._df[attribute_name][not_null_mask]
+        invalid_mask = values.apply(
             PandasDatasetFile._is_date_time_format_invalid, args=[format_regex]
         )
-        df_outside_format_constraint = df_null_excluded[invalid_rows]
-
-        if len(df_outside_format_constraint.index) == 0:
-            return None
+        return self._get_erroneous_records(values, invalid_mask, not_null_mask)
 
-        return df_outside_format_constraint
+    def get_rows_outside_format_constraint(
+        self, attribute_name: str, format_regex: str
+    ):
+        return self._get_rows(self.get_records_outside_format_constraint(attribute_name, format_regex))
 
     @staticmethod
     def _is_date_time_format_invalid(row, format_regex):
@@ -405,64 +800,90 @@ class PandasDatasetFile(DatasetFile):
         else:
             return True
 
+    def get_records_where_attribute_values_equal(
+        self, attribute_name: str, values: list
+    ) -> ErroneousRecords | None:
+        column = self._df[attribute_name]
+        return self._get_erroneous_records(column, column.isin(values))
+
+    def get_records_outside_frequency_constraint(
+        self, attribute_name: str, constraint_range: ConstraintRange
+    ) -> tuple[ErroneousRecords | None, int]:
+        # The records whose value's frequency percent is outside the range, and how many such values there are.
+        # Values are counted as the LLMD's frequency list counts them, each distinct value is tested once.
+        column = self._df[attribute_name]
+        codes, values = pd.factorize(column)
+        category_codes, categories = pd.factorize(convert_integer_values(values), use_na_sentinel=False)
+        # Missing values keep the code -1
+        codes = np.append(category_codes, -1)[codes]
+        counts = np.bincount(codes + 1, minlength=len(categories) + 1)[1:]
+        frequency_percents = np.array([FrequencyFormatter.get_frequency_percent(count, self.num_rows) for count in counts.tolist()])
+        outside_categories = ~((constraint_range.lower_bound <= frequency_percents) & (frequency_percents <= constraint_range.upper_bound))
+        outside_mask = np.append(outside_categories, False)[codes]
+        return self._get_erroneous_records(column, outside_mask), int(np.count_nonzero(outside_categories))
+
     def get_rows_where_attribute_values_equal(
         self, attribute_name: str, values: list
     ) -> pd.DataFrame:
-        df_where_attribute_equals = self._df[self._df[attribute_name].isin(values)]
-        if len(df_where_attribute_equals.index) == 0:
-            return None        
-        return df_where_attribute_equals
+        return self._get_rows(self.get_records_where_attribute_values_equal(attribute_name, values))
 
-    def get_rows_with_duplicate_values(self, attribute_name: str):
-        df_null_excluded = self._df[self._df[attribute_name].notnull()]
-        df_duplicates = df_null_excluded[
-            df_null_excluded.duplicated(subset=[attribute_name]) == True
-        ]
-        if len(df_duplicates.index) == 0:
-            return None
+    def get_records_with_duplicate_values(self, attribute_name: str) -> ErroneousRecords | None:
+        key_index = self.get_key_index(attribute_name)
+        not_null_mask = key_index.valid_mask
+        values = self._df[attribute_name][not_null_mask]
+        return self._get_erroneous_records(values, key_index.duplicated_mask[not_null_mask], not_null_mask)
 
-        return df_duplicates
+    def get_rows_with_duplicate_values(self, attribute_name: str):
+        return self._get_rows(self.get_records_with_duplicate_values(attribute_name))
 
     def get_rows_with_missing_values_from_compared(
         self, 
         compared_table: DatasetFile, 
         foreign_key: ForeignKey
     ):
-        attribute_name = foreign_key.key_name
-        compared_table_attribute_name = foreign_key.primary_key_attribute_name
-        df_null_excluded = self._df[self._df[attribute_name].notnull()]
-        values_from_df = set(df_null_excluded[attribute_name].unique().tolist())
-        values_from_compared_table = set(
-            compared_table.get_list_of_values(compared_table_attribute_name)
-        )
-        missing_values = values_from_df.difference(values_from_compared_table)
-        df_missing = self._df[self._df[attribute_name].isin(missing_values)]
-        if len(df_missing.index) == 0:
+        key_index = self.get_key_index(foreign_key.key_name)
+        compared_key_index = compared_table.get_key_index(foreign_key.primary_key_attribute_name)
+        missing_mask = key_index.get_missing_mask(compared_key_index)
+        if not missing_mask.any():
             return None
-        return df_missing
+        return self._df[missing_mask]
 
     def get_list_of_values(self, attribute_name: str) -> list:
         attribute_list = self._df[attribute_name].unique().tolist()
         return attribute_list
+
+    def get_key_index(self, attribute_name: str) -> KeyIndex:
+        if attribute_name not in self._key_indices:
+            self._key_indices[attribute_name] = KeyIndex(self._df[attribute_name])
+        return self._key_indices[attribute_name]
     
-    def identify_sequential_outliers(self, attribute_name: str) -> pd.Series:
+    def identify_sequential_outlier_records(self, attribute_name: str) -> ErroneousRecords | None:
         outlier_detector = SequentialOutlierDetector()
         nan_rows = self._df[self._df[attribute_name].isna()]
         outlier_detector.add_NaNs(nan_rows.index)
         outlier_classifier = OutlierClassifier()
         clusters = outlier_classifier.KDE(self, attribute_name)
         outlier_detector.add_cluster_labels(clusters)
-        sequential_outliers_mask= outlier_detector.detect_outliers()
-        outliers_df = self._df[sequential_outliers_mask]
-        if len(outliers_df.index) == 0: 
-            return None
-        return outliers_df
+        sequential_outliers_mask = outlier_detector.detect_outliers()
+        # Aligned on the table's index, as indexing the table with the mask would
+        sequential_outliers_mask = sequential_outliers_mask.reindex(self._df.index, fill_value=False)
+        return self._get_erroneous_records(self._df[attribute_name], sequential_outliers_mask)
+
+    def identify_sequential_outliers(self, attribute_name: str) -> pd.Series:
+        return self._get_rows(self.identify_sequential_outlier_records(attribute_name))
 
     def count(self, column_name: str) -> int:
         return self._df[column_name].count()
 
     def value_counts(self, column_name: str) -> pd.Series:
-        return self._df[column_name].value_counts()
+        column = self._df[column_name]
+        if isinstance(column.dtype, pd.StringDtype):
+            # Count in order of first appearance like object columns so ties sort the same way
+            codes, uniques = pd.factorize(column)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            value_counts = pd.Series(counts, index=pd.Index(uniques.astype(object), name=column_name), name='count')
+            return value_counts.sort_values(ascending=False)
+        return column.value_counts()
 
     def min(self, column_name: str) -> float:
         return self._df[column_name].min()
@@ -471,19 +892,44 @@ class PandasDatasetFile(DatasetFile):
         return self._df[column_name].max()
 
     def std_dev(self, column_name: str) -> float:
-        return pd.to_numeric(self._df[column_name], errors='coerce').std()
+        return self._numeric_column(column_name).std()
 
     def mean(self, column_name: str) -> float:
-        return pd.to_numeric(self._df[column_name], errors='coerce').mean()
+        return self._numeric_column(column_name).mean()
 
     def median(self, column_name: str) -> float:
-        return pd.to_numeric(self._df[column_name], errors='coerce').median()
+        return self._numeric_column(column_name).median()
+
+    def median_mode(self, column_name: str) -> str:
+        # The whole column is in memory
+        return EXACT_MEDIAN
+
+    def category_profile(self, column_name: str) -> CategoryProfile:
+        return profile_category_counts(self.value_counts(column_name))
 
     def skewness(self, column_name: str) -> float:
-        return pd.to_numeric(self._df[column_name], errors='coerce').skew()
+        return self._numeric_column(column_name).skew()
 
     def kurtosis(self, column_name: str) -> float:
-        return pd.to_numeric(self._df[column_name], errors='coerce').kurt()
+        return self._numeric_column(column_name).kurt()
+
+    def profile(self, column_name: str) -> ColumnProfile:
+        # The column is coerced once and every statistic comes from the same pass
+        column = self._df[column_name]
+        numeric_column = self._numeric_column(column_name)
+        if isinstance(numeric_column.dtype, np.dtype) and numeric_column.dtype.kind in 'iuf':
+            column_profile = profile_numeric_values(numeric_column.to_numpy())
+            if numeric_column is column:
+                return column_profile
+            # Count, min and max are taken over the column as it is, not its numeric view
+            column_profile.count = column.count()
+            column_profile.min = column.min()
+            column_profile.max = column.max()
+            return column_profile
+
+        return ColumnProfile(count=column.count(), min=column.min(), max=column.max(),
+                             mean=numeric_column.mean(), median=numeric_column.median(), std_dev=numeric_column.std(),
+                             skewness=numeric_column.skew(), kurtosis=numeric_column.kurt())
     
     def delta(self, column_name: str, drop_first_row: bool = True) -> pd.Series:
         delta = self._df[column_name].dropna()
@@ -502,7 +948,7 @@ class PandasDatasetFile(DatasetFile):
         print(self._df[column_name])
 
     def print_table(self, output_data_dir, file_extension=".csv") -> None:
-        self._errors.to_csv(
+        self.errors.to_csv(
             os.path.join(output_data_dir, "errors.csv"),
             mode="a",
             header=not os.path.exists(os.path.join(output_data_dir, "errors.csv")),
@@ -511,12 +957,16 @@ class PandasDatasetFile(DatasetFile):
         self._df["error_state"] = self._df["error_state"].apply(
             lambda x: int_to_multiples_of_2(x, ErrorStateRegistry.HIGHEST_CURRENT_BIT)
         )
+        self._invalidate_column_caches("error_state")
 
         # Normalize extension (ensure it starts with a dot)
         ext = file_extension if file_extension.startswith('.') else '.' + file_extension
     
         # Remove duplicate extension if present in table_name
         table_name = self._table_name[:-len(ext)] if self._table_name.endswith(ext) else self._table_name
+        # Compressed and columnar tables are written out as plain delimited text
+        if get_compression(table_name) != None or is_columnar_data_file(table_name):
+            table_name = strip_data_file_extension(table_name)
     
         self._df.to_csv(
             os.path.join(output_data_dir, (table_name + file_extension)),
@@ -525,6 +975,8 @@ class PandasDatasetFile(DatasetFile):
         )
 
     def create_composite_key(self, attributes: list[str]) -> None:
+        self._modified = True
+        self._invalidate_column_caches('composite_key')
         self._df['composite_key'] = ''
         for partial_key in attributes:
             self._df['composite_key'] += '_' + self._df[partial_key].astype(str)
@@ -532,3 +984,4 @@ class PandasDatasetFile(DatasetFile):
 
     def drop_composite_key(self) -> None:
         self._df = self._df.drop(['composite_key'], axis=1)
+        self._invalidate_column_caches('composite_key')
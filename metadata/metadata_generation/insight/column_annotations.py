@@ -5,19 +5,97 @@ import pandas as pd
 from ..utils.json_cleaning import ColumnDescriptionsCleaner
 
 
+# Annotation sheet column each record slot is read from
+ANNOTATION_SHEET_COLUMNS = {'name': 'Name', 'data_quality_class': 'Data Quality Class', 'llmd_type': 'Type', 'units': 'Units',
+                            'format_function': 'Format Function', 'description': 'Description', 'manual_annotations': 'Manual Annotations'}
+
+
+class _MissingSheetColumn:
+
+    __slots__ = ('sheet_column_name',)
+
+    def __init__(self, sheet_column_name):
+        self.sheet_column_name = sheet_column_name
+
+
+class ColumnAnnotationRecord:
+    """
+        The annotations of one column as ColumnAnnotations hands them out. A cell of a
+        column the sheet does not have is a _MissingSheetColumn, read as a KeyError.
+    """
+
+    __slots__ = tuple(ANNOTATION_SHEET_COLUMNS) + ('description_exists',)
+
+    def get(self, slot_name):
+        value = getattr(self, slot_name)
+        if isinstance(value, _MissingSheetColumn):
+            raise KeyError(value.sheet_column_name)
+        return value
+
+
+class ColumnAnnotationIndex:
+    """
+        An annotations sheet compiled once into one record per row, in sheet order and
+        keyed by column name, with the descriptions already cleaned of bad characters.
+    """
+
+    def __init__(self, excel_dataset_annotations: pd.DataFrame):
+        self.__records = []
+        self.__records_by_name = {}
+
+        sheet_columns = {}
+        for slot_name, sheet_column_name in ANNOTATION_SHEET_COLUMNS.items():
+            if sheet_column_name in excel_dataset_annotations:
+                sheet_columns[slot_name] = excel_dataset_annotations[sheet_column_name].tolist()
+            else:
+                sheet_columns[slot_name] = [_MissingSheetColumn(sheet_column_name)] * len(excel_dataset_annotations.index)
+
+        column_description_cleaner = ColumnDescriptionsCleaner()
+        has_descriptions = "Descriptions" in excel_dataset_annotations
+        for row in range(len(excel_dataset_annotations.index)):
+            record = ColumnAnnotationRecord()
+            for slot_name, cells in sheet_columns.items():
+                setattr(record, slot_name, cells[row])
+            record.description_exists = self.__description_exists(record.get('description')) if has_descriptions else None
+            if not isinstance(record.description, _MissingSheetColumn):
+                record.description = column_description_cleaner.replace_bad_characters(str(record.description))
+            if isinstance(record.manual_annotations, _MissingSheetColumn) or not pd.notna(record.manual_annotations):
+                record.manual_annotations = None
+
+            self.__records.append(record)
+            if not isinstance(record.name, _MissingSheetColumn) and not pd.isna(record.name):
+                self.__records_by_name.setdefault(record.name, record)
+
+    def __len__(self):
+        return len(self.__records)
+
+    def get_record(self, column_index) -> ColumnAnnotationRecord:
+        return self.__records[column_index]
+
+    def get_record_by_name(self, column_name) -> ColumnAnnotationRecord:
+        return self.__records_by_name[column_name]
+
+    @staticmethod
+    def __description_exists(description):
+        return not (pd.isna(description) or description.strip() == "")
+
+
 class ColumnAnnotations:
 
 
     def __init__(self, column_index, excel_dataset_annotations):
-        self.__column_index = column_index
-        self.__excel_column_annotations = excel_dataset_annotations[column_index:column_index+1]
+        # A sheet that is not compiled yet is compiled for this column alone
+        if not isinstance(excel_dataset_annotations, ColumnAnnotationIndex):
+            excel_dataset_annotations = ColumnAnnotationIndex(excel_dataset_annotations[column_index:column_index+1].reset_index(drop=True))
+            column_index = 0
+        self.__record = excel_dataset_annotations.get_record(column_index)
 
     def name(self):
-        name = self.__excel_column_annotations['Name'][self.__column_index]
+        name = self.__record.get('name')
         return name
 
     def data_quality_class(self):
-        dq_class = self.__excel_column_annotations['Data Quality Class'][self.__column_index]
+        dq_class = self.__record.get('data_quality_class')
         if dq_class.startswith('?'):
             dq_class = dq_class[1:]
         if dq_class == 'date-time':
@@ -25,22 +103,22 @@ class ColumnAnnotations:
         return dq_class
 
     def llmd_type(self):
-        dq_type = self.__excel_column_annotations['Type'][self.__column_index]
+        dq_type = self.__record.get('llmd_type')
         if dq_type.startswith('?'):
             dq_type = dq_type[1:]
-        
+
         return dq_type
 
     def units(self):
-        units = self.__excel_column_annotations['Units'][self.__column_index]
-        
+        units = self.__record.get('units')
+
         if pd.isna(units):
             units = 'n/a'
 
-        return units 
-    
+        return units
+
     def format_module(self):
-        module_str = self.__excel_column_annotations['Format Function'][self.__column_index] 
+        module_str = self.__record.get('format_function')
 
         if pd.isna(module_str):
             module_str = 'n/a'
@@ -51,7 +129,7 @@ class ColumnAnnotations:
         return module_str
 
     def format_function(self):
-        func_call_str = self.__excel_column_annotations['Format Function'][self.__column_index]
+        func_call_str = self.__record.get('format_function')
 
         if pd.isna(func_call_str):
             func_call_str = 'n/a'
@@ -62,25 +140,10 @@ class ColumnAnnotations:
         return func_call_str
 
     def description(self):
-        column_description_cleaner = ColumnDescriptionsCleaner()
-        column_description = column_description_cleaner.replace_bad_characters(str(self.__excel_column_annotations['Description'][self.__column_index]))
-        return column_description 
-    
+        return self.__record.get('description')
+
     def description_exists(self):
-        if "Descriptions" not in self.__excel_column_annotations:
-            return None
-        description_exists = True
-        if pd.isna(self.__excel_column_annotations['Description'][self.__column_index]) or \
-           self.__excel_column_annotations['Description'][self.__column_index].strip() ==  "": 
-            description_exists = False
-        return description_exists
-    
+        return self.__record.description_exists
+
     def manual_annotations(self):
-        if 'Manual Annotations' not in self.__excel_column_annotations:
-            return None
-        
-        manual_annotations = self.__excel_column_annotations['Manual Annotations'][self.__column_index]
-        if not pd.notna(manual_annotations): 
-            manual_annotations = None
-
-        return manual_annotations
+        return self.__record.manual_annotations
@@ -6,18 +6,22 @@ import math
 import numpy as np
 import json
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ...settings import InsightFilePaths
 
 from ...veritas.datatypes import DataQualityClassEnum
 
 from ...insight.table_descriptions import TableDescriptionGenerator
-from ...insight.column_annotations import ColumnAnnotations
+from ...insight.column_annotations import ColumnAnnotations, ColumnAnnotationIndex
 from ...insight.formatting.json_formatting import FrequencyFormatter
 from ...insight import key_maps
 from ...insight import manual_annotations
 
 from ...utils.file_iterator import MetadataIterator
 from ...utils.file_parsing import MetadataTableParser
+from ...utils.statistics import EXACT_FREQUENCIES
+from ...utils.parallel import MemoryBudget, estimate_column_statistics_memory
 
 
 class NpEncoder(json.JSONEncoder):
@@ -37,9 +41,10 @@ class NpEncoder(json.JSONEncoder):
             return super(NpEncoder, self).default(obj)
 
 
-def create_llmd(metadata_generation_input, use_annotations=False, write_excel=True):
-    llmd_builder = LLMDBuilder(metadata_generation_input.partial_dataset_metadata, metadata_generation_input.table_descriptions)
-    for dataset_file_name, dataset_file in metadata_generation_input.dataset_files:
+def create_llmd(metadata_generation_input, use_annotations=False, write_excel=True, processes=1, memory_budget=None):
+    llmd_builder = LLMDBuilder(metadata_generation_input.partial_dataset_metadata, metadata_generation_input.table_descriptions,
+                               processes, memory_budget)
+    for dataset_file_name, dataset_file in metadata_generation_input.statistics_dataset_files:
         dataset_annotations = metadata_generation_input.get_dataset_file_annotations(dataset_file_name)
         llmd_builder.add_dataset_file_JSON(dataset_file_name, dataset_file, dataset_annotations)
     llmd_builder.add_key_info(use_annotations)
@@ -53,19 +58,24 @@ def create_llmd(metadata_generation_input, use_annotations=False, write_excel=Tr
 
 class LLMDBuilder:
 
-    def __init__(self, partial_metadata, table_descriptions):
+    def __init__(self, partial_metadata, table_descriptions, processes=1, memory_budget=None):
         project_identifier = partial_metadata['project_identifier']
         dataset_identifier = partial_metadata['identifier']
         self.__LLMD = {'name': partial_metadata['title'], 'description': partial_metadata['description'], 'modified': 'Placeholder', 'authors': 'Livewire Data Platform'}
         self.__LLMD['referenceURL'] = '/api/datasets/{}/{}/files/dictionary-{}.{}.pdf'.format(project_identifier, dataset_identifier, project_identifier, dataset_identifier)
         self.__LLMD['objects'] = []
         self.__table_description_generator = TableDescriptionGenerator(table_descriptions)
+        self.__processes = processes
+        self.__memory_budget = MemoryBudget(memory_budget)
 
     def add_dataset_file_JSON(self, dataset_file_name, dataset_file, dataset_file_annotations):      
         llmd_columns = LLMDColumns(dataset_file_annotations)
 
-        for i in range(dataset_file.num_columns):
-            llmd_columns.add_column_LLMD(dataset_file, i)
+        if self.__processes > 1 and dataset_file.num_columns > 1:
+            self.__add_columns_in_parallel(llmd_columns, dataset_file)
+        else:
+            for i in range(dataset_file.num_columns):
+                llmd_columns.add_column_LLMD(dataset_file, i)
 
         column_LLMD = llmd_columns.get_ordered_column_metadata(dataset_file.num_columns)
         table_description = self.__table_description_generator.get_table_description(dataset_file_name)
@@ -80,7 +90,23 @@ class LLMDBuilder:
         object_dict['attributes'] = column_LLMD
 
         self.__LLMD['objects'].append(object_dict)
-        self.__LLMD = manual_annotations.resolve_manual_table_annotations(self.__LLMD)
+        # Tables added before this one have had their manual annotations resolved and removed
+        self.__LLMD = manual_annotations.resolve_manual_table_annotations(self.__LLMD, len(self.__LLMD['objects']) - 1)
+
+    def __add_columns_in_parallel(self, llmd_columns, dataset_file):
+        # The columns of the table are computed by the workers, tables still go one at a
+        # time since a lazy dataset reads and evicts them in that order.
+        estimated_memory = estimate_column_statistics_memory(dataset_file.num_rows)
+
+        def add_column_LLMD(column_index):
+            self.__memory_budget.acquire(estimated_memory)
+            try:
+                llmd_columns.add_column_LLMD(dataset_file, column_index)
+            finally:
+                self.__memory_budget.release(estimated_memory)
+
+        with ThreadPoolExecutor(max_workers=self.__processes) as executor:
+            list(executor.map(add_column_LLMD, range(dataset_file.num_columns)))
 
     def add_key_info(self, use_annotations): 
         self.__LLMD = key_maps.map_primary_keys_to_table(self.__LLMD, use_annotations)
@@ -112,10 +138,10 @@ class LLMDColumns:
 
     def __init__(self, excel_dataset_descriptor):
         self.__LLMD_columns = {}
-        self.__excel_dataset_descriptor = excel_dataset_descriptor
+        self.__column_annotation_index = ColumnAnnotationIndex(excel_dataset_descriptor)
 
     def add_column_LLMD(self, dataset_file, column_index):
-        column_annotations = ColumnAnnotations(column_index, self.__excel_dataset_descriptor)
+        column_annotations = ColumnAnnotations(column_index, self.__column_annotation_index)
         metric_JSON_blocks_factory= MetricJSONBlocksFactory()
         metric_blocks = metric_JSON_blocks_factory.get_metric_blocks(dataset_file, column_annotations)
         column_metadata_dictionary = self.__assemble_column_metadata_dictionary_in_order(metric_blocks, column_annotations)
@@ -140,12 +166,16 @@ class LLMDColumns:
         sheets = []
 
         for column_index in range(number_of_columns):
-            column_annotations = ColumnAnnotations(column_index, self.__excel_dataset_descriptor)
+            column_annotations = ColumnAnnotations(column_index, self.__column_annotation_index)
             sheets.append(self.__LLMD_columns[column_annotations.name()])
 
         return sheets
 
 
+# Statistics read from one DatasetFile.profile pass instead of one pass each
+PROFILED_METRICS = {'max', 'min', 'std_dev', 'mean', 'median', 'skewness', 'kurtosis'}
+
+
 class MetricJSONBlocksFactory: 
 
     def __init__(self):
@@ -184,9 +214,17 @@ class MetricJSONBlocksFactory:
         enumerated_data_quality_class = DataQualityClassEnum(column_annotations.data_quality_class())
         metrics_to_be_calculated = self.__metrics_for_each_data_quality_class[enumerated_data_quality_class]
 
+        column_profile = None
+        if len(PROFILED_METRICS.intersection(metrics_to_be_calculated)) != 0:
+            try:
+                column_profile = dataset_file.profile(column_annotations.name())
+            except Exception:
+                # Each statistic is computed on its own below and reports its own failure
+                column_profile = None
+
         for metric in metrics_to_be_calculated:
             try:
-                JSON_dict = self.__metric_factory_methods[metric](dataset_file, column_annotations)
+                JSON_dict = self.__metric_factory_methods[metric](dataset_file, column_annotations, column_profile)
                 if not pd.isna(JSON_dict['value']):
                     metric_JSON_blocks.append(JSON_dict)
             except Exception as e:
@@ -198,53 +236,65 @@ class MetricJSONBlocksFactory:
 
 
 class MetricJSONBlockFactory: 
+
+    @staticmethod
+    def _get_statistic(dataset_file, column_annotations, column_profile, statistic_name):
+        if column_profile == None:
+            return getattr(dataset_file, statistic_name)(column_annotations.name())
+        return getattr(column_profile, statistic_name)
         
     @classmethod
-    def count(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Count", "value": dataset_file.count(column_annotations.name()), "units": "n/a",
+    def count(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Count", "value": cls._get_statistic(dataset_file, column_annotations, column_profile, 'count'), "units": "n/a",
                      "description": "Number of rows with attribute/column specified"}
 
         return JSON_dict
 
     @classmethod
-    def number_of_categories(cls, dataset_file, column_annotations):
-        unformatted_frequencies = dataset_file.value_counts(column_annotations.name())
-        formatted_frequencies = FrequencyFormatter.get_counts(unformatted_frequencies)
+    def number_of_categories(cls, dataset_file, column_annotations, column_profile=None):
+        category_profile = dataset_file.category_profile(column_annotations.name())
+        formatted_frequencies = FrequencyFormatter.get_counts(category_profile.counts)
         JSON_frequencies = []
 
         for name, count in formatted_frequencies.items():
             JSON_frequencies.append({"name": name, "frequencyN": count,
-                                "frequencyPercent": round(count / dataset_file.num_rows * 100, 3)})           
+                                "frequencyPercent": FrequencyFormatter.get_frequency_percent(count, dataset_file.num_rows)})           
 
-        number_of_categories = len(formatted_frequencies)
+        # Categories left out of a truncated list, zero when every category is listed
+        num_other_categories = int(category_profile.num_categories) - len(category_profile.counts)
 
-        JSON_dict = {"name": "Number of Categories", "value": number_of_categories,
+        JSON_dict = {"name": "Number of Categories", "value": len(formatted_frequencies) + num_other_categories,
                      "units": "n/a", "description": "Number of distinct/unique values for attribute/column",
-                     "frequencies": JSON_frequencies}
+                     "frequencies": JSON_frequencies, "mode": category_profile.mode}
+        if category_profile.mode != EXACT_FREQUENCIES:
+            JSON_dict["otherCategories"] = num_other_categories
+            JSON_dict["otherFrequencyN"] = int(category_profile.num_other_values)
+            JSON_dict["otherFrequencyPercent"] = FrequencyFormatter.get_frequency_percent(category_profile.num_other_values, dataset_file.num_rows)
 
         return JSON_dict
 
     @classmethod
-    def max(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Maximum Value", "value": dataset_file.max(column_annotations.name()),
+    def max(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Maximum Value", "value": cls._get_statistic(dataset_file, column_annotations, column_profile, 'max'),
                      "units": column_annotations.units(), "description": "Maximum value for attribute/column"}
 
         return JSON_dict
 
     @classmethod    
-    def min(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Minimum Value", "value": dataset_file.min(column_annotations.name()),
+    def min(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Minimum Value", "value": cls._get_statistic(dataset_file, column_annotations, column_profile, 'min'),
                      "units": column_annotations.units(), "description": "Minimum value for attribute/column"}
 
         return JSON_dict
     
     @classmethod
-    def std_dev(cls, dataset_file, column_annotations):
+    def std_dev(cls, dataset_file, column_annotations, column_profile=None):
 
-        if math.isinf(dataset_file.std_dev(column_annotations.name())):
+        std_dev_value = cls._get_statistic(dataset_file, column_annotations, column_profile, 'std_dev')
+        if math.isinf(std_dev_value):
             std_dev_value = "Error"
         else:
-            std_dev_value = round(dataset_file.std_dev(column_annotations.name()), 3)
+            std_dev_value = round(std_dev_value, 3)
 
         JSON_dict = {"name": "Standard Deviation", "value": std_dev_value,
                       "units": column_annotations.units(),
@@ -253,34 +303,35 @@ class MetricJSONBlockFactory:
         return JSON_dict
     
     @classmethod
-    def mean(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Mean", "value": round(dataset_file.mean(column_annotations.name()), 3),
+    def mean(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Mean", "value": round(cls._get_statistic(dataset_file, column_annotations, column_profile, 'mean'), 3),
                      "units": column_annotations.units(), "description": "Statistical mean for values specified for attribute/column"}
 
         return JSON_dict
     
     @classmethod
-    def median(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Median", "value": round(dataset_file.median(column_annotations.name()), 3),
-                     "units": column_annotations.units(), "description": "Statistical median for values specified for attribute/column"}
+    def median(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Median", "value": round(cls._get_statistic(dataset_file, column_annotations, column_profile, 'median'), 3),
+                     "units": column_annotations.units(), "description": "Statistical median for values specified for attribute/column",
+                     "mode": cls._get_statistic(dataset_file, column_annotations, column_profile, 'median_mode')}
 
         return JSON_dict
     
     @classmethod    
-    def skewness(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Skewness", "value": round(dataset_file.skewness(column_annotations.name()), 5), "units": "n/a",
+    def skewness(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Skewness", "value": round(cls._get_statistic(dataset_file, column_annotations, column_profile, 'skewness'), 5), "units": "n/a",
                      "description": "Statistical measure of the asymmetry of the distribution of the values for this attribute/column relative to its mean."}
         return JSON_dict
     
     @classmethod
-    def kurtosis(cls, dataset_file, column_annotations):
-        JSON_dict = {"name": "Kurtosis", "value": round(dataset_file.kurtosis(column_annotations.name()), 5), "units": "n/a",
+    def kurtosis(cls, dataset_file, column_annotations, column_profile=None):
+        JSON_dict = {"name": "Kurtosis", "value": round(cls._get_statistic(dataset_file, column_annotations, column_profile, 'kurtosis'), 5), "units": "n/a",
                      "description": "Statistical measure of the shape (peakedness) of the distribution of the values for this attribute/column."} 
 
         return JSON_dict
     
     @classmethod
-    def monotonicity_ratio(cls, dataset_file, column_annotations): 
+    def monotonicity_ratio(cls, dataset_file, column_annotations, column_profile=None): 
         JSON_dict = {"name": "Monotonicity Ratio", "value": round(dataset_file.monotonicity_ratio(column_annotations.name()), 5), "units": "n/a",
                             "description": "Custom statistical measure approximating the monotonic behavior for this attribute/column "} 
         return JSON_dict
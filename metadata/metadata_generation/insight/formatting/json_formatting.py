@@ -1,5 +1,8 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
+import numpy as np
+import pandas as pd
+
 from collections import defaultdict
 
 from ...utils import datatype_conversion
@@ -8,19 +11,14 @@ class FrequencyFormatter:
 
     @classmethod 
     def get_counts(cls, unformatted_value_counts):
-        formatted_value_counts = defaultdict(int)
-
-        for value_counts in unformatted_value_counts.items():
-            value = value_counts[0]
-            count = value_counts[1]
+        # "3", "3.0" and 3 are all counted as the integer 3, in order of first appearance
+        formatted_values = datatype_conversion.convert_integer_values(unformatted_value_counts.index)
+        codes, unique_values = pd.factorize(formatted_values, use_na_sentinel=False)
+        counts = np.zeros(len(unique_values), dtype=np.int64)
+        np.add.at(counts, codes, unformatted_value_counts.to_numpy(dtype=np.int64))
 
-            if value in formatted_value_counts.keys():
-                formatted_value_counts[value] += count
-            elif datatype_conversion.is_string_integer(value):
-                formatted_value_counts[datatype_conversion.convert_string_to_int(value)] += count 
-            elif datatype_conversion.is_numeric_integer(value):
-                formatted_value_counts[int(value)] += count 
-            else:
-                formatted_value_counts[value] += count
+        return defaultdict(int, zip(unique_values.tolist(), counts.tolist()))
 
-        return formatted_value_counts
\ No newline at end of file
+    @classmethod
+    def get_frequency_percent(cls, count, num_rows):
+        return round(count / num_rows * 100, 3)
\ No newline at end of file
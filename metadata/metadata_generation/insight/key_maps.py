@@ -57,21 +57,69 @@ def calculate_Levenshtein(s1: str, comparing_strings: list[str]) -> list:
         distance = nltk.edit_distance(s1, s2)
         levenshtein_distances.append((s2, distance))
     return levenshtein_distances
-        
-def rank_key_matches(table_name: str, attribute_name: str, dataset_primary_keys) -> dict: 
-    ranked_key_matches = {}
-    for primary_key_table, primary_keys in dataset_primary_keys.items(): 
-        if table_name == primary_key_table: 
-            continue
-        levenshtein_distances = calculate_Levenshtein(attribute_name, primary_keys)
-        for primary_key, distance in levenshtein_distances:
-            if distance > MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING:
+
+def calculate_bounded_Levenshtein(s1: str, s2: str, max_distance: int) -> int:
+    # The Levenshtein distance of nltk.edit_distance when it is at most max_distance, else
+    # max_distance + 1. Only the diagonal band of cells within max_distance of the
+    # diagonal can stay under the bound, and the rows stop once the band is over it.
+    if abs(len(s1) - len(s2)) > max_distance:
+        return max_distance + 1
+    over_bound = max_distance + 1
+    previous_row = [j if j <= max_distance else over_bound for j in range(len(s2) + 1)]
+    for i in range(1, len(s1) + 1):
+        current_row = [over_bound] * (len(s2) + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        for j in range(max(1, i - max_distance), min(len(s2), i + max_distance) + 1):
+            substitution_cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            current_row[j] = min(previous_row[j] + 1, current_row[j - 1] + 1, previous_row[j - 1] + substitution_cost, over_bound)
+        if min(current_row) > max_distance:
+            return over_bound
+        previous_row = current_row
+    return previous_row[len(s2)]
+
+
+class PrimaryKeyNameIndex:
+    """
+        The primary keys of a dataset bucketed by name length. Only keys whose length is
+        within MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING of an attribute name can be
+        that close to it, and only their distances are computed, in the bounded form.
+    """
+
+    def __init__(self, dataset_primary_keys: dict):
+        self.__keys_by_length = {}
+        key_order = 0
+        for primary_key_table, primary_keys in dataset_primary_keys.items():
+            for primary_key in primary_keys:
+                self.__keys_by_length.setdefault(len(primary_key), []).append((key_order, primary_key_table, primary_key))
+                key_order += 1
+
+    def get_close_keys(self, table_name: str, attribute_name: str) -> list:
+        # (table, key, distance) of every close key of the other tables, in dataset order
+        candidate_keys = []
+        for length in range(len(attribute_name) - MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING,
+                            len(attribute_name) + MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING + 1):
+            candidate_keys.extend(self.__keys_by_length.get(length, []))
+        close_keys = []
+        for _, primary_key_table, primary_key in sorted(candidate_keys):
+            if table_name == primary_key_table:
                 continue
-            if 0 in ranked_key_matches.keys():
-                raise IOError(f"Key {attribute_name} has multiple matching attributes across tables. Manual annotations required.")
-            elif distance < MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING:
-                warnings.warn(f"Key {attribute_name} has multiple close matches across tables. Manually annotate carefully.")
-            ranked_key_matches[distance] = (primary_key_table, primary_key)
+            distance = calculate_bounded_Levenshtein(attribute_name, primary_key, MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING)
+            if distance <= MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING:
+                close_keys.append((primary_key_table, primary_key, distance))
+        return close_keys
+
+
+def rank_key_matches(table_name: str, attribute_name: str, dataset_primary_keys, primary_key_name_index: PrimaryKeyNameIndex = None) -> dict: 
+    if primary_key_name_index == None:
+        primary_key_name_index = PrimaryKeyNameIndex(dataset_primary_keys)
+    ranked_key_matches = {}
+    for primary_key_table, primary_key, distance in primary_key_name_index.get_close_keys(table_name, attribute_name):
+        if 0 in ranked_key_matches.keys():
+            raise IOError(f"Key {attribute_name} has multiple matching attributes across tables. Manual annotations required.")
+        elif distance < MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING:
+            warnings.warn(f"Key {attribute_name} has multiple close matches across tables. Manually annotate carefully.")
+        ranked_key_matches[distance] = (primary_key_table, primary_key)
     return ranked_key_matches
 
 def warning_for_close_primary_key_matches(table_name: str, attribute_name: str, ranked_key_matches: dict) -> None:
@@ -86,7 +134,7 @@ def warning_for_close_primary_key_matches(table_name: str, attribute_name: str,
                     (Table: {closest_matched_table}, Attribute: {closest_matched_key}) that is \
                     {closest_matched_key} variations away. \n\nConsider revising annotations to explicitly list relationships.") 
 
-def map_table_foreign_keys(metadata: dict, current_table_index: int, dataset_primary_keys: dict) -> dict: 
+def map_table_foreign_keys(metadata: dict, current_table_index: int, dataset_primary_keys: dict, primary_key_name_index: PrimaryKeyNameIndex = None) -> dict: 
     foreign_key_matches = {}
     metadata_table_parser = MetadataTableParser(metadata, current_table_index)   
     table_name = metadata_table_parser.get_table_value('name')
@@ -99,7 +147,7 @@ def map_table_foreign_keys(metadata: dict, current_table_index: int, dataset_pri
            (data_quality_class != DataQualityClassEnum.NONE and
             data_quality_class != DataQualityClassEnum.COMPOSITE_PRIMARY_KEY): 
             continue
-        key_match_rankings = rank_key_matches(table_name, attribute_name, dataset_primary_keys)
+        key_match_rankings = rank_key_matches(table_name, attribute_name, dataset_primary_keys, primary_key_name_index)
         if 0 not in key_match_rankings:
             warning_for_close_primary_key_matches(table_name, attribute_name, key_match_rankings)
             continue
@@ -127,7 +175,9 @@ def map_foreign_keys_to_table(metadata: dict, use_annotations: bool) -> dict:
     if use_annotations == True: 
         return metadata
     dataset_primary_keys = create_dictionary_of_primary_keys(metadata) 
+    # Indexed once, every attribute of every table is matched against the same keys
+    primary_key_name_index = PrimaryKeyNameIndex(dataset_primary_keys)
     metadata_iterator = MetadataIterator(metadata)   
     for current_table_index in metadata_iterator.iterate_table(): 
-        metadata = map_table_foreign_keys(metadata, current_table_index, dataset_primary_keys)
+        metadata = map_table_foreign_keys(metadata, current_table_index, dataset_primary_keys, primary_key_name_index)
     return metadata
\ No newline at end of file
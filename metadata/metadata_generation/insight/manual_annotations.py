@@ -6,9 +6,15 @@ from ..utils.file_parsing import MetadataAttributeParser, MetadataTableParser
 from ..veritas.datatypes import DataQualityClassEnum
 
 
-def delete_manual_annotations(metadata: dict) -> dict: 
+def _iterate_JSON_indices(metadata: dict, table_index: int = None):
+    # Only the attributes of the given table, or of every table
     JSON_index_iterator = JSONIndexIterator(metadata=metadata)
-    for JSON_index in JSON_index_iterator.iterate(): 
+    if table_index == None:
+        return JSON_index_iterator.iterate()
+    return JSON_index_iterator.iterate_table_attributes(table_index)
+
+def delete_manual_annotations(metadata: dict, table_index: int = None) -> dict: 
+    for JSON_index in _iterate_JSON_indices(metadata, table_index): 
         metadata_attribute_parser = MetadataAttributeParser(metadata, JSON_index)
         if metadata_attribute_parser.in_attribute_values('manual_annotations'):
             current_table = metadata['objects'][JSON_index.table_metadata_index]
@@ -18,9 +24,8 @@ def delete_manual_annotations(metadata: dict) -> dict:
             metadata['objects'][JSON_index.table_metadata_index] = current_table
     return metadata
   
-def resolve_foreign_key_references(metadata: dict) -> dict:
-    JSON_index_iterator = JSONIndexIterator(metadata=metadata)
-    for JSON_index in JSON_index_iterator.iterate(): 
+def resolve_foreign_key_references(metadata: dict, table_index: int = None) -> dict:
+    for JSON_index in _iterate_JSON_indices(metadata, table_index): 
         current_table = metadata['objects'][JSON_index.table_metadata_index]
         metadata_table_parser = MetadataTableParser(metadata, JSON_index.table_metadata_index)
         metadata_attribute_parser = MetadataAttributeParser(metadata, JSON_index)
@@ -45,7 +50,8 @@ def resolve_foreign_key_references(metadata: dict) -> dict:
         metadata['objects'][JSON_index.table_metadata_index] = current_table
     return metadata
 
-def resolve_manual_table_annotations(metadata: dict) -> dict:
-    metadata = resolve_foreign_key_references(metadata)
-    metadata = delete_manual_annotations(metadata)
+def resolve_manual_table_annotations(metadata: dict, table_index: int = None) -> dict:
+    # A table index resolves that table alone, the annotations of the others are already resolved
+    metadata = resolve_foreign_key_references(metadata, table_index)
+    metadata = delete_manual_annotations(metadata, table_index)
     return metadata
\ No newline at end of file
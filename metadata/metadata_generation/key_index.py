@@ -0,0 +1,59 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pandas as pd
+
+
+"""
+    Hash index of the keys of one column. The column is factorized once into an integer
+    code per row and the distinct keys, so duplicate detection and membership tests
+    against the keys of another table are array operations over the codes. The keys are
+    held as Python objects, matched as a set of them would be, so keys of different
+    column types compare the same way whatever type each table was read as.
+"""
+
+
+class KeyIndex:
+
+    def __init__(self, column: pd.Series):
+        # Missing values get the code -1 and are not keys
+        self._codes, keys = pd.factorize(column)
+        self._keys = pd.Index(keys.tolist(), dtype=object)
+        self._duplicated_mask = None
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes
+
+    @property
+    def keys(self) -> pd.Index:
+        return self._keys
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        return self._codes >= 0
+
+    @property
+    def duplicated_mask(self) -> np.ndarray:
+        # Every row holding a key already held by an earlier row
+        if self._duplicated_mask is None:
+            valid_rows = np.flatnonzero(self.valid_mask)
+            _, first_positions = np.unique(self._codes[valid_rows], return_index=True)
+            self._duplicated_mask = self.valid_mask
+            self._duplicated_mask[valid_rows[first_positions]] = False
+        return self._duplicated_mask
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._codes.nbytes + self._keys.memory_usage(deep=True))
+
+    def contains(self, keys: pd.Index) -> np.ndarray:
+        return self._keys.get_indexer(keys) >= 0
+
+    def get_missing_mask(self, compared_key_index: "KeyIndex") -> np.ndarray:
+        # Rows whose key is not a key of the compared index, each distinct key is looked up once
+        missing_keys = ~compared_key_index.contains(self._keys)
+        missing_mask = np.zeros(len(self._codes), dtype=bool)
+        valid_mask = self.valid_mask
+        missing_mask[valid_mask] = missing_keys[self._codes[valid_mask]]
+        return missing_mask
@@ -5,33 +5,126 @@ import pandas as pd
 pd.options.mode.chained_assignment = None
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .utils.file_system_tools import FullFileNameFinder
 from .utils.file_system_tools_proto import file_system_crawler
 from .utils.file_system_tools_proto import json_loader
 from .utils.file_system_tools import  ConfigurationFilePathFinder
 from .utils.constraints import Constraints, VeritasConstraints
 from .utils.json_cleaning import ProjectMetadataCleaner, TableDescriptionsCleaner
+from .utils.parallel import MemoryBudget, estimate_parsed_file_memory
 
-from .dataframe import Dataset
+from .dataframe import Dataset, LazyDataset
+from .read_plan import ReadPlanBuilder
+from .streaming_statistics import StatisticsPlanBuilder, StreamingDataset
+from .table_cache import ParsedTableCache
+from .annotations_store import AnnotationsStore
 from .settings import InsightFilePaths, VeritasFilePaths
 
 
 class MetadataGenerationInputReader:
   
     @classmethod
-    def read_dataset(cls, settings, dataset_directory_path, dataframe_type='Pandas'):
+    def read_dataset(cls, settings, dataset_directory_path, dataframe_type='Pandas', read_plans=None, csv_engine='pandas'):
         dataset = Dataset() 
+        if read_plans == None:
+            read_plans = {}
+
+        table_cache = None
+        if settings.table_cache_directory_path != None:
+            table_cache = ParsedTableCache(settings.table_cache_directory_path)
+
+        dataset_file_paths = file_system_crawler.get_directory_file_paths(dataset_directory_path)
+        if settings.lazy_loading or settings.streaming_statistics:
+            # Files are read on first access and evicted under the memory ceiling. Streaming
+            # statistics do not need the tables, so they are only read if a later step does
+            dataset = LazyDataset(settings.memory_ceiling)
+            for dataset_file_path in dataset_file_paths:
+                dataset_file_name = Dataset.get_dataset_file_name(dataset_file_path)
+                dataset.add_dataset_file(dataset_file_path, settings.delimiter, dataframe_type, read_plans.get(dataset_file_name), csv_engine, table_cache)
+            return dataset
+
+        read_dataset_file_arguments = []
+        for dataset_file_path in dataset_file_paths:
+            dataset_file_name = Dataset.get_dataset_file_name(dataset_file_path)
+            read_dataset_file_arguments.append(
+                (dataset_file_path, settings.delimiter, dataframe_type, read_plans.get(dataset_file_name), csv_engine, table_cache)
+            )
+
+        with warnings.catch_warnings():
+            # Only the parser's mixed type warnings, a typed read falling back is still reported
+            warnings.simplefilter('ignore', pd.errors.DtypeWarning)
+            if settings.processes > 1 and len(dataset_file_paths) > 1:
+                dataset_files = cls._read_dataset_files_in_parallel(read_dataset_file_arguments, settings.processes, settings.memory_budget)
+            else:
+                dataset_files = [Dataset.read_dataset_file(*arguments) for arguments in read_dataset_file_arguments]
+
+        # Files are inserted in directory listing order regardless of which finished first
+        for dataset_file_path, dataset_file in zip(dataset_file_paths, dataset_files):
+            dataset.insert_dataset_file(dataset_file_path, dataset_file)
+
+        return dataset
+
+    @classmethod
+    def _read_dataset_files_in_parallel(cls, read_dataset_file_arguments, processes, memory_budget_bytes=None):
+        # Each worker reads one file and holds the estimated size of its parsed table in the budget
+        memory_budget = MemoryBudget(memory_budget_bytes)
+
+        def read_dataset_file(arguments):
+            estimated_memory = estimate_parsed_file_memory(arguments[0])
+            memory_budget.acquire(estimated_memory)
+            try:
+                return Dataset.read_dataset_file(*arguments)
+            finally:
+                memory_budget.release(estimated_memory)
+
+        with ThreadPoolExecutor(max_workers=processes) as executor:
+            dataset_files = list(executor.map(read_dataset_file, read_dataset_file_arguments))
+
+        return dataset_files
+
+    @classmethod
+    def read_streaming_dataset(cls, settings, dataset_directory_path, read_plans=None, statistics_plans=None):
+        # Nothing is read here, each file is scanned in chunks when its statistics are first needed
+        streaming_dataset = StreamingDataset()
+        if read_plans == None:
+            read_plans = {}
+        if statistics_plans == None:
+            statistics_plans = {}
 
         for dataset_file_path in file_system_crawler.get_directory_file_paths(dataset_directory_path):
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                dataset.add_dataset_file(dataset_file_path, settings.delimiter, dataframe_type)
+            dataset_file_name = Dataset.get_dataset_file_name(dataset_file_path)
+            streaming_dataset.add_dataset_file(dataset_file_path, settings.delimiter, read_plans.get(dataset_file_name),
+                                               statistics_plans.get(dataset_file_name), settings.statistics_chunk_rows,
+                                               median_error_bound=settings.median_error_bound)
 
-        return dataset
+        return streaming_dataset
 
     @classmethod
-    def read_annotations(cls, annotations_file_path): 
-        dataset_annotations = pd.ExcelFile(annotations_file_path)
+    def read_dataset_statistics_plans(cls, excel_annotations, real_name_to_excel_name_map):
+        statistics_plans = {}
+
+        for real_dataset_file_name, excel_sheet_name in real_name_to_excel_name_map.items():
+            annotations = excel_annotations.get_sheet(excel_sheet_name)
+            statistics_plans[real_dataset_file_name] = StatisticsPlanBuilder.build_statistics_plan(annotations)
+
+        return statistics_plans
+
+    @classmethod
+    def read_dataset_read_plans(cls, excel_annotations, real_name_to_excel_name_map):
+        read_plans = {}
+
+        for real_dataset_file_name, excel_sheet_name in real_name_to_excel_name_map.items():
+            annotations = excel_annotations.get_sheet(excel_sheet_name)
+            read_plans[real_dataset_file_name] = ReadPlanBuilder.build_read_plan(annotations)
+
+        return read_plans
+
+    @classmethod
+    def read_annotations(cls, annotations_file_path, cache_directory_path=None):
+        # Every sheet is read once here, the sheet lookups that follow are answered from memory
+        dataset_annotations = AnnotationsStore(annotations_file_path, cache_directory_path)
         return dataset_annotations
 
     @classmethod
@@ -87,7 +180,7 @@ class MetadataGenerationInputReader:
         real_name_to_excel_name_map = {}
 
         for sheet_name in excel_annotations.sheet_names:
-            data = pd.read_excel(excel_annotations, sheet_name=sheet_name)
+            data = excel_annotations.get_sheet(sheet_name)
             found_names = False
             if "Files" in data.columns:
                 for file_name in data["Files"]:
@@ -115,11 +208,21 @@ class MetadataGenerationInput:
 
     def __init__(self, settings):
         metadata_generation_input_reader = MetadataGenerationInputReader()
-        self.__dataset = metadata_generation_input_reader.read_dataset(settings, InsightFilePaths.data_directory_path)
-        self.__annotations = metadata_generation_input_reader.read_annotations(InsightFilePaths.descriptive_info_path + '/annotations.xlsx')
+        self.__annotations = metadata_generation_input_reader.read_annotations(InsightFilePaths.descriptive_info_path + '/annotations.xlsx',
+                                                                                 settings.table_cache_directory_path)
+        self.__dataset_excel_file_names = metadata_generation_input_reader.read_real_name_to_excel_name_map(self.__annotations, InsightFilePaths.data_directory_path)
+        # Typed loading builds the dtypes of each table from its annotations before reading it
+        read_plans = None
+        if settings.typed_loading:
+            read_plans = metadata_generation_input_reader.read_dataset_read_plans(self.__annotations, self.__dataset_excel_file_names)
+        self.__dataset = metadata_generation_input_reader.read_dataset(settings, InsightFilePaths.data_directory_path, read_plans=read_plans, csv_engine=settings.csv_engine)
+        # Streaming statistics give the LLMD its statistics from chunked passes over the files
+        self.__streaming_dataset = None
+        if settings.streaming_statistics:
+            statistics_plans = metadata_generation_input_reader.read_dataset_statistics_plans(self.__annotations, self.__dataset_excel_file_names)
+            self.__streaming_dataset = metadata_generation_input_reader.read_streaming_dataset(settings, InsightFilePaths.data_directory_path, read_plans, statistics_plans)
         self.__partial_dataset_metadata = metadata_generation_input_reader.read_partial_dataset_metadata(settings, InsightFilePaths.descriptive_info_path + '/project_metadata.json')
         self.__table_descriptions = metadata_generation_input_reader.read_table_descriptions(InsightFilePaths.descriptive_info_path + '/table_descriptions.json')
-        self.__dataset_excel_file_names = metadata_generation_input_reader.read_real_name_to_excel_name_map(self.__annotations, InsightFilePaths.data_directory_path)
         self.__constraints = metadata_generation_input_reader.read_constraints(VeritasFilePaths.configuration_directory_path)
 
     @property
@@ -127,9 +230,24 @@ class MetadataGenerationInput:
         for dataset_file_name, dataset_file in self.__dataset.dataset_files: 
             yield dataset_file_name, dataset_file 
 
+    @property
+    def statistics_dataset_files(self):
+        # The files the LLMD statistics are computed from
+        if self.__streaming_dataset == None:
+            yield from self.dataset_files
+            return
+        for dataset_file_name, dataset_file in self.__streaming_dataset.dataset_files:
+            yield dataset_file_name, dataset_file
+
     def get_dataset_file(self, file_name):
         return self.__dataset.get_dataset_file(file_name)
 
+    def pin_dataset_file(self, file_name):
+        self.__dataset.pin_dataset_file(file_name)
+
+    def unpin_dataset_file(self, file_name):
+        self.__dataset.unpin_dataset_file(file_name)
+
     @property
     def number_of_dataset_files(self):
         return len(self.__dataset.keys())
@@ -144,10 +262,13 @@ class MetadataGenerationInput:
 
     def get_dataset_file_annotations(self, real_dataset_file_name):
         excel_sheet_name = self.__dataset_excel_file_names[real_dataset_file_name]
-        annotations = pd.read_excel(self.__annotations, sheet_name=excel_sheet_name)
+        annotations = self.__annotations.get_sheet(excel_sheet_name)
 
         # Ensure that the order of the annotations matches the order of the dataset file.
-        original_columns = self.get_dataset_file(real_dataset_file_name).data_column_order
+        if self.__streaming_dataset != None:
+            original_columns = self.__streaming_dataset.get_dataset_file(real_dataset_file_name).data_column_order
+        else:
+            original_columns = self.get_dataset_file(real_dataset_file_name).data_column_order
         # pd.Categorical turns string values into categorical values, which can be ordered non-alphabetically
         # In accordance to original column order
         annotations["Name"] = pd.Categorical(annotations["Name"], original_columns)
@@ -191,7 +191,7 @@ class HTMLTableFactory:
             category_count += 1
         
         sub_table_html = html_table_builder.get_table_html()
-        number_of_categories_not_counted = category_count - self.__category_show_limit
+        number_of_categories_not_counted = max(category_count - self.__category_show_limit, 0) + round(metadata_iterator.count_other_categories())
         if 0 < number_of_categories_not_counted:
             sub_table_html += "       <tr>\
                                    \n   <td colspan=\"4\"></td>\
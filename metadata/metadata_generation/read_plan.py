@@ -0,0 +1,119 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import pandas as pd
+
+from dataclasses import dataclass, field
+
+from .insight.column_annotations import ColumnAnnotations, ColumnAnnotationIndex
+from .veritas.datatypes import DataQualityClassEnum
+
+
+"""
+    A read plan tells the dataset file reader which columns to load and how
+    to parse them, so that columns arrive with their annotated dtype instead
+    of being inferred (and later re-coerced) by pandas.
+"""
+
+INTEGER_TYPES = ['integer', 'int']
+FLOAT_TYPES = ['float', 'double', 'decimal']
+STRING_TYPES = ['string', 'str', 'text']
+DATE_CLASSES = [
+    DataQualityClassEnum.DATE.value,
+    DataQualityClassEnum.DATE_TIME.value,
+    DataQualityClassEnum.TIME.value,
+]
+
+
+@dataclass
+class ReadPlan:
+
+    dtypes: dict = field(default_factory=dict)
+    parse_dates: list = field(default_factory=list)
+    usecols: list = field(default_factory=list)
+
+    def get_read_csv_arguments(self, header_columns) -> dict:
+        # Only hand pandas the columns that actually exist in the file, pandas
+        # raises for missing parse_dates/usecols entries.
+        header_columns = list(header_columns)
+        usecols = [column for column in header_columns if column in self.usecols]
+        if len(usecols) == 0:
+            usecols = header_columns
+
+        read_csv_arguments = {
+            'usecols': usecols,
+            'dtype': {column: self.dtypes[column] for column in usecols if column in self.dtypes},
+            'parse_dates': [column for column in usecols if column in self.parse_dates],
+        }
+        return read_csv_arguments
+
+    def normalize_dtypes(self, df: pd.DataFrame) -> None:
+        # Nullable integers are only used to validate the parse; hand the
+        # rest of the pipeline the numpy dtypes pandas would have inferred.
+        for column_name, dtype in self.dtypes.items():
+            if column_name not in df.columns:
+                continue
+            if dtype == 'Int64':
+                if df[column_name].isna().any():
+                    df[column_name] = df[column_name].astype('float64')
+                else:
+                    df[column_name] = df[column_name].astype('int64')
+            elif dtype == 'category':
+                # Keep categories in order of first appearance so value_counts
+                # breaks ties the same way it does for object columns.
+                codes = df[column_name].cat.codes.to_numpy()
+                first_seen_codes = pd.unique(codes[codes >= 0])
+                categories = df[column_name].cat.categories[first_seen_codes]
+                df[column_name] = df[column_name].cat.reorder_categories(categories)
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.usecols) == 0
+
+
+class ReadPlanBuilder:
+
+    @classmethod
+    def build_read_plan(cls, excel_dataset_annotations: pd.DataFrame) -> ReadPlan:
+        read_plan = ReadPlan()
+
+        if 'Name' not in excel_dataset_annotations:
+            return read_plan
+
+        column_annotation_index = ColumnAnnotationIndex(excel_dataset_annotations)
+        for column_index in range(len(column_annotation_index)):
+            column_annotations = ColumnAnnotations(column_index, column_annotation_index)
+            column_name = column_annotations.name()
+            if pd.isna(column_name):
+                continue
+            column_name = str(column_name)
+            read_plan.usecols.append(column_name)
+
+            llmd_type = cls._get_annotation(column_annotations.llmd_type)
+            data_quality_class = cls._get_annotation(column_annotations.data_quality_class)
+
+            if data_quality_class in DATE_CLASSES:
+                # A date format in the units column means the format rule needs
+                # the original strings, so the column is left unparsed.
+                if column_annotations.units() == 'n/a':
+                    read_plan.parse_dates.append(column_name)
+                continue
+
+            if llmd_type in INTEGER_TYPES:
+                read_plan.dtypes[column_name] = 'Int64'
+            elif llmd_type in FLOAT_TYPES:
+                read_plan.dtypes[column_name] = 'float64'
+            elif llmd_type in STRING_TYPES:
+                if data_quality_class == DataQualityClassEnum.CATEGORICAL.value:
+                    read_plan.dtypes[column_name] = 'category'
+                else:
+                    read_plan.dtypes[column_name] = 'str'
+
+        return read_plan
+
+    @staticmethod
+    def _get_annotation(annotation_getter):
+        try:
+            annotation = annotation_getter()
+        except (AttributeError, KeyError):
+            return None
+        return annotation.strip().lower()
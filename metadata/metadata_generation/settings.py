@@ -3,11 +3,15 @@
 import os, shutil
 
 from dataclasses import dataclass
-from .utils.file_sampling import Reservoir_Sampler
+from .utils.file_sampling import Reservoir_Sampler, KeyConsistentSampler, SamplingKeyRelationshipReader
 
 
 VERITAS_VERSION = "v5.2.2"
 MAX_NUM_CHAR_VARIATIONS_NEEDED_FOR_KEY_WARNING = 2
+# How the input directory is staged: copied, read where it is, or mirrored with symbolic or hard links
+STAGING_MODES = ['copy', 'in_place', 'symlink', 'hardlink']
+# Rows read at a time by streaming statistics
+STATISTICS_CHUNK_ROWS = 2**20
 
 
 class DefaultFileLocations:
@@ -20,27 +24,76 @@ class DefaultFileLocations:
         INPUT_DIRECTORY_PATH, "descriptive_information"
     )
 
+    STAGING_DIRECTORY_PATH: str = INPUT_DIRECTORY_PATH
+
     @classmethod
-    def set_input(cls, input_path, n_rows, processes):
-        # Sample the input and copy it into the input directory
+    def set_input(cls, input_path, n_rows, processes, staging_mode='copy', seed=None, sample_fraction=-1, delimiter=','):
+        # Sample the input and stage it into the input directory
+        if staging_mode not in STAGING_MODES:
+            raise ValueError("Staging mode not recognized: {}".format(staging_mode))
+
         input_data_directory = cls.DATA_DIRECTORY_PATH
         if input_path and input_path != "/":
             if os.path.exists(input_path):
                 # Update input_data_directory
                 input_data_directory = os.path.join(input_path, "data")
-                # Copy provided input to new input location.
-                if os.path.exists(cls.INPUT_DIRECTORY_PATH):
-                    shutil.rmtree(cls.INPUT_DIRECTORY_PATH)
-                shutil.copytree(input_path, cls.INPUT_DIRECTORY_PATH)
+                if staging_mode == 'in_place':
+                    # Read the provided input where it is, nothing is copied
+                    cls._set_input_directory_path(os.path.abspath(input_path))
+                else:
+                    # Copy or link provided input to new input location.
+                    if os.path.exists(cls.STAGING_DIRECTORY_PATH):
+                        shutil.rmtree(cls.STAGING_DIRECTORY_PATH)
+                    shutil.copytree(input_path, cls.STAGING_DIRECTORY_PATH, 
+                                    copy_function=cls._get_staging_copy_function(staging_mode))
+                    cls._set_input_directory_path(cls.STAGING_DIRECTORY_PATH)
             else:
                 raise ValueError("Input directory does not exist!")
 
         # Sample Input
-        if n_rows > 0:
-            #input_data_directory = os.path.join()
-            Reservoir_Sampler(
-                input_data_directory, cls.DATA_DIRECTORY_PATH, n_rows, processes
-            ).sample()
+        if n_rows > 0 or sample_fraction > 0:
+            sample_data_directory = cls.DATA_DIRECTORY_PATH
+            if staging_mode == 'in_place' and os.path.realpath(cls.INPUT_DIRECTORY_PATH) != os.path.realpath(cls.STAGING_DIRECTORY_PATH):
+                # Samples are never written into the provided input
+                sample_data_directory = os.path.join(cls.STAGING_DIRECTORY_PATH, "data")
+                if os.path.exists(sample_data_directory):
+                    shutil.rmtree(sample_data_directory)
+                os.makedirs(sample_data_directory)
+                cls.DATA_DIRECTORY_PATH = sample_data_directory
+            if sample_fraction > 0:
+                # Foreign keys from the annotations keep child rows consistent with their sampled parents
+                key_relationships = SamplingKeyRelationshipReader.read_key_relationships(
+                    os.path.join(cls.DESCRIPTIVE_INFO_PATH, "annotations.xlsx"), input_data_directory
+                )
+                KeyConsistentSampler(
+                    input_data_directory, sample_data_directory, sample_fraction, key_relationships, delimiter, seed
+                ).sample()
+            else:
+                Reservoir_Sampler(
+                    input_data_directory, sample_data_directory, n_rows, processes, seed
+                ).sample()
+
+    @classmethod
+    def _set_input_directory_path(cls, input_directory_path):
+        cls.INPUT_DIRECTORY_PATH = input_directory_path
+        cls.DATA_DIRECTORY_PATH = os.path.join(input_directory_path, "data")
+        cls.DESCRIPTIVE_INFO_PATH = os.path.join(input_directory_path, "descriptive_information")
+
+    @staticmethod
+    def _get_staging_copy_function(staging_mode):
+        if staging_mode == 'symlink':
+            return lambda source_path, staged_path: os.symlink(os.path.abspath(source_path), staged_path)
+        if staging_mode == 'hardlink':
+            return DefaultFileLocations._hardlink_or_copy
+        return shutil.copy2
+
+    @staticmethod
+    def _hardlink_or_copy(source_path, staged_path):
+        try:
+            os.link(source_path, staged_path)
+        except OSError:
+            # Hard links cannot cross file systems
+            shutil.copy2(source_path, staged_path)
 
     @classmethod
     def set_output(cls, output_path):
@@ -186,3 +239,16 @@ class MetadataGenerationSettings:
         self.file_extension = ".csv"
         self.delimiter = ","
         self.use_annotations = False
+        self.typed_loading = False
+        self.csv_engine = 'pandas'
+        self.processes = 1
+        self.memory_budget = None
+        self.lazy_loading = False
+        self.memory_ceiling = None
+        self.streaming_statistics = False
+        self.statistics_chunk_rows = STATISTICS_CHUNK_ROWS
+        self.median_error_bound = None
+        self.table_cache_directory_path = None
+        self.staging_mode = 'copy'
+        self.sampling_seed = None
+        self.sample_fraction = -1
@@ -0,0 +1,412 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import io, os, shutil, tempfile
+import numpy as np
+import pandas as pd
+import warnings
+
+from dataclasses import dataclass
+
+from .settings import STATISTICS_CHUNK_ROWS
+from .dataframe import Dataset, parse_columnar_dates, replace_infinite_values
+from .insight.column_annotations import ColumnAnnotations, ColumnAnnotationIndex
+from .veritas.datatypes import DataQualityClassEnum
+from .utils.statistics import CATEGORY_CAP, CategoryProfile, CentralMoments, ColumnProfile, FrequencyAccumulator, MedianAccumulator
+from .utils.data_file_formats import is_columnar_data_file, iterate_columnar_data_file, read_data_file_columns
+
+
+"""
+    Streaming statistics read each data file in chunks of rows and keep mergeable
+    per column accumulators instead of the table, so the LLMD statistics of a table
+    take memory growing with the number of columns, not rows. A table read in a single
+    chunk gets exactly the statistics of the in memory table; over several chunks the
+    merged moments agree with it to rounding. Value counted columns are read as strings,
+    so every chunk counts the same values, and the values counted are typed at the end
+    as the parser types the whole column.
+"""
+
+
+def parse_data_values(values: pd.Series) -> pd.Series:
+    # Strings read from a data file, typed as the CSV parser types a column holding them
+    buffer = io.StringIO()
+    values.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    parsed_values = pd.read_csv(buffer, header=None, names=['values'], na_values=['inf', '-inf'], skip_blank_lines=False)['values']
+    parsed_values.index = values.index
+    parsed_values.name = values.name
+    return parsed_values
+
+
+@dataclass
+class StatisticsPlan:
+
+    # Columns the numerical statistics and the value counts are gathered for, None for every column
+    profiled_columns: list | None = None
+    value_counted_columns: list | None = None
+
+    def profiles(self, column_name) -> bool:
+        return self.profiled_columns == None or column_name in self.profiled_columns
+
+    def counts_values(self, column_name) -> bool:
+        return self.value_counted_columns == None or column_name in self.value_counted_columns
+
+
+class StatisticsPlanBuilder:
+
+    @classmethod
+    def build_statistics_plan(cls, excel_dataset_annotations: pd.DataFrame) -> StatisticsPlan:
+        if 'Name' not in excel_dataset_annotations:
+            return StatisticsPlan()
+
+        statistics_plan = StatisticsPlan(profiled_columns=[], value_counted_columns=[])
+        column_annotation_index = ColumnAnnotationIndex(excel_dataset_annotations)
+        for column_index in range(len(column_annotation_index)):
+            column_annotations = ColumnAnnotations(column_index, column_annotation_index)
+            column_name = column_annotations.name()
+            if pd.isna(column_name):
+                continue
+
+            data_quality_class = cls._get_annotation(column_annotations.data_quality_class)
+            if data_quality_class == DataQualityClassEnum.NUMERICAL.value:
+                statistics_plan.profiled_columns.append(column_name)
+            elif data_quality_class == DataQualityClassEnum.CATEGORICAL.value:
+                statistics_plan.value_counted_columns.append(column_name)
+
+        return statistics_plan
+
+    @staticmethod
+    def _get_annotation(annotation_getter):
+        try:
+            annotation = annotation_getter()
+        except (AttributeError, KeyError):
+            return None
+        return annotation.strip().lower()
+
+
+class ColumnProfileAccumulator:
+    """
+    ColumnProfile of one column built chunk by chunk: count, extremes, merged central
+    moments and a median over values spilled to disk. Extremes follow Series.min/max
+    of the whole column, including the TypeError of strings mixed with missing values
+    or with numbers, as the parser types a column that is numeric in some chunks only.
+    """
+
+    def __init__(self, spill_file_path, median_error_bound=None):
+        self._count = 0
+        self._central_moments = CentralMoments()
+        self._median = MedianAccumulator(spill_file_path, median_error_bound)
+        self._min = None
+        self._max = None
+        self._extremes_error = None
+        self._has_float_chunks = False
+        self._has_object_chunks = False
+
+    def add_values(self, column: pd.Series) -> None:
+        self._count += column.count()
+        if pd.api.types.is_numeric_dtype(column):
+            numeric_column = column
+        else:
+            numeric_column = pd.to_numeric(column, errors='coerce')
+            self._has_object_chunks = True
+
+        values = numeric_column.to_numpy()
+        if values.dtype.kind not in 'iuf':
+            values = numeric_column.to_numpy(dtype='f8', na_value=np.nan)
+        self._central_moments = self._central_moments.merge(CentralMoments.from_values(values))
+        valid_values = values[~np.isnan(values)] if values.dtype.kind == 'f' else values
+        self._median.add_values(valid_values.astype('f8'))
+
+        if numeric_column is column:
+            self._has_float_chunks = self._has_float_chunks or values.dtype.kind == 'f'
+            if valid_values.size != 0:
+                self._update_extremes(valid_values.min(), valid_values.max())
+        elif self._extremes_error == None:
+            try:
+                self._update_extremes(column.min(), column.max())
+            except TypeError as error:
+                self._extremes_error = error
+
+    def _update_extremes(self, chunk_min, chunk_max) -> None:
+        if self._min is None:
+            self._min, self._max = chunk_min, chunk_max
+            return
+        try:
+            self._min = min(self._min, chunk_min)
+            self._max = max(self._max, chunk_max)
+        except TypeError as error:
+            self._extremes_error = error
+
+    def get_column_profile(self, num_rows) -> tuple:
+        """ColumnProfile of the column and the error its extremes raise, if any."""
+        column_profile = ColumnProfile(count=np.int64(self._count), mean=self._central_moments.mean)
+        if self._central_moments.count != 0:
+            column_profile.median = self._median.median()
+            column_profile.median_mode = self._median.mode
+            column_profile.std_dev = self._central_moments.std_dev()
+            column_profile.skewness = self._central_moments.skewness()
+            column_profile.kurtosis = self._central_moments.kurtosis()
+
+        extremes_error = self._extremes_error
+        if self._has_object_chunks and self._count < num_rows and extremes_error == None:
+            # A column of strings with missing values cannot be ordered
+            extremes_error = TypeError("'<' not supported between instances of 'float' and 'str'")
+        if extremes_error == None and self._min is not None:
+            column_profile.min, column_profile.max = self._min, self._max
+            if self._has_float_chunks and not self._has_object_chunks:
+                # Chunks of integers are floats in a column that has missing values
+                column_profile.min, column_profile.max = np.float64(self._min), np.float64(self._max)
+
+        return column_profile, extremes_error
+
+
+class StreamingDatasetFile:
+    """
+    Statistics of a data file gathered in one chunked pass over it, behind the
+    statistics methods of DatasetFile. The pass runs on first use; medians and large
+    value counts spill to a temporary directory that is removed once it is done.
+    With a median error bound, medians of large columns come from a quantile sketch.
+    Columns with more categories than the category cap have their most frequent ones
+    estimated by a heavy hitters summary; without a cap every category is counted.
+    """
+
+    def __init__(self, dataset_file_path, delimiter, read_plan=None, statistics_plan=None,
+                 chunk_rows=STATISTICS_CHUNK_ROWS, spill_directory_path=None, median_error_bound=None,
+                 category_cap=CATEGORY_CAP):
+        self._dataset_file_path = dataset_file_path
+        self._table_name = os.path.basename(dataset_file_path)
+        self._delimiter = delimiter
+        self._read_plan = read_plan
+        self._statistics_plan = statistics_plan if statistics_plan != None else StatisticsPlan()
+        self._chunk_rows = chunk_rows
+        self._spill_directory_path = spill_directory_path
+        self._median_error_bound = median_error_bound
+        self._category_cap = category_cap
+        self._data_order = None
+        self._num_rows = None
+        self._counts = {}
+        self._column_profiles = {}
+        self._extremes_errors = {}
+        self._value_counts = {}
+        self._category_profiles = {}
+
+    @property
+    def data_column_order(self):
+        self._scan_once()
+        return self._data_order
+
+    @property
+    def table_name(self):
+        return self._table_name
+
+    @property
+    def dataframe_library(self) -> str:
+        return "Pandas"
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.data_column_order)
+
+    @property
+    def num_rows(self) -> int:
+        self._scan_once()
+        return self._num_rows
+
+    def get_dataset_table_name(self) -> str:
+        return os.path.basename(self._table_name)
+
+    def count(self, column_name: str) -> int:
+        self._scan_once()
+        return self._counts[column_name]
+
+    def value_counts(self, column_name: str) -> pd.Series:
+        if column_name not in self._value_counts:
+            self._scan_column(column_name)
+        return self._value_counts[column_name]
+
+    def category_profile(self, column_name: str) -> CategoryProfile:
+        if column_name not in self._category_profiles:
+            self._scan_column(column_name)
+        return self._category_profiles[column_name]
+
+    def profile(self, column_name: str) -> ColumnProfile:
+        if column_name not in self._column_profiles:
+            self._scan_column(column_name)
+        if self._extremes_errors[column_name] != None:
+            raise self._extremes_errors[column_name]
+        return self._column_profiles[column_name]
+
+    def min(self, column_name: str) -> float:
+        return self.profile(column_name).min
+
+    def max(self, column_name: str) -> float:
+        return self.profile(column_name).max
+
+    def std_dev(self, column_name: str) -> float:
+        return self._get_unordered_statistic(column_name, 'std_dev')
+
+    def mean(self, column_name: str) -> float:
+        return self._get_unordered_statistic(column_name, 'mean')
+
+    def median(self, column_name: str) -> float:
+        return self._get_unordered_statistic(column_name, 'median')
+
+    def median_mode(self, column_name: str) -> str:
+        return self._get_unordered_statistic(column_name, 'median_mode')
+
+    def skewness(self, column_name: str) -> float:
+        return self._get_unordered_statistic(column_name, 'skewness')
+
+    def kurtosis(self, column_name: str) -> float:
+        return self._get_unordered_statistic(column_name, 'kurtosis')
+
+    def _get_unordered_statistic(self, column_name, statistic_name):
+        # Statistics of the numeric view, available when the extremes are not
+        if column_name not in self._column_profiles:
+            self._scan_column(column_name)
+        return getattr(self._column_profiles[column_name], statistic_name)
+
+    def _scan_once(self) -> None:
+        if self._num_rows == None:
+            self._scan(self._statistics_plan)
+
+    def _scan_column(self, column_name) -> None:
+        # A column the plan left out gets a pass of its own
+        self._scan_once()
+        if column_name not in self._data_order:
+            raise KeyError(column_name)
+        if column_name not in self._column_profiles or column_name not in self._value_counts:
+            self._scan(StatisticsPlan(profiled_columns=[column_name], value_counted_columns=[column_name]))
+
+    def _scan(self, statistics_plan) -> None:
+        if self._read_plan != None and not self._read_plan.is_empty and not is_columnar_data_file(self._dataset_file_path):
+            try:
+                self._scan_chunks(self._read_chunks(self._read_plan, statistics_plan), statistics_plan)
+                return
+            except (ValueError, TypeError) as error:
+                warnings.warn("Typed read of '{}' failed, falling back to inferred dtypes: {}".format(self._dataset_file_path, error))
+            self._scan_chunks(self._read_chunks(None, statistics_plan), statistics_plan)
+            return
+        self._scan_chunks(self._read_chunks(self._read_plan, statistics_plan), statistics_plan)
+
+    def _read_chunks(self, read_plan, statistics_plan):
+        """
+        Yields the column names to be read and the names of those read as strings, then
+        the chunks of the file. The parser types each chunk on its own, so value counted
+        columns the read plan does not type are read as strings for every chunk to count
+        the same values; columnar files keep the types they were written with.
+        """
+        planned_read_csv_arguments = {}
+        if read_plan != None and not read_plan.is_empty:
+            planned_read_csv_arguments = read_plan.get_read_csv_arguments(read_data_file_columns(self._dataset_file_path, self._delimiter))
+
+        if is_columnar_data_file(self._dataset_file_path):
+            column_names = planned_read_csv_arguments.get('usecols', read_data_file_columns(self._dataset_file_path))
+            yield column_names, []
+            for chunk in iterate_columnar_data_file(self._dataset_file_path, column_names, self._chunk_rows):
+                parse_columnar_dates(chunk, planned_read_csv_arguments.get('parse_dates', []))
+                yield chunk
+            return
+
+        column_names = planned_read_csv_arguments.get('usecols', read_data_file_columns(self._dataset_file_path, self._delimiter))
+        dtype = dict(planned_read_csv_arguments.get('dtype', {}))
+        string_column_names = [column_name for column_name in column_names if statistics_plan.counts_values(column_name)
+                               and column_name not in dtype and column_name not in planned_read_csv_arguments.get('parse_dates', [])]
+        dtype.update({column_name: str for column_name in string_column_names})
+        planned_read_csv_arguments['dtype'] = dtype
+        yield column_names, string_column_names
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', pd.errors.DtypeWarning)
+            with pd.read_csv(self._dataset_file_path, delimiter=self._delimiter, na_values=['inf', '-inf'],
+                             chunksize=self._chunk_rows, **planned_read_csv_arguments) as chunk_reader:
+                for chunk in chunk_reader:
+                    if read_plan != None:
+                        read_plan.normalize_dtypes(chunk)
+                    yield chunk
+
+    def _scan_chunks(self, chunks, statistics_plan) -> None:
+        spill_directory_path = tempfile.mkdtemp(prefix='statistics_', dir=self._spill_directory_path)
+        try:
+            data_order, string_column_names = next(chunks)
+            data_order = list(data_order)
+            profile_accumulators = {}
+            frequency_accumulators = {}
+            for column_index, column_name in enumerate(data_order):
+                if statistics_plan.profiles(column_name):
+                    profile_accumulators[column_name] = ColumnProfileAccumulator(
+                        os.path.join(spill_directory_path, 'values_{}'.format(column_index)), self._median_error_bound)
+                if statistics_plan.counts_values(column_name):
+                    frequency_accumulators[column_name] = FrequencyAccumulator(
+                        os.path.join(spill_directory_path, 'counts_{}'.format(column_index)), self._category_cap)
+
+            num_rows = 0
+            counts = {column_name: 0 for column_name in data_order}
+            for chunk in chunks:
+                string_chunk = chunk[string_column_names]
+                for column_name in string_column_names:
+                    if column_name in profile_accumulators:
+                        # The profile takes the values as the parser would have typed this chunk
+                        chunk[column_name] = parse_data_values(chunk[column_name])
+                replace_infinite_values(chunk)
+                num_rows += len(chunk.index)
+                for column_name in data_order:
+                    counts[column_name] += chunk[column_name].count()
+                for column_name, profile_accumulator in profile_accumulators.items():
+                    profile_accumulator.add_values(chunk[column_name])
+                for column_name, frequency_accumulator in frequency_accumulators.items():
+                    frequency_accumulator.add_values(string_chunk[column_name] if column_name in string_column_names else chunk[column_name])
+
+            for column_name, profile_accumulator in profile_accumulators.items():
+                column_profile, extremes_error = profile_accumulator.get_column_profile(num_rows)
+                self._column_profiles[column_name] = column_profile
+                self._extremes_errors[column_name] = extremes_error
+            for column_name, frequency_accumulator in frequency_accumulators.items():
+                parse_values = self._get_value_parser(column_name, string_column_names, counts[column_name] < num_rows)
+                self._value_counts[column_name] = frequency_accumulator.value_counts(column_name, parse_values)
+                self._category_profiles[column_name] = frequency_accumulator.category_profile(column_name, parse_values)
+                if column_name in string_column_names and column_name not in profile_accumulators:
+                    # Infinite values of a column typed as numbers are missing values, not counted
+                    num_infinite_values = frequency_accumulator.value_counts().sum() - self._value_counts[column_name].sum()
+                    counts[column_name] -= int(num_infinite_values)
+        finally:
+            shutil.rmtree(spill_directory_path, ignore_errors=True)
+
+        self._data_order = pd.Index(data_order)
+        self._num_rows = num_rows
+        self._counts = counts
+
+    def _get_value_parser(self, column_name, string_column_names, has_missing_values):
+        # The counted values typed as the whole column is by the in memory read
+        planned_dtype = self._read_plan.dtypes.get(column_name) if self._read_plan != None else None
+        if column_name in string_column_names:
+            def parse_values(values):
+                parsed_values = pd.Index(parse_data_values(pd.Series(values, dtype=object)))
+                if has_missing_values and parsed_values.dtype.kind in 'iub':
+                    # Integers with missing values are floats, booleans are objects
+                    parsed_values = parsed_values.astype('float64' if parsed_values.dtype.kind in 'iu' else object)
+                if parsed_values.dtype.kind == 'f':
+                    parsed_values = parsed_values.where(~np.isinf(parsed_values))
+                return parsed_values
+            return parse_values
+        if planned_dtype == 'Int64':
+            # normalize_dtypes makes each chunk integers or floats on its own
+            return lambda values: values.astype('float64' if has_missing_values else 'int64')
+        return None
+
+
+class StreamingDataset:
+
+    def __init__(self):
+        self._dataset_files = {}
+
+    @property
+    def dataset_files(self):
+        for dataset_file_name, dataset_file in self._dataset_files.items():
+            yield dataset_file_name, dataset_file
+
+    def add_dataset_file(self, dataset_file_path, delimiter, read_plan=None, statistics_plan=None,
+                         chunk_rows=STATISTICS_CHUNK_ROWS, spill_directory_path=None, median_error_bound=None):
+        self._dataset_files[Dataset.get_dataset_file_name(dataset_file_path)] = StreamingDatasetFile(
+            dataset_file_path, delimiter, read_plan, statistics_plan, chunk_rows, spill_directory_path, median_error_bound)
+
+    def get_dataset_file(self, file_name):
+        return self._dataset_files[file_name]
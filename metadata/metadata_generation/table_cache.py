@@ -0,0 +1,144 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os, pickle, shutil, tempfile
+import hashlib
+import warnings
+import numpy as np
+import pandas as pd
+
+from dataclasses import asdict
+
+
+"""
+    On-disk cache of parsed data files. Each parsed table is stored as one .npy file
+    per column so later runs can memory map the columns instead of parsing the CSV.
+    Numeric, boolean and datetime columns are mapped as they are, string and
+    categorical columns are stored as mapped integer codes plus their unique values.
+    Entries are keyed by the file size, mtime, content hash and the read options.
+"""
+
+TABLE_CACHE_FORMAT_VERSION = 1
+CONTENT_HASH_CHUNK_BYTES = 2**22
+MANIFEST_FILE_NAME = 'manifest.pkl'
+
+
+class ParsedTableCache:
+
+    def __init__(self, cache_directory_path):
+        self._cache_directory_path = cache_directory_path
+        os.makedirs(cache_directory_path, exist_ok=True)
+
+    @property
+    def cache_directory_path(self):
+        return self._cache_directory_path
+
+    def get_cache_key(self, dataset_file_path, read_options) -> str:
+        file_stat = os.stat(dataset_file_path)
+        content_hash = hashlib.blake2b()
+        with open(dataset_file_path, 'rb') as dataset_file:
+            for chunk in iter(lambda: dataset_file.read(CONTENT_HASH_CHUNK_BYTES), b''):
+                content_hash.update(chunk)
+
+        cache_key = hashlib.blake2b(digest_size=20)
+        for key_part in [TABLE_CACHE_FORMAT_VERSION, pd.__version__, file_stat.st_size, file_stat.st_mtime_ns,
+                         content_hash.hexdigest(), ParsedTableCache._read_options_repr(read_options)]:
+            cache_key.update(repr(key_part).encode())
+        return cache_key.hexdigest()
+
+    def load(self, cache_key) -> pd.DataFrame | None:
+        entry_directory_path = os.path.join(self._cache_directory_path, cache_key)
+        manifest_file_path = os.path.join(entry_directory_path, MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_file_path):
+            return None
+
+        try:
+            with open(manifest_file_path, 'rb') as manifest_file:
+                manifest = pickle.load(manifest_file)
+            columns = {}
+            for column_index, column_kind in enumerate(manifest['column_kinds']):
+                columns[column_index] = ParsedTableCache._load_column(entry_directory_path, column_index, column_kind)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as error:
+            warnings.warn("Ignoring unreadable table cache entry '{}': {}".format(entry_directory_path, error))
+            return None
+
+        # copy=False keeps the memory mapped columns as separate, uncopied blocks
+        df = pd.DataFrame(columns, index=pd.RangeIndex(manifest['num_rows']), copy=False)
+        df.columns = manifest['columns']
+        return df
+
+    def store(self, cache_key, df: pd.DataFrame) -> None:
+        entry_directory_path = os.path.join(self._cache_directory_path, cache_key)
+        if os.path.exists(entry_directory_path):
+            return
+
+        # Written to a temporary directory first so a partially written entry is never loaded
+        staging_directory_path = tempfile.mkdtemp(prefix=cache_key + '.', dir=self._cache_directory_path)
+        try:
+            column_kinds = []
+            for column_index in range(len(df.columns)):
+                column_kinds.append(ParsedTableCache._store_column(staging_directory_path, column_index, df.iloc[:, column_index]))
+            manifest = {'columns': df.columns, 'num_rows': len(df.index), 'column_kinds': column_kinds}
+            with open(os.path.join(staging_directory_path, MANIFEST_FILE_NAME), 'wb') as manifest_file:
+                pickle.dump(manifest, manifest_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.rename(staging_directory_path, entry_directory_path)
+        except OSError as error:
+            if not os.path.exists(entry_directory_path):
+                warnings.warn("Could not write table cache entry '{}': {}".format(entry_directory_path, error))
+        finally:
+            shutil.rmtree(staging_directory_path, ignore_errors=True)
+
+    @staticmethod
+    def _store_column(entry_directory_path, column_index, column: pd.Series) -> str:
+        column_file_path = os.path.join(entry_directory_path, str(column_index))
+
+        if isinstance(column.dtype, np.dtype) and column.dtype != object:
+            np.save(column_file_path + '.npy', column.to_numpy())
+            return 'array'
+
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            np.save(column_file_path + '.npy', column.cat.codes.to_numpy())
+            ParsedTableCache._pickle(column_file_path + '.pkl', column.dtype)
+            return 'category'
+
+        # Only pure string columns are factorized, factorize treats 1, 1.0 and True as equal
+        if pd.api.types.infer_dtype(column, skipna=True) in ['string', 'empty']:
+            # Factorizing the values rather than the Series gives arrays instead of an Index, take fills -1 with NA
+            values = column.to_numpy() if column.dtype == object else column.array
+            codes, uniques = pd.factorize(values, use_na_sentinel=True)
+            np.save(column_file_path + '.npy', codes)
+            ParsedTableCache._pickle(column_file_path + '.pkl', uniques)
+            return 'factorized'
+
+        ParsedTableCache._pickle(column_file_path + '.pkl', column)
+        return 'pickle'
+
+    @staticmethod
+    def _load_column(entry_directory_path, column_index, column_kind):
+        column_file_path = os.path.join(entry_directory_path, str(column_index))
+        # Copy on write, the loaded table is modified in place later on. Viewed as plain
+        # arrays so the columns do not carry the memmap subclass around.
+        if column_kind == 'array':
+            return np.load(column_file_path + '.npy', mmap_mode='c').view(np.ndarray)
+
+        with open(column_file_path + '.pkl', 'rb') as column_file:
+            column_values = pickle.load(column_file)
+        if column_kind == 'category':
+            codes = np.load(column_file_path + '.npy', mmap_mode='r').view(np.ndarray)
+            return pd.Categorical.from_codes(codes, dtype=column_values)
+        if column_kind == 'factorized':
+            codes = np.load(column_file_path + '.npy', mmap_mode='r').view(np.ndarray)
+            return pd.api.extensions.take(column_values, codes, allow_fill=True)
+        return column_values.to_numpy() if isinstance(column_values.dtype, np.dtype) else column_values.array
+
+    @staticmethod
+    def _pickle(file_path, value):
+        with open(file_path, 'wb') as pickle_file:
+            pickle.dump(value, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read_options_repr(read_options) -> str:
+        read_options = dict(read_options)
+        read_plan = read_options.get('read_plan')
+        if read_plan != None:
+            read_options['read_plan'] = asdict(read_plan)
+        return repr(sorted(read_options.items()))
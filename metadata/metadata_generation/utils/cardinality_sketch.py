@@ -0,0 +1,83 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pandas as pd
+
+
+"""
+    HyperLogLog distinct count sketch (Flajolet et al. 2007). Each value is hashed to 64
+    bits; the first bits pick a register, which keeps the longest run of leading zeros
+    seen in the rest of the hashes sent to it. The harmonic mean of the registers
+    estimates the number of distinct values with a relative standard error of about
+    1.04 / sqrt(number of registers). Sketches of chunks or workers merge register by
+    register into the sketch of all of their values.
+"""
+
+DEFAULT_PRECISION = 14
+_HASH_BITS = 64
+
+
+def hash_values(values) -> np.ndarray:
+    """
+    64 bit hashes of the values, numbers hashed as floats so a value hashes the same in
+    a chunk of integers and in a chunk of floats.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        values = values.astype(np.float64)
+    elif values.dtype.kind not in 'fmM':
+        values = values.astype(object)
+    return pd.util.hash_array(values, categorize=False)
+
+
+class HyperLogLog:
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        if precision < 4 or precision > 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18: {}".format(precision))
+        self._precision = precision
+        self._registers = np.zeros(2**precision, dtype=np.uint8)
+
+    @property
+    def num_registers(self) -> int:
+        return len(self._registers)
+
+    def update(self, values) -> None:
+        self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return
+        register_indices = (hashes >> np.uint64(_HASH_BITS - self._precision)).astype(np.intp)
+        # A guard bit below the remaining bits caps the rank when they are all zero
+        remaining_bits = (hashes << np.uint64(self._precision)) | np.uint64(1 << (self._precision - 1))
+        ranks = _count_leading_zeros(remaining_bits) + 1
+        np.maximum.at(self._registers, register_indices, ranks)
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        if other._precision != self._precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of precision {} and {}".format(self._precision, other._precision))
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> float:
+        num_registers = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        raw_estimate = alpha * num_registers**2 / np.sum(np.ldexp(1.0, -self._registers.astype(np.int64)))
+        num_empty_registers = int(np.count_nonzero(self._registers == 0))
+        if raw_estimate <= 2.5 * num_registers and num_empty_registers != 0:
+            # Linear counting is the better estimate while registers are still empty
+            return num_registers * np.log(num_registers / num_empty_registers)
+        return raw_estimate
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    # Binary search on the position of the highest set bit of every value at once
+    values = values.copy()
+    counts = np.zeros(len(values), dtype=np.uint8)
+    for shift in [32, 16, 8, 4, 2, 1]:
+        high_bits_zero = (values >> np.uint64(_HASH_BITS - shift)) == 0
+        counts[high_bits_zero] += shift
+        values[high_bits_zero] <<= np.uint64(shift)
+    counts[values == 0] += 1
+    return counts
@@ -0,0 +1,183 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import gzip, bz2
+import numpy as np
+import pandas as pd
+
+
+"""
+    Data files are delimited text, optionally compressed (.csv.gz, .csv.bz2, .csv.zst),
+    or columnar (.parquet, .feather). Compressed text is decompressed while it is
+    streamed, columnar files are read through pyarrow with only the requested columns.
+    zstd needs the optional zstandard package, the columnar formats need pyarrow.
+"""
+
+DELIMITED_EXTENSIONS = ['.csv', '.tsv']
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.zst': 'zstd'}
+COLUMNAR_EXTENSIONS = ['.parquet', '.feather']
+COMPRESSED_DELIMITED_EXTENSIONS = [delimited_extension + compression_extension
+                                   for delimited_extension in DELIMITED_EXTENSIONS
+                                   for compression_extension in COMPRESSION_EXTENSIONS]
+DATA_FILE_EXTENSIONS = DELIMITED_EXTENSIONS + COMPRESSED_DELIMITED_EXTENSIONS + COLUMNAR_EXTENSIONS
+# Every tabular format looked for in a data directory, compressed variants last so plain files keep their order
+TABULAR_FILE_EXTENSIONS = ['.csv', '.tsv', '.xlsx', '.xls', '.parquet',
+                           '.json', '.jsonl', '.feather', '.orc', '.avro'] + COMPRESSED_DELIMITED_EXTENSIONS
+
+
+def get_data_file_extension(file_name) -> str | None:
+    # Longest match first so trips.csv.gz is .csv.gz rather than .gz
+    for extension in sorted(DATA_FILE_EXTENSIONS, key=len, reverse=True):
+        if file_name.lower().endswith(extension):
+            return extension
+    return None
+
+
+def is_data_file(file_name) -> bool:
+    return get_data_file_extension(file_name) != None
+
+
+def strip_data_file_extension(file_name) -> str:
+    extension = get_data_file_extension(file_name)
+    if extension == None:
+        return os.path.splitext(file_name)[0]
+    return file_name[:-len(extension)]
+
+
+def get_data_file_names(directory_path) -> list:
+    return [file_name for file_name in os.listdir(directory_path)
+            if is_data_file(file_name) and os.path.isfile(os.path.join(directory_path, file_name))]
+
+
+def get_compression(file_name) -> str | None:
+    extension = get_data_file_extension(file_name)
+    if extension == None:
+        return None
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(extension)[1])
+
+
+def is_columnar_data_file(file_name) -> bool:
+    return get_data_file_extension(file_name) in COLUMNAR_EXTENSIONS
+
+
+def open_data_file(file_path, mode='rb', **kwargs):
+    """
+    Opens a delimited data file, (de)compressing on the fly according to its extension.
+    Extra keyword arguments (encoding, newline) only apply to text modes.
+    """
+    compression = get_compression(file_path)
+    if compression == 'gzip':
+        return gzip.open(file_path, mode, **kwargs)
+    if compression == 'bz2':
+        return bz2.open(file_path, mode, **kwargs)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as error:
+            raise ImportError("Reading and writing .zst data files requires the zstandard package") from error
+        return zstandard.open(file_path, mode, **kwargs)
+    return open(file_path, mode, **kwargs)
+
+
+def read_data_file_columns(file_path, delimiter=',') -> list:
+    if not is_columnar_data_file(file_path):
+        return list(pd.read_csv(file_path, delimiter=delimiter, nrows=0).columns)
+    # Stored pandas indexes come back as index columns rather than data columns, named
+    # ones first like the reset index of read_columnar_data_file
+    schema = _get_columnar_schema(file_path)
+    index_column_names = [column_name for column_name in (schema.pandas_metadata or {}).get('index_columns', [])
+                          if isinstance(column_name, str) and not column_name.startswith('__index_level_')]
+    return index_column_names + [column_name for column_name in schema.names
+                                 if column_name not in index_column_names and not column_name.startswith('__index_level_')]
+
+
+def read_columnar_data_file(file_path, columns=None) -> pd.DataFrame:
+    if get_data_file_extension(file_path) == '.parquet':
+        df = pd.read_parquet(file_path, columns=columns)
+    else:
+        df = pd.read_feather(file_path, columns=columns)
+    # A stored index is data like any other column, the pipeline labels rows by position
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        df = df.reset_index(drop=all(index_name == None for index_name in df.index.names))
+    return _replace_missing_strings(df)
+
+
+def iterate_columnar_data_file(file_path, columns=None, batch_rows=2**20):
+    """
+    Reads a columnar data file as DataFrames of at most batch_rows rows, with the
+    columns read_columnar_data_file would return, without reading the whole file.
+    """
+    if columns == None:
+        columns = read_data_file_columns(file_path)
+    if get_data_file_extension(file_path) == '.parquet':
+        from pyarrow import parquet
+        batches = parquet.ParquetFile(file_path).iter_batches(batch_size=batch_rows, columns=columns)
+    else:
+        batches = _read_feather_table(file_path).select(columns).to_batches(max_chunksize=batch_rows)
+    for batch in batches:
+        # Stored indexes are plain columns here, their pandas metadata describes the whole file
+        yield _replace_missing_strings(batch.to_pandas(ignore_metadata=True)[columns])
+
+
+def count_columnar_data_file_rows(file_path) -> int:
+    if get_data_file_extension(file_path) == '.parquet':
+        from pyarrow import parquet
+        return parquet.ParquetFile(file_path).metadata.num_rows
+    return _read_feather_table(file_path).num_rows
+
+
+def take_columnar_data_file_rows(file_path, row_indices):
+    """
+    Reads the rows at the given sorted positions as a pyarrow Table. Parquet files
+    only read the row groups holding one of the rows.
+    """
+    if get_data_file_extension(file_path) != '.parquet':
+        return _read_feather_table(file_path).take(row_indices)
+
+    from pyarrow import parquet
+    parquet_file = parquet.ParquetFile(file_path)
+    row_group_sizes = [parquet_file.metadata.row_group(row_group).num_rows for row_group in range(parquet_file.num_row_groups)]
+    row_group_starts = np.concatenate(([0], np.cumsum(row_group_sizes)))
+    row_groups = np.unique(np.searchsorted(row_group_starts, row_indices, side='right') - 1)
+    if len(row_groups) == 0:
+        return parquet_file.schema_arrow.empty_table()
+    table = parquet_file.read_row_groups(row_groups.tolist())
+    # Positions within the concatenation of the row groups that were read
+    read_row_group_starts = np.concatenate(([0], np.cumsum(np.asarray(row_group_sizes)[row_groups])))
+    row_group_positions = np.searchsorted(row_group_starts, row_indices, side='right') - 1
+    local_indices = (row_indices - row_group_starts[row_group_positions]
+                     + read_row_group_starts[np.searchsorted(row_groups, row_group_positions)])
+    return table.take(local_indices)
+
+
+def write_columnar_data_file(file_path, data) -> None:
+    import pyarrow as pa
+
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    if get_data_file_extension(file_path) == '.parquet':
+        from pyarrow import parquet
+        parquet.write_table(table, file_path)
+    else:
+        from pyarrow import feather
+        feather.write_feather(table, file_path)
+
+
+def _replace_missing_strings(df) -> pd.DataFrame:
+    # Missing strings come back as None, the CSV parser reads them as NaN
+    object_columns = df.columns[df.dtypes == object]
+    if len(object_columns) != 0:
+        df[object_columns] = df[object_columns].where(df[object_columns].notna(), np.nan)
+    return df
+
+
+def _get_columnar_schema(file_path):
+    if get_data_file_extension(file_path) == '.parquet':
+        from pyarrow import parquet
+        return parquet.read_schema(file_path)
+    return _read_feather_table(file_path).schema
+
+
+def _read_feather_table(file_path):
+    # Memory mapped, the columns are only read when they are used
+    from pyarrow import feather
+    return feather.read_table(file_path, memory_map=True)
@@ -2,6 +2,7 @@
 
 import re
 import numpy as np
+import pandas as pd
 
 
 def convert_string_to_bool(bool_string):
@@ -50,6 +51,40 @@ def is_numeric_integer(value):
 def convert_string_to_int(value):
     return int(round(float(value)))
 
+def convert_integer_values(values) -> np.ndarray:
+    """
+    Object array of the values with every integer valued number or numeric string, as
+    is_string_integer finds them, replaced by convert_string_to_int of it. Dates and
+    other values that are not numbers are left as they are.
+    """
+    values = pd.Index(values)
+    converted_values = np.asarray(values, dtype=object).copy()
+    if values.dtype.kind in 'mM' or isinstance(values.dtype, (pd.DatetimeTZDtype, pd.PeriodDtype)):
+        return converted_values
+
+    try:
+        # Each value through float, as is_string_integer does, when they all are numbers
+        numbers = converted_values.astype(np.float64)
+    except (ValueError, TypeError, OverflowError):
+        numbers = np.asarray(pd.to_numeric(converted_values, errors='coerce'), dtype=np.float64)
+        for position in np.flatnonzero(np.isnan(numbers)):
+            # float also reads 1_000 and digits of other scripts, to_numeric does not
+            value = converted_values[position]
+            if isinstance(value, str) and ('_' in value or not value.isascii()):
+                try:
+                    numbers[position] = float(value)
+                except ValueError:
+                    pass
+
+    integer_mask = np.isfinite(numbers)
+    integer_mask[integer_mask] = numbers[integer_mask] == np.round(numbers[integer_mask])
+    integer_numbers = numbers[integer_mask]
+    int64_mask = np.abs(integer_numbers) < 2.0**63
+    integers = np.where(int64_mask, integer_numbers, 0).astype(np.int64).astype(object)
+    integers[~int64_mask] = [int(number) for number in integer_numbers[~int64_mask]]
+    converted_values[integer_mask] = integers
+    return converted_values
+
 
 def int_to_multiples_of_2(original_int: int, highest_bit: int) -> str:
     bit_string = format(original_int, str(highest_bit) + 'b')
@@ -3,12 +3,17 @@
 from ..utils.file_system_tools import FullFileNameFinder
 from ..utils.file_iterator import MetadataIterator
 from ..utils.file_parsing import MetadataTableParser
+from ..utils.statistics import EXACT_FREQUENCIES, TOP_FREQUENCIES, APPROXIMATE_FREQUENCIES
 from collections import Counter
 
-import pandas as pd
 import os
 
 
+# Frequency list modes from the most complete to the least, and the fields of the categories a truncated list leaves out
+FREQUENCY_MODES = [EXACT_FREQUENCIES, TOP_FREQUENCIES, APPROXIMATE_FREQUENCIES]
+OTHER_CATEGORIES_FIELDS = ['otherCategories', 'otherFrequencyN', 'otherFrequencyPercent']
+
+
 class DictAggregator:
 
     def __init__(self) -> None:
@@ -170,6 +175,8 @@ class DataQualityAggregation():
         self.__units = DictAggregator()
         self.__descriptions = DictAggregator()
         self.__frequencies = DictAggregator()
+        self.__modes = DictAggregator()
+        self.__others = DictAggregator()
 
     def add_quality(self, attribute_qualities) -> None:
         for quality in attribute_qualities:
@@ -182,6 +189,11 @@ class DataQualityAggregation():
             if 'frequencies' in quality.keys():
                 self.__frequencies.add_dict(
                     name, [quality['frequencies']])
+            if 'mode' in quality.keys():
+                self.__modes.add_dict(name, [quality['mode']])
+                for field in OTHER_CATEGORIES_FIELDS:
+                    # Lists of every category leave none out
+                    self.__others.add_dict((name, field), quality.get(field, 0))
 
     def get_data_quality_aggregate(self) -> list[dict]:
         output_data_qualities = list()
@@ -197,6 +209,13 @@ class DataQualityAggregation():
                 for frequency in self.__frequencies[name]:
                     frequency_aggregation.add_frequencies(frequency)
                 output_data_quality['frequencies'] = frequency_aggregation.get_frequency_aggregation()
+            if name in self.__modes.keys():
+                # One truncated list leaves the group's list truncated too
+                mode = max(self.__modes[name], key=FREQUENCY_MODES.index)
+                output_data_quality['mode'] = mode
+                if mode != EXACT_FREQUENCIES:
+                    for field in OTHER_CATEGORIES_FIELDS:
+                        output_data_quality[field] = self.__others[(name, field)] / len(self.__modes[name])
             output_data_qualities.append(output_data_quality)
         return output_data_qualities
 
@@ -349,7 +368,7 @@ class FileGrouping:
         grouping = 0
 
         for sheet_name in excel_annotations.sheet_names:
-            data = pd.read_excel(excel_annotations, sheet_name=sheet_name)
+            data = excel_annotations.get_sheet(sheet_name)
             found_names = False
             if "Files" in data.columns:
                 for file_name in data["Files"]:
@@ -14,6 +14,7 @@ class JSONIndexIterator:
             metadata = load_json(metadata_file_path)
         elif metadata == None: 
             raise ValueError('No metadata file path or metadata passed to JSONIndexIterator')
+        self.__metadata = metadata
         self.__metadata_iterator = MetadataIterator(metadata)
 
     def iterate(self):
@@ -22,6 +23,11 @@ class JSONIndexIterator:
                 JSON_index = JSONIndex(table_metadata_index, attribute_metadata_index)
                 yield JSON_index   
 
+    def iterate_table_attributes(self, table_metadata_index):
+        number_of_attributes = len(self.__metadata['objects'][table_metadata_index]['attributes'])
+        for attribute_metadata_index in range(number_of_attributes):
+            yield JSONIndex(table_metadata_index, attribute_metadata_index)
+
     def iterate_tables(self):
          for table_metadata_index in self.__metadata_iterator.iterate_table():
             yield table_metadata_index      
@@ -64,6 +70,10 @@ class MetadataIterator:
         for frequency in frequencies:
             yield (frequency['name'], frequency['frequencyN'], frequency['frequencyPercent'])
 
+    def count_other_categories(self):
+        # Categories a truncated frequency list leaves out
+        return self.__current_data_quality_metric.get('otherCategories', 0)
+
     def __get_attributes(self):
         attributes = self.__metadata['objects'][self.__current_table_index]['attributes']
         return attributes
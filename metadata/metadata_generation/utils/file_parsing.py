@@ -128,6 +128,13 @@ class MetadataAttributeParser:
         for frequency in frequencies:
             yield (frequency['name'], frequency['frequencyPercent'])
 
+    def lists_every_category(self) -> bool:
+        # Truncated frequency lists say so in their mode, LLMDs from before it list every category
+        assert self.in_data_quality_metrics('Number of Categories')
+        for metric in self.__attribute['dataQuality']:
+            if metric['name'] == 'Number of Categories':
+                return metric.get('mode', 'exact') == 'exact'
+
 
 class MetadataDataQualityMetricParser:
 
@@ -1,91 +1,536 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
-import argparse
 import os
-import glob
-import math
-import random
-import time
+import json
+import mmap
+import zlib
 import multiprocessing
+import numpy as np
+import pandas as pd
+
+from dataclasses import dataclass, field
+
+from ..annotations_store import AnnotationsStore
+from ..utils.file_system_tools import FullFileNameFinder
+from ..utils.data_file_formats import (
+    count_columnar_data_file_rows,
+    get_compression,
+    get_data_file_names,
+    is_columnar_data_file,
+    open_data_file,
+    read_columnar_data_file,
+    strip_data_file_extension,
+    take_columnar_data_file_rows,
+    write_columnar_data_file,
+)
+from ..veritas.datatypes import DataQualityClassEnum
+
+
+NEWLINE_BYTE = ord('\n')
+QUOTE_BYTE = ord('"')
+# Bytes scanned for record boundaries at a time
+SCAN_CHUNK_BYTES = 2**26
+# Rows read at a time by the key consistent sampler
+SAMPLING_CHUNK_ROWS = 2**18
+PRIMARY_KEY_CLASSES = [
+    DataQualityClassEnum.PRIMARY_KEY.value,
+    DataQualityClassEnum.COMPOSITE_PRIMARY_KEY.value,
+    DataQualityClassEnum.COMPOSITE_PRIMARY_KEY_FOREIGN_KEY.value,
+]
 
 
 class Reservoir_Sampler():
     '''
-    The sampling algorithm is an implementation the reservoir sampling algorithm described by Kim-Hung Li in their paper [Reservoir-sampling algorithms of time complexity O(n(1 + log(N/n)))](https://dl.acm.org/doi/10.1145/198429.198435)
+    Samples n_rows records from every data file of a directory without replacement.
+
+    Rather than reading the file line by line (Algorithm L reservoir sampling, see
+    [Reservoir-sampling algorithms of time complexity O(n(1 + log(N/n)))](https://dl.acm.org/doi/10.1145/198429.198435)),
+    the file is memory mapped and its record boundaries are found with vectorized byte
+    scans. The records to keep are drawn up front and copied out by offset, so Python
+    only touches the sampled records. Sampled records keep their order in the file.
 
-    This [link](https://en.wikipedia.org/wiki/Reservoir_sampling#Optimal:_Algorithm_L) from wikipedia provides a summary of the algorithm. 
+    A newline only ends a record when it is outside a quoted field, so quoted values
+    with embedded newlines stay whole (escaped "" quotes leave the quote parity unchanged).
+
+    Passing a seed makes the sample reproducible, each file gets its own stream derived
+    from the seed and the file name so the result does not depend on scheduling.
+
+    Compressed files cannot be mapped, they are decompressed as a stream and sampled in
+    one pass with Algorithm L, still scanning record boundaries a chunk at a time. The
+    sample is written with the same compression. Parquet and Feather files are sampled
+    by row position, reading only the Parquet row groups that hold a sampled row.
     '''
 
-    def __init__(self, input_path: str, output_path: str, n_rows: int, multiprocessors: int = 1) -> None:
-        random.seed(time.time())
+    def __init__(self, input_path: str, output_path: str, n_rows: int, multiprocessors: int = 1, seed: int | None = None) -> None:
         self.input_path = input_path
         self.output_path = output_path
         self.n_rows = n_rows
         self.multiprocessors = multiprocessors
+        self.seed = seed
 
-        # Obtain all CSV files to sample and sample them
-        self.input_files = glob.glob(pathname="*.csv", root_dir=input_path)
+        # Obtain all data files to sample and sample them
+        self.input_files = get_data_file_names(input_path)
 
     # Method called to generate sample.
     def sample(self):
         print(f"Sampling Files from {self.input_path}")
-        for i in range(0, len(self.input_files), self.multiprocessors):
-            processes = []
-            for file in self.input_files[i:i+self.multiprocessors]:
-                process = multiprocessing.Process(target=self._process_file, args=(file,))
-                process.start()
-                processes.append(process)
-            for process in processes:
-                process.join()
+        # Largest files first so a large file is not left running alone at the end
+        input_files = sorted(self.input_files, key=lambda file: os.path.getsize(os.path.join(self.input_path, file)), reverse=True)
+        if self.multiprocessors > 1 and len(input_files) > 1:
+            with multiprocessing.Pool(min(self.multiprocessors, len(input_files))) as pool:
+                pool.map(self._process_file, input_files, chunksize=1)
+        else:
+            for file in input_files:
+                self._process_file(file)
         print(f"Files Sampled and Saved to {self.output_path}")
 
     def _process_file(self, file):
-        sampled_rows = self._sample_file(file)
+        if is_columnar_data_file(file):
+            self._sample_columnar_file(file)
+            return
+        if get_compression(file) != None:
+            sampled_rows = self._sample_compressed_file(file)
+        else:
+            sampled_rows = self._sample_file(file)
         self._save_sample(file, sampled_rows)
 
     def _save_sample(self, file, rows):
-        output_file = os.path.join(self.output_path, file)
-        with open(output_file, "w") as file:
+        output_file = self._get_output_file(file)
+        with open_data_file(output_file, "wb") as file:
             file.writelines(rows)
 
+    def _get_output_file(self, file):
+        output_file = os.path.join(self.output_path, file)
+        # A staged input file may be a link to the original, replace the link instead of writing through it
+        if os.path.lexists(output_file):
+            os.remove(output_file)
+        return output_file
+
+    def _get_random_generator(self, file):
+        if self.seed == None:
+            return np.random.default_rng()
+        return np.random.default_rng([self.seed, zlib.crc32(file.encode())])
+
     def _sample_file(self, file):
-        reservoir = []
-        headers = []
-        # Sample file
-        with open(os.path.join(self.input_path, file), "r") as file:
+        with open(os.path.join(self.input_path, file), "rb") as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                return []
+            buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
             # CSV column names must be saved.
-            headers.append(file.readline())
-            # Obtain initial count of n_rows
-            reservoir = self._fill_reservoir(reservoir, file)
-            # Sample the rest of the file.
-            reservoir = self._sample_reservoir(reservoir, file)
+            header_end = self._get_header_end(buffer)
+            headers = [buffer[:header_end]]
+            record_count = self._count_records(buffer, header_end)
+            random_generator = self._get_random_generator(file)
+            if record_count <= self.n_rows:
+                sampled_records = np.arange(record_count)
+            else:
+                sampled_records = np.sort(random_generator.choice(record_count, self.n_rows, replace=False))
+            record_starts, record_stops = self._get_record_spans(buffer, header_end, sampled_records)
+            rows = [self._terminate_record(buffer[start:stop]) for start, stop in zip(record_starts, record_stops)]
+        finally:
+            buffer.close()
+
         # Extend headers with data and return
-        headers.extend(reservoir)
+        headers.extend(rows)
         return headers
 
-    def _fill_reservoir(self, reservoir, file):
-        i = 0
-        line = file.readline()
-        while line != "":
-            i += 1
-            if i > self.n_rows:
-                break
+    def _sample_compressed_file(self, file):
+        # Algorithm L over the decompressed stream, the reservoir holds (record index, record)
+        random_generator = self._get_random_generator(file)
+        headers = []
+        reservoir = []
+        records_seen = 0
+        next_record = None
+        with open_data_file(os.path.join(self.input_path, file), "rb") as input_file:
+            for buffer, record_ends in self._iterate_stream_records(input_file):
+                record_starts = np.concatenate(([0], record_ends[:-1]))
+                if len(headers) == 0:
+                    headers.append(buffer[:record_ends[0]])
+                    record_starts, record_ends = record_starts[1:], record_ends[1:]
+
+                # Fill the reservoir with the first records
+                fill_count = min(self.n_rows - len(reservoir), len(record_ends))
+                for record in range(fill_count):
+                    reservoir.append((records_seen + record, self._terminate_record(buffer[record_starts[record]:record_ends[record]])))
+                if next_record == None and len(reservoir) == self.n_rows:
+                    weight = np.exp(np.log(self._draw_open_unit(random_generator)) / self.n_rows)
+                    next_record = self.n_rows - 1 + self._draw_skip(random_generator, weight)
+
+                # Then replace a random slot for each record the skips land on
+                while next_record != None and next_record < records_seen + len(record_ends):
+                    record = next_record - records_seen
+                    slot = random_generator.integers(self.n_rows)
+                    reservoir[slot] = (next_record, self._terminate_record(buffer[record_starts[record]:record_ends[record]]))
+                    weight *= np.exp(np.log(self._draw_open_unit(random_generator)) / self.n_rows)
+                    next_record += self._draw_skip(random_generator, weight)
+                records_seen += len(record_ends)
+
+        headers.extend(record for _, record in sorted(reservoir, key=lambda entry: entry[0]))
+        return headers
+
+    def _iterate_stream_records(self, input_file):
+        # Decompressed data cut after its last record terminator, with the offsets just
+        # past each record. Every buffer starts at a record start.
+        remainder = b''
+        while True:
+            data = input_file.read(SCAN_CHUNK_BYTES)
+            if len(data) == 0:
+                if len(remainder) != 0:
+                    yield remainder, np.array([len(remainder)])
+                return
+            buffer = remainder + data
+            record_ends = np.concatenate(list(self._iterate_record_ends(buffer, 0)))
+            if len(record_ends) == 0:
+                remainder = buffer
+                continue
+            yield buffer, record_ends
+            remainder = buffer[record_ends[-1]:]
+
+    @staticmethod
+    def _draw_open_unit(random_generator):
+        # Uniform draw in (0, 1), log(0) is undefined
+        draw = 0.0
+        while draw == 0.0:
+            draw = random_generator.random()
+        return draw
+
+    @classmethod
+    def _draw_skip(cls, random_generator, weight):
+        with np.errstate(divide='ignore'):
+            return int(np.floor(np.log(cls._draw_open_unit(random_generator)) / np.log1p(-weight))) + 1
+
+    def _sample_columnar_file(self, file):
+        input_file = os.path.join(self.input_path, file)
+        row_count = count_columnar_data_file_rows(input_file)
+        random_generator = self._get_random_generator(file)
+        if row_count <= self.n_rows:
+            sampled_rows = np.arange(row_count)
+        else:
+            sampled_rows = np.sort(random_generator.choice(row_count, self.n_rows, replace=False))
+        sample = take_columnar_data_file_rows(input_file, sampled_rows)
+        write_columnar_data_file(self._get_output_file(file), sample)
+
+    def _get_header_end(self, buffer):
+        for record_ends in self._iterate_record_ends(buffer, 0):
+            if len(record_ends) != 0:
+                return record_ends[0]
+        return len(buffer)
+
+    def _iterate_record_ends(self, buffer, start):
+        # Offsets just past each record terminator, one array per scanned chunk.
+        # Scanning starts at a record start, where no quoted field is open.
+        quote_count = 0
+        for chunk_start in range(start, len(buffer), SCAN_CHUNK_BYTES):
+            chunk_stop = min(chunk_start + SCAN_CHUNK_BYTES, len(buffer))
+            chunk = np.frombuffer(buffer, dtype=np.uint8, count=chunk_stop - chunk_start, offset=chunk_start)
+            newline_positions = np.flatnonzero(chunk == NEWLINE_BYTE)
+            # Fast path for chunks without quotes, the substring search is much cheaper than a byte scan
+            has_quotes = buffer.find(bytes([QUOTE_BYTE]), chunk_start, chunk_stop) != -1
+            quote_positions = np.flatnonzero(chunk == QUOTE_BYTE) if has_quotes else newline_positions[:0]
+            del chunk
+            if has_quotes or quote_count % 2 != 0:
+                # Newlines preceded by an odd number of quotes are inside a quoted field
+                quotes_before_newlines = quote_count + np.searchsorted(quote_positions, newline_positions)
+                newline_positions = newline_positions[quotes_before_newlines % 2 == 0]
+                quote_count += len(quote_positions)
+            yield newline_positions + (chunk_start + 1)
+
+    def _count_records(self, buffer, header_end):
+        terminated_record_count = 0
+        last_record_end = header_end
+        for record_ends in self._iterate_record_ends(buffer, header_end):
+            if len(record_ends) != 0:
+                terminated_record_count += len(record_ends)
+                last_record_end = record_ends[-1]
+        # A last record without a trailing newline still counts
+        return terminated_record_count + int(last_record_end < len(buffer))
+
+    def _get_record_spans(self, buffer, header_end, sampled_records):
+        # Record i spans [boundary i, boundary i + 1), boundary 0 is the end of the header
+        # and boundary j > 0 is the end of the j-th record.
+        boundary_indices = np.union1d(sampled_records, sampled_records + 1)
+        boundaries = np.full(len(boundary_indices), len(buffer), dtype=np.int64)
+        boundaries[boundary_indices == 0] = header_end
+
+        records_seen = 0
+        if len(boundary_indices) != 0:
+            for record_ends in self._iterate_record_ends(buffer, header_end):
+                first = np.searchsorted(boundary_indices, records_seen + 1)
+                last = np.searchsorted(boundary_indices, records_seen + len(record_ends), side='right')
+                boundaries[first:last] = record_ends[boundary_indices[first:last] - records_seen - 1]
+                records_seen += len(record_ends)
+                # The rest of the file holds no sampled records
+                if records_seen >= boundary_indices[-1]:
+                    break
+
+        record_starts = boundaries[np.searchsorted(boundary_indices, sampled_records)]
+        record_stops = boundaries[np.searchsorted(boundary_indices, sampled_records + 1)]
+        return record_starts, record_stops
+
+    @staticmethod
+    def _terminate_record(record):
+        if record.endswith(b'\n'):
+            return record
+        return record + b'\n'
+
+
+@dataclass
+class SamplingForeignKey:
+
+    table_name: str
+    column_names: tuple
+    primary_key_table_name: str
+    primary_key_column_names: tuple
+
+
+@dataclass
+class SamplingKeyRelationships:
+
+    primary_keys: dict = field(default_factory=dict)
+    foreign_keys: list = field(default_factory=list)
+
+    def get_foreign_keys(self, table_name) -> list:
+        return [foreign_key for foreign_key in self.foreign_keys if foreign_key.table_name == table_name]
+
+    def get_referenced_keys(self, table_name) -> list:
+        referenced_keys = []
+        for foreign_key in self.foreign_keys:
+            if foreign_key.primary_key_table_name == table_name and foreign_key.primary_key_column_names not in referenced_keys:
+                referenced_keys.append(foreign_key.primary_key_column_names)
+        return referenced_keys
+
+
+class SamplingKeyRelationshipReader:
+
+    @classmethod
+    def read_key_relationships(cls, annotations_file_path, data_directory_path) -> SamplingKeyRelationships:
+        key_relationships = SamplingKeyRelationships()
+        if not os.path.exists(annotations_file_path):
+            return key_relationships
+
+        excel_annotations = AnnotationsStore(annotations_file_path)
+        full_file_name_finder = FullFileNameFinder(data_directory_path)
+        for sheet_name in excel_annotations.sheet_names:
+            annotations = excel_annotations.get_sheet(sheet_name)
+            if 'Name' not in annotations.columns:
+                continue
+            for table_name in cls._get_table_names(annotations, sheet_name, full_file_name_finder):
+                cls._add_table_keys(key_relationships, table_name, annotations)
+
+        return key_relationships
+
+    @staticmethod
+    def _get_table_names(annotations, sheet_name, full_file_name_finder) -> list:
+        # Same sheet to file matching as MetadataGenerationInputReader.read_real_name_to_excel_name_map
+        file_name_parts = []
+        if 'Files' in annotations.columns:
+            file_name_parts = [str(file_name) for file_name in annotations['Files'] if pd.notna(file_name) and str(file_name) != '']
+        if len(file_name_parts) == 0:
+            file_name_parts = [sheet_name]
+
+        table_names = []
+        for file_name_part in file_name_parts:
+            try:
+                table_names.append(full_file_name_finder.get_full_file_name_from_part(file_name_part))
+            except ValueError:
+                continue
+        return table_names
+
+    @staticmethod
+    def _add_table_keys(key_relationships, table_name, annotations) -> None:
+        primary_key_column_names = []
+        foreign_key_columns = {}
+
+        for _, column_annotations in annotations.iterrows():
+            column_name = column_annotations['Name']
+            if pd.isna(column_name):
+                continue
+            data_quality_class = column_annotations.get('Data Quality Class')
+            if isinstance(data_quality_class, str) and data_quality_class.strip().lstrip('?') in PRIMARY_KEY_CLASSES:
+                primary_key_column_names.append(str(column_name))
+
+            manual_annotations = column_annotations.get('Manual Annotations')
+            if not isinstance(manual_annotations, str):
+                continue
+            try:
+                foreign_key_references = json.loads(manual_annotations).get('foreign_key_references', [])
+            except (ValueError, AttributeError):
+                continue
+            for foreign_key_reference in foreign_key_references:
+                # Columns sharing a key id form one composite foreign key
+                key_id = (foreign_key_reference['table'], foreign_key_reference.get('id', 0))
+                foreign_key_columns.setdefault(key_id, []).append((str(column_name), str(foreign_key_reference['key'])))
+
+        if len(primary_key_column_names) != 0:
+            key_relationships.primary_keys[table_name] = tuple(primary_key_column_names)
+        for (primary_key_table_name, _), column_pairs in foreign_key_columns.items():
+            key_relationships.foreign_keys.append(SamplingForeignKey(table_name,
+                                                                     tuple(column_name for column_name, _ in column_pairs),
+                                                                     primary_key_table_name,
+                                                                     tuple(key_name for _, key_name in column_pairs)))
+
+
+class KeyConsistentSampler():
+    '''
+    Samples a fraction of every data file of a directory while keeping foreign keys intact.
+
+    Tables are sampled parents first. A table that is not a child of another table keeps
+    a row when the hash of its key falls under the fraction. A child table keeps a row when
+    every foreign key value found in its parent is a kept parent key. Rows whose values are
+    all missing or orphaned (absent from the full parent table) are kept by the hash of the
+    orphaned value, so orphans are kept at the sampling rate and the orphan rate of the
+    sample estimates the orphan rate of the full dataset. Rows without any key value are
+    sampled at random. Files are streamed in chunks, only
+    the parent key values are held in memory.
+    '''
+
+    def __init__(self, input_path: str, output_path: str, fraction: float, key_relationships: SamplingKeyRelationships,
+                 delimiter: str = ',', seed: int | None = None) -> None:
+        if not 0 < fraction <= 1:
+            raise ValueError("Sample fraction must be in (0, 1]: {}".format(fraction))
+        self.input_path = input_path
+        self.output_path = output_path
+        self.fraction = fraction
+        self.key_relationships = key_relationships
+        self.delimiter = delimiter
+        self.seed = seed
+        self.input_files = get_data_file_names(input_path)
+
+    def sample(self):
+        print(f"Sampling Files from {self.input_path} by key")
+        table_file_names = {strip_data_file_extension(file): file for file in self.input_files}
+        kept_keys = {}
+        all_keys = {}
+        for table_name in self._get_table_order(list(table_file_names.keys())):
+            self._sample_table(table_name, table_file_names[table_name], kept_keys, all_keys)
+        print(f"Files Sampled and Saved to {self.output_path}")
+
+    def _get_table_order(self, table_names) -> list:
+        # Parents before children, tables in a reference cycle keep directory order
+        parent_names = {table_name: {foreign_key.primary_key_table_name for foreign_key in self.key_relationships.get_foreign_keys(table_name)
+                                     if foreign_key.primary_key_table_name in table_names and foreign_key.primary_key_table_name != table_name}
+                        for table_name in table_names}
+        ordered_table_names = []
+        while len(ordered_table_names) < len(table_names):
+            ready_table_names = [table_name for table_name in table_names if table_name not in ordered_table_names
+                                 and parent_names[table_name].issubset(ordered_table_names)]
+            if len(ready_table_names) == 0:
+                ready_table_names = [next(table_name for table_name in table_names if table_name not in ordered_table_names)]
+            ordered_table_names.extend(ready_table_names)
+        return ordered_table_names
+
+    def _sample_table(self, table_name, file, kept_keys, all_keys):
+        input_file = os.path.join(self.input_path, file)
+        output_file = os.path.join(self.output_path, file)
+        # Written next to the output and moved into place: the output may be the input
+        # itself or a link to it. The prefix keeps the extension, and so the format.
+        staging_file = os.path.join(self.output_path, '.sampling.' + file)
+        random_generator = self._get_random_generator(file)
+        foreign_keys = [foreign_key for foreign_key in self.key_relationships.get_foreign_keys(table_name)
+                        if (foreign_key.primary_key_table_name, foreign_key.primary_key_column_names) in all_keys]
+        referenced_keys = self.key_relationships.get_referenced_keys(table_name)
+        for referenced_key in referenced_keys:
+            kept_keys[(table_name, referenced_key)] = set()
+            all_keys[(table_name, referenced_key)] = set()
+
+        def get_keep_mask(chunk):
+            if len(foreign_keys) != 0:
+                keep_mask = self._get_child_keep_mask(chunk, foreign_keys, kept_keys, all_keys, random_generator)
             else:
-                reservoir.append(line)
-            line = file.readline()
-        return reservoir
-
-    def _sample_reservoir(self, reservoir, file):
-        # One may read https://en.wikipedia.org/wiki/Reservoir_sampling#Optimal:_Algorithm_L for a description of this algorithm
-        w = math.exp(
-            math.log(random.random()) / self.n_rows)
-        line = file.readline()
-        while line != "":
-            skip = math.floor(math.log(random.random()) / math.log(1 - w)) + 1
-            while line != "" and skip > 0:
-                line = file.readline()
-                skip -= 1
-            if line != "":
-                reservoir[random.randrange(0, self.n_rows)] = line
-                w = w * math.exp(math.log(random.random()) / self.n_rows)
-        return reservoir
+                keep_mask = self._get_parent_keep_mask(chunk, table_name, referenced_keys, random_generator)
+            for referenced_key in referenced_keys:
+                key_values = self._get_key_values(chunk, referenced_key)
+                all_keys[(table_name, referenced_key)].update(key_values[key_values.notna()])
+                kept_keys[(table_name, referenced_key)].update(key_values[keep_mask & key_values.notna()])
+            return keep_mask
+
+        if is_columnar_data_file(file):
+            # Keys are compared as text like they are in delimited files, the sample keeps the stored types
+            df = read_columnar_data_file(input_file)
+            keep_masks = [np.zeros(0, dtype=bool)]
+            for chunk_start in range(0, len(df.index), SAMPLING_CHUNK_ROWS):
+                chunk = df.iloc[chunk_start:chunk_start + SAMPLING_CHUNK_ROWS]
+                keep_masks.append(get_keep_mask(chunk.astype(str).where(chunk.notna())).to_numpy())
+            write_columnar_data_file(staging_file, df[np.concatenate(keep_masks)])
+        else:
+            # Cells are kept as written, NA and null included, only empty keys are missing
+            chunks = pd.read_csv(input_file, delimiter=self.delimiter, dtype=str, keep_default_na=False, na_filter=False,
+                                 chunksize=SAMPLING_CHUNK_ROWS)
+            with open_data_file(staging_file, 'wt', newline='') as sample_file:
+                for chunk_index, chunk in enumerate(chunks):
+                    keep_mask = get_keep_mask(chunk)
+                    chunk[keep_mask].to_csv(sample_file, sep=self.delimiter, index=False, header=chunk_index == 0, lineterminator='\n')
+        if os.path.lexists(output_file):
+            os.remove(output_file)
+        os.replace(staging_file, output_file)
+
+    def _get_parent_keep_mask(self, chunk, table_name, referenced_keys, random_generator) -> pd.Series:
+        sampling_key = self.key_relationships.primary_keys.get(table_name)
+        if sampling_key == None or not set(sampling_key).issubset(chunk.columns):
+            sampling_key = referenced_keys[0] if len(referenced_keys) != 0 else None
+        if sampling_key == None:
+            return self._get_random_keep_mask(chunk, random_generator)
+
+        key_values = self._get_key_values(chunk, sampling_key)
+        keep_mask = self._get_hash_keep_mask(key_values)
+        missing_mask = key_values.isna()
+        return keep_mask.where(~missing_mask, self._get_random_keep_mask(chunk, random_generator))
+
+    def _get_child_keep_mask(self, chunk, foreign_keys, kept_keys, all_keys, random_generator) -> pd.Series:
+        # Rows referencing a parent follow the parent. Rows referencing no parent (only missing
+        # or orphaned values) are drawn by the hash of their first orphaned value, or at random.
+        keep_mask = pd.Series(True, index=chunk.index)
+        referencing_mask = pd.Series(False, index=chunk.index)
+        unreferenced_keep_mask = self._get_random_keep_mask(chunk, random_generator)
+        has_orphan_mask = pd.Series(False, index=chunk.index)
+        for foreign_key in foreign_keys:
+            primary_key = (foreign_key.primary_key_table_name, foreign_key.primary_key_column_names)
+            key_values = self._get_key_values(chunk, foreign_key.column_names)
+            missing_mask = key_values.isna()
+            orphan_mask = ~missing_mask & ~key_values.isin(all_keys[primary_key])
+            referenced_mask = ~missing_mask & ~orphan_mask
+            keep_mask &= ~referenced_mask | key_values.isin(kept_keys[primary_key])
+            referencing_mask |= referenced_mask
+            first_orphan_mask = orphan_mask & ~has_orphan_mask
+            unreferenced_keep_mask = unreferenced_keep_mask.where(~first_orphan_mask, self._get_hash_keep_mask(key_values))
+            has_orphan_mask |= orphan_mask
+        return keep_mask.where(referencing_mask, unreferenced_keep_mask)
+
+    def _get_hash_keep_mask(self, key_values) -> pd.Series:
+        hashes = pd.util.hash_array(key_values.fillna('').to_numpy(dtype=object), hash_key=self._get_hash_key(), categorize=False)
+        # Top 53 bits as a uniform draw in [0, 1)
+        return pd.Series((hashes >> np.uint64(11)).astype(np.float64) / 2**53 < self.fraction, index=key_values.index)
+
+    def _get_random_keep_mask(self, chunk, random_generator) -> pd.Series:
+        return pd.Series(random_generator.random(len(chunk.index)) < self.fraction, index=chunk.index)
+
+    def _get_hash_key(self) -> str:
+        if self.seed == None:
+            return '0123456789123456'
+        return '{:016x}'.format(self.seed % 2**64)
+
+    def _get_random_generator(self, file):
+        if self.seed == None:
+            return np.random.default_rng()
+        return np.random.default_rng([self.seed, zlib.crc32(file.encode())])
+
+    @staticmethod
+    def _get_key_values(chunk, column_names) -> pd.Series:
+        # Keys are compared as text, integral numbers are written without a decimal part
+        # so that 3 and 3.0 match like they do once the tables are parsed
+        normalized_columns = []
+        for column_name in column_names:
+            if column_name not in chunk.columns:
+                return pd.Series(np.nan, index=chunk.index, dtype=object)
+            values = chunk[column_name].str.strip()
+            numbers = pd.to_numeric(values, errors='coerce')
+            integral_mask = np.isfinite(numbers) & (numbers == np.floor(numbers))
+            values = values.where(~integral_mask, numbers[integral_mask].map('{:.0f}'.format))
+            normalized_columns.append(values.mask(values == ''))
+
+        key_values = normalized_columns[0]
+        for values in normalized_columns[1:]:
+            key_values = key_values + '\x1f' + values
+        return key_values.astype(object)
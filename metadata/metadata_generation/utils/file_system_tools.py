@@ -8,6 +8,7 @@ from pathlib import Path
 
 from ..utils.error_handling import format_error
 from ..utils.string_ops import find_match
+from ..utils.data_file_formats import strip_data_file_extension
 
 
 class FileIntegrityHelper:
@@ -144,7 +145,7 @@ class FullFileNameFinder:
         match = find_match(partial_file_name, files)
 
         if match != None:
-            file_name = os.path.splitext(match)[0]
+            file_name = strip_data_file_extension(match)
         else:
             raise ValueError(
                 f"No matching file for annotations listed for lookup: {partial_file_name}"
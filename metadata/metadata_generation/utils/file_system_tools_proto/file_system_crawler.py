@@ -3,6 +3,8 @@
 import os
 import glob
 
+from ..data_file_formats import TABULAR_FILE_EXTENSIONS
+
 
 def get_isolated_file_path_from_directory(directory_file_path):
     directory_file_paths = get_directory_file_paths(directory_file_path) 
@@ -33,8 +35,7 @@ def get_directory_file_paths(directory_file_path, extensions=None):
     """
     # Default to common tabular data formats if no extensions specified
     if extensions is None:
-        extensions = ['.csv', '.tsv', '.xlsx', '.xls', '.parquet', 
-                     '.json', '.jsonl', '.feather', '.orc', '.avro']
+        extensions = TABULAR_FILE_EXTENSIONS
     
     # Convert single extension string to list
     if isinstance(extensions, str):
@@ -1,9 +1,22 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
+import os
+import threading
+
 from multiprocessing import Pool
 from functools import partial
 import numpy as np
 
+from .data_file_formats import get_compression, is_columnar_data_file
+
+
+# Rough in-memory size of a parsed table relative to its size on disk
+PARSED_BYTES_PER_FILE_BYTE = 4
+# Rough size of a table as plain CSV relative to its compressed or columnar file
+COMPRESSION_RATIO_ESTIMATE = 5
+# Rough working memory of the statistics of a column per row: its numeric view, codes and sort buffers
+STATISTICS_BYTES_PER_ROW = 32
+
 
 class ParallelExecutor:
 
@@ -47,3 +60,48 @@ class SubsetWrapper:
         wrapped_apply_call = dataframe_subset.apply(self.__func, axis=1)
         return wrapped_apply_call
 
+
+# The parallel steps (reading data files, the LLMD columns of a table, the independent rules of
+# each table) run on threads rather than processes. The parsers and the NumPy and pandas kernels
+# behind them release the GIL, and the tables are shared in memory instead of being pickled to
+# workers and back. The workers reserve their estimated memory from a MemoryBudget.
+
+
+def estimate_parsed_file_memory(file_path):
+    parsed_bytes_per_file_byte = PARSED_BYTES_PER_FILE_BYTE
+    if get_compression(file_path) != None or is_columnar_data_file(file_path):
+        parsed_bytes_per_file_byte *= COMPRESSION_RATIO_ESTIMATE
+    return os.path.getsize(file_path) * parsed_bytes_per_file_byte
+
+
+def estimate_column_statistics_memory(num_rows):
+    return num_rows * STATISTICS_BYTES_PER_ROW
+
+
+class MemoryBudget:
+    """
+        Blocks workers until their estimated memory fits in the budget. A request larger
+        than the whole budget is let through once nothing else holds memory.
+    """
+
+    def __init__(self, budget_bytes=None):
+        self.__budget_bytes = budget_bytes
+        self.__bytes_in_use = 0
+        self.__condition = threading.Condition()
+
+    @property
+    def bytes_in_use(self):
+        return self.__bytes_in_use
+
+    def acquire(self, num_bytes):
+        with self.__condition:
+            if self.__budget_bytes != None:
+                self.__condition.wait_for(
+                    lambda: self.__bytes_in_use == 0 or self.__bytes_in_use + num_bytes <= self.__budget_bytes
+                )
+            self.__bytes_in_use += num_bytes
+
+    def release(self, num_bytes):
+        with self.__condition:
+            self.__bytes_in_use -= num_bytes
+            self.__condition.notify_all()
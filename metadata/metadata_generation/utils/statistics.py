@@ -1,9 +1,23 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
+import os, pickle
 import numpy as np
+import pandas as pd
 
 from dataclasses import dataclass
 from ..utils.constraints import ConstraintRange
+from ..utils.quantile_sketch import KLLSketch
+from ..utils.cardinality_sketch import HyperLogLog
+
+
+# How a median was found: from every value, or estimated by a quantile sketch
+EXACT_MEDIAN = 'exact'
+APPROXIMATE_MEDIAN = 'approximate'
+# How category frequencies were found: every category counted, the most frequent of
+# many categories counted, or the most frequent estimated by a heavy hitters sketch
+EXACT_FREQUENCIES = 'exact'
+TOP_FREQUENCIES = 'top'
+APPROXIMATE_FREQUENCIES = 'approximate'
 
 
 @dataclass
@@ -44,4 +58,389 @@ def monotonicity_ratio(sequence: np.ndarray) -> float:
         return 0
     sequence_delta = np.diff(sequence)
     delta_signs = np.sign(sequence_delta)
-    return abs(delta_signs.sum() / (sequence_delta.size))
\ No newline at end of file
+    return abs(delta_signs.sum() / (sequence_delta.size))
+
+@dataclass
+class ColumnProfile:
+
+    count: int = 0
+    min: float = np.nan
+    max: float = np.nan
+    mean: float = np.nan
+    median: float = np.nan
+    median_mode: str = EXACT_MEDIAN
+    std_dev: float = np.nan
+    skewness: float = np.nan
+    kurtosis: float = np.nan
+
+
+def profile_numeric_values(values: np.ndarray) -> ColumnProfile:
+    """
+    Count, extremes, moments and median of a numpy integer or float column in one go,
+    missing values being NaN. The moments share the masked, zero filled values and their
+    central moments, and follow the pandas reductions (two pass variance, adjusted
+    Fisher-Pearson skewness and excess kurtosis, ddof=1) operation for operation so the
+    results are bit for bit those of Series.mean/std/skew/kurt/median.
+    """
+    missing_mask, filled_values = _fill_missing_values(values)
+    central_moments = CentralMoments.from_filled_values(values, missing_mask, filled_values)
+
+    column_profile = ColumnProfile(count=np.int64(central_moments.count), mean=central_moments.mean)
+    if central_moments.count == 0:
+        return column_profile
+
+    valid_values = values[~missing_mask] if missing_mask is not None else values
+    column_profile.min = valid_values.min()
+    column_profile.max = valid_values.max()
+    column_profile.median = np.nanmedian(filled_values[~missing_mask] if missing_mask is not None else filled_values)
+    column_profile.std_dev = central_moments.std_dev()
+    column_profile.skewness = central_moments.skewness()
+    column_profile.kurtosis = central_moments.kurtosis()
+
+    return column_profile
+
+
+@dataclass
+class CentralMoments:
+    """
+    Count, mean and central moment sums of a set of values. The moments of consecutive
+    chunks merge pairwise (Chan et al., Pebay 2008), so a table read in chunks gets the
+    statistics of the whole column. A single chunk keeps the sums pandas computes and
+    its statistics are exactly pandas'.
+    """
+
+    count: float = 0.0
+    mean: float = np.nan
+    # Mean the moment sums are taken around, pandas reports integer means summed separately
+    center: float = 0.0
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> 'CentralMoments':
+        missing_mask, filled_values = _fill_missing_values(values)
+        return cls.from_filled_values(values, missing_mask, filled_values)
+
+    @classmethod
+    def from_filled_values(cls, values: np.ndarray, missing_mask: np.ndarray | None, filled_values: np.ndarray) -> 'CentralMoments':
+        if values.dtype.kind == 'f':
+            count = values.dtype.type(values.size - (missing_mask.sum() if missing_mask is not None else 0))
+            value_sum = filled_values.sum(dtype=np.float64)
+            mean = value_sum / count if count > 0 else np.nan
+        else:
+            count = np.float64(values.size)
+            value_sum = filled_values.sum(dtype=np.float64)
+            # pandas sums integers while casting them, which can round differently
+            mean = values.sum(dtype=np.float64) / count if count > 0 else np.nan
+
+        if count == 0:
+            return cls(count=count, mean=mean)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            center = value_sum / count
+            adjusted = filled_values - center
+            if missing_mask is not None:
+                np.putmask(adjusted, missing_mask, 0)
+            adjusted2 = adjusted**2
+            m2 = adjusted2.sum(dtype=np.float64)
+            m3 = (adjusted2 * adjusted).sum(dtype=np.float64)
+            m4 = (adjusted2**2).sum(dtype=np.float64)
+
+        return cls(count=count, mean=mean, center=center, m2=m2, m3=m3, m4=m4)
+
+    def merge(self, other: 'CentralMoments') -> 'CentralMoments':
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+
+        count_a, count_b = np.float64(self.count), np.float64(other.count)
+        count = count_a + count_b
+        with np.errstate(invalid='ignore', over='ignore'):
+            delta = np.float64(other.center) - np.float64(self.center)
+            delta_over_count = delta / count
+            center = self.center + delta_over_count * count_b
+            m2 = self.m2 + other.m2 + delta * delta_over_count * count_a * count_b
+            m3 = (self.m3 + other.m3
+                  + delta * delta_over_count**2 * count_a * count_b * (count_a - count_b)
+                  + 3 * delta_over_count * (count_a * other.m2 - count_b * self.m2))
+            m4 = (self.m4 + other.m4
+                  + delta * delta_over_count**3 * count_a * count_b * (count_a**2 - count_a * count_b + count_b**2)
+                  + 6 * delta_over_count**2 * (count_a**2 * other.m2 + count_b**2 * self.m2)
+                  + 4 * delta_over_count * (count_a * other.m3 - count_b * self.m3))
+
+        return CentralMoments(count=count, mean=center, center=center, m2=m2, m3=m3, m4=m4)
+
+    def std_dev(self) -> float:
+        if self.count <= 1:
+            return np.nan
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sqrt(self.m2 / (self.count - 1))
+
+    def skewness(self) -> float:
+        count = self.count
+        if count < 3:
+            return np.nan
+        zeroed_m2 = _zero_out_floating_point_error(self.m2)
+        zeroed_m3 = _zero_out_floating_point_error(self.m3)
+        if zeroed_m2 == 0:
+            return np.float64(0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (count * (count - 1) ** 0.5 / (count - 2)) * (zeroed_m3 / zeroed_m2**1.5)
+
+    def kurtosis(self) -> float:
+        count = self.count
+        if count < 4:
+            return np.nan
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+            numerator = _zero_out_floating_point_error(count * (count + 1) * (count - 1) * self.m4)
+            denominator = _zero_out_floating_point_error((count - 2) * (count - 3) * self.m2**2)
+            if denominator == 0:
+                return np.float64(0)
+            return numerator / denominator - adjustment
+
+
+def _fill_missing_values(values: np.ndarray) -> tuple:
+    # Missing floats are masked and zero filled, integers are cast like pandas does
+    if values.dtype.kind != 'f':
+        return None, values.astype('f8')
+    missing_mask = np.isnan(values)
+    filled_values = values.copy()
+    if not missing_mask.any():
+        return None, filled_values
+    np.putmask(filled_values, missing_mask, 0)
+    return missing_mask, filled_values
+
+
+def _zero_out_floating_point_error(value):
+    return value.dtype.type(0) if np.abs(value) < 1e-14 else value
+
+
+# Values a median is taken over in memory, beyond that it is selected from the spill file
+MEDIAN_MEMORY_VALUES = 2**22
+# Distinct values counted in memory before the counts are spilled to disk
+FREQUENCY_SPILL_VALUES = 2**20
+SPILL_READ_VALUES = 2**20
+_SIGN_BIT = np.uint64(1) << np.uint64(63)
+_RADIX_BITS = 16
+
+
+class MedianAccumulator:
+    """
+    Median of values added chunk by chunk. The values are appended to a spill file
+    rather than kept; up to MEDIAN_MEMORY_VALUES of them are read back for the median,
+    more are searched with a radix select over the file, 16 bits of the order
+    preserving integer keys of the values per pass.
+    With an error bound, the values also go into a KLL sketch and past
+    MEDIAN_MEMORY_VALUES the median is the sketch's, within about error_bound of the
+    median rank, and nothing more is spilled.
+    """
+
+    def __init__(self, spill_file_path: str, error_bound: float | None = None):
+        self._spill_file_path = spill_file_path
+        self._count = 0
+        self._sketch = KLLSketch.from_error_bound(error_bound) if error_bound != None else None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mode(self) -> str:
+        if self._sketch == None or self._count <= MEDIAN_MEMORY_VALUES:
+            return EXACT_MEDIAN
+        return APPROXIMATE_MEDIAN
+
+    def add_values(self, values: np.ndarray) -> None:
+        # Values without NaNs
+        if values.size == 0:
+            return
+        self._count += values.size
+        if self._sketch != None:
+            self._sketch.update(values)
+            if self.mode == APPROXIMATE_MEDIAN:
+                if os.path.exists(self._spill_file_path):
+                    os.remove(self._spill_file_path)
+                return
+        with open(self._spill_file_path, 'ab') as spill_file:
+            np.ascontiguousarray(values, dtype=np.float64).tofile(spill_file)
+
+    def median(self) -> float:
+        if self._count == 0:
+            return np.nan
+        if self.mode == APPROXIMATE_MEDIAN:
+            return self._sketch.quantile(0.5)
+        if self._count <= MEDIAN_MEMORY_VALUES:
+            return np.nanmedian(np.fromfile(self._spill_file_path, dtype=np.float64))
+        # numpy averages the two middle values of an even count
+        upper_value = self._select(self._count // 2)
+        if self._count % 2 == 1:
+            return upper_value
+        return (self._select(self._count // 2 - 1) + upper_value) / 2
+
+    def _select(self, rank: int) -> np.float64:
+        key_prefix = np.uint64(0)
+        for shift in range(64 - _RADIX_BITS, -1, -_RADIX_BITS):
+            prefix_shift = np.uint64(shift + _RADIX_BITS)
+            digit_counts = np.zeros(2**_RADIX_BITS, dtype=np.int64)
+            for keys in self._read_keys():
+                if shift != 64 - _RADIX_BITS:
+                    keys = keys[(keys >> prefix_shift) == key_prefix]
+                digits = ((keys >> np.uint64(shift)) & np.uint64(2**_RADIX_BITS - 1)).astype(np.intp)
+                digit_counts += np.bincount(digits, minlength=2**_RADIX_BITS)
+
+            cumulative_counts = np.cumsum(digit_counts)
+            digit = int(np.searchsorted(cumulative_counts, rank, side='right'))
+            if digit > 0:
+                rank -= int(cumulative_counts[digit - 1])
+            key_prefix = (key_prefix << np.uint64(_RADIX_BITS)) | np.uint64(digit)
+
+            if shift != 0 and digit_counts[digit] <= MEDIAN_MEMORY_VALUES:
+                # Few enough values share the prefix to finish in memory
+                candidate_keys = np.concatenate([keys[(keys >> np.uint64(shift)) == key_prefix] for keys in self._read_keys()])
+                return _get_value_from_sort_key(np.partition(candidate_keys, rank)[rank])
+
+        return _get_value_from_sort_key(key_prefix)
+
+    def _read_keys(self):
+        with open(self._spill_file_path, 'rb') as spill_file:
+            while True:
+                values = np.fromfile(spill_file, dtype=np.float64, count=SPILL_READ_VALUES)
+                if values.size == 0:
+                    return
+                yield _get_sort_keys(values)
+
+
+def _get_sort_keys(values: np.ndarray) -> np.ndarray:
+    # Unsigned integers ordered like the floats: negative floats have every bit flipped,
+    # positive ones only their sign bit
+    bits = values.view(np.uint64)
+    return np.where(bits & _SIGN_BIT, ~bits, bits | _SIGN_BIT)
+
+
+def _get_value_from_sort_key(key) -> np.float64:
+    key = np.uint64(key)
+    bits = key ^ _SIGN_BIT if key & _SIGN_BIT else ~key
+    return np.array([bits], dtype=np.uint64).view(np.float64)[0]
+
+
+# Categories listed one by one; past the cap only the most frequent are, the others
+# sharing a tail bucket. Few enough to list every category over a 0.1% frequency
+CATEGORY_CAP = 10000
+TOP_CATEGORIES = 1000
+
+
+@dataclass
+class CategoryProfile:
+
+    # Listed categories, most frequent first
+    counts: pd.Series
+    num_categories: int
+    # Non-missing values of the categories left out of counts
+    num_other_values: int = 0
+    mode: str = EXACT_FREQUENCIES
+
+
+def profile_category_counts(value_counts: pd.Series) -> CategoryProfile:
+    """CategoryProfile of the exact value counts of a column, sorted most frequent first."""
+    if len(value_counts) <= CATEGORY_CAP:
+        return CategoryProfile(value_counts, len(value_counts))
+    top_counts = value_counts.iloc[:TOP_CATEGORIES]
+    return CategoryProfile(top_counts, len(value_counts), int(value_counts.iloc[TOP_CATEGORIES:].sum()), TOP_FREQUENCIES)
+
+
+class FrequencyAccumulator:
+    """
+    Exact value counts of values added chunk by chunk, kept in order of first appearance.
+    Past FREQUENCY_SPILL_VALUES distinct values the counts so far are written to a
+    spill file and counting starts over; the runs are merged, oldest first, when the
+    counts are read, so ties still sort like Series.value_counts over the whole column.
+
+    With a category cap, past the cap the counts become a Misra-Gries heavy hitters
+    summary of that many counters instead, undercounting each value by at most
+    1 / (cap + 1) of the values added, and a HyperLogLog sketch estimates the number
+    of distinct values.
+    """
+
+    def __init__(self, spill_file_path: str, category_cap: int | None = None):
+        self._spill_file_path = spill_file_path
+        self._category_cap = category_cap
+        self._spilled_runs = 0
+        self._values = None
+        self._counts = None
+        self._num_values = 0
+        self._distinct_values = None
+
+    def add_values(self, values) -> None:
+        codes, uniques = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        uniques = pd.Index(np.asarray(uniques, dtype=object) if isinstance(uniques, pd.Categorical) else uniques)
+        self._num_values += int(counts.sum())
+        if self._distinct_values is not None:
+            self._distinct_values.update(uniques)
+
+        if self._values is None or len(self._values) == 0:
+            self._values, self._counts = uniques, counts
+        else:
+            positions = self._values.get_indexer(uniques)
+            seen_mask = positions >= 0
+            self._counts[positions[seen_mask]] += counts[seen_mask]
+            if not seen_mask.all():
+                self._values = self._values.append(uniques[~seen_mask])
+                self._counts = np.concatenate((self._counts, counts[~seen_mask]))
+
+        if self._category_cap != None and len(self._values) > self._category_cap:
+            self._reduce_counts()
+        elif len(self._values) > FREQUENCY_SPILL_VALUES:
+            self._spill()
+
+    def value_counts(self, name=None, parse_values=None) -> pd.Series:
+        # parse_values maps the values counted to the values reported, merging those it makes equal
+        counts = pd.Series(self._counts if self._values is not None else np.array([], dtype=np.int64),
+                           index=self._values if self._values is not None else pd.Index([], dtype=object))
+        if self._spilled_runs != 0:
+            spilled_counts = list(self._read_spilled_runs())
+            counts = pd.concat(spilled_counts + [counts]).groupby(level=0, sort=False).sum()
+        if parse_values != None:
+            counts.index = parse_values(counts.index)
+            counts = counts[counts.index.notna()]
+            if not counts.index.is_unique:
+                counts = counts.groupby(level=0, sort=False).sum()
+
+        counts.index.name = name
+        counts.name = 'count'
+        return counts.sort_values(ascending=False)
+
+    def category_profile(self, name=None, parse_values=None) -> CategoryProfile:
+        if self._distinct_values is None:
+            return profile_category_counts(self.value_counts(name, parse_values))
+        top_counts = self.value_counts(name, parse_values).iloc[:TOP_CATEGORIES]
+        num_categories = max(int(round(self._distinct_values.estimate())), len(self._values))
+        return CategoryProfile(top_counts, num_categories, self._num_values - int(top_counts.sum()), APPROXIMATE_FREQUENCIES)
+
+    def _reduce_counts(self) -> None:
+        if self._distinct_values is None:
+            # Every value so far is still counted, the sketch starts from them
+            self._distinct_values = HyperLogLog()
+            self._distinct_values.update(self._values)
+        # Taking the count of the first value past the cap off every counter leaves at
+        # most cap counters above zero (Agarwal et al. 2012, mergeable summaries)
+        decrement = np.partition(self._counts, len(self._counts) - self._category_cap - 1)[len(self._counts) - self._category_cap - 1]
+        kept_mask = self._counts > decrement
+        self._values = self._values[kept_mask]
+        self._counts = self._counts[kept_mask] - decrement
+
+    def _spill(self) -> None:
+        with open(self._spill_file_path, 'ab') as spill_file:
+            pickle.dump((self._values, self._counts), spill_file)
+        self._spilled_runs += 1
+        self._values = None
+        self._counts = None
+
+    def _read_spilled_runs(self):
+        with open(self._spill_file_path, 'rb') as spill_file:
+            for _ in range(self._spilled_runs):
+                values, counts = pickle.load(spill_file)
+                yield pd.Series(counts, index=values)
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from .data_file_formats import TABULAR_FILE_EXTENSIONS
+
 def separate_strings_with_underscore(strings: list, alphabetize: bool=False) -> str:
     if alphabetize == True:
         strings = sorted(strings, key=str.lower)
@@ -32,8 +34,7 @@ def find_match(name: str, filenames: list[str], extensions=None) -> str | None:
     
     # Default to common tabular data formats if no extensions specified
     if extensions is None:
-        extensions = ['.csv', '.tsv', '.xlsx', '.xls', '.parquet', 
-                     '.json', '.jsonl', '.feather', '.orc', '.avro']
+        extensions = TABULAR_FILE_EXTENSIONS
     
     # Convert single extension string to list
     if isinstance(extensions, str):
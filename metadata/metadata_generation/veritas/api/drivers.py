@@ -36,8 +36,8 @@ class FullAnalysisDriver:
         self.__rule_book = rule_book_builder.get_rule_book()
         self.__veritas_file_writer.write_rules(self.__rule_book)
 
-    def execute_rules(self, metadata_generation_input: MetadataGenerationInput) -> None:
-        rule_book_execution = RuleBookExecution()
+    def execute_rules(self, metadata_generation_input: MetadataGenerationInput, processes=1, memory_budget=None) -> None:
+        rule_book_execution = RuleBookExecution(processes, memory_budget)
         rule_book_execution.execute_rules(metadata_generation_input, self.__rule_book)
         
     def distill_data_quality_characterization(self, metadata_generation_input: MetadataGenerationInput) -> None:
@@ -1,6 +1,7 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
 import copy 
+import numpy as np
 
 from dataclasses import dataclass
 
@@ -232,6 +233,22 @@ class ForeignKey(Key):
         return copy.deepcopy(self._primary_key)
     
 
+@dataclass
+class ErroneousRecords:
+    """
+        The records a rule found in a table: a mask over its rows, how many rows are set
+        and the rule's value in the first of them, without copying the rows themselves.
+    """
+
+    mask: np.ndarray
+    num_records: int
+    example_value: object = None
+
+    @property
+    def positions(self) -> np.ndarray:
+        return np.flatnonzero(self.mask)
+
+
 @dataclass
 class JSONIndex:
 
@@ -1,12 +1,10 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
-import pandas as pd
-
 from dataclasses import dataclass
 
 from ...veritas.error_catalog_generation.group_id import GeneralGroupIDRegistry, LowFrequencyGroupIDRegistry
 
-from ...veritas.datatypes import LocationIDEnum
+from ...veritas.datatypes import LocationIDEnum, ErroneousRecords
 
 from ...veritas.datatypes import GeneralGroupIDEnum, LowFrequencyGroupIDEnum
 
@@ -30,9 +28,9 @@ class IDTag():
         return self._location_ID
     
     @location_ID.setter
-    def location_ID(self, location_id_info: tuple[LocationIDEnum, pd.DataFrame]) -> None:
-        location_ID, error_df = location_id_info
-        if error_df is None: 
+    def location_ID(self, location_id_info: tuple[LocationIDEnum, ErroneousRecords]) -> None:
+        location_ID, erroneous_records = location_id_info
+        if erroneous_records is None: 
             self._location_ID = None
             return
         self._location_ID = location_ID
@@ -45,12 +43,12 @@ class PercentErroneousBasedIDTag(IDTag):
         return self._group_ID
     
     @group_ID.setter
-    def group_ID(self, group_id_info: tuple[pd.DataFrame, int]) -> None:
-        error_df, original_df_size = group_id_info
-        if error_df is None: 
+    def group_ID(self, group_id_info: tuple[ErroneousRecords, int]) -> None:
+        erroneous_records, original_df_size = group_id_info
+        if erroneous_records is None: 
             self._group_id = None
             return
-        error_percentage = (float(len(error_df.index)) / float(original_df_size)) * 100 
+        error_percentage = (float(erroneous_records.num_records) / float(original_df_size)) * 100 
         self._group_ID = GeneralGroupIDRegistry.get_group_id(error_percentage)
 
 
@@ -1,11 +1,15 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
+import threading
+
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from ...veritas.datatypes import RuleTypeEnum, LocationIDEnum, ForeignKey
 from ...veritas.datatypes import CodependentRuleGroupEnum, ReferenceGroupIDEnum
 from ...metadata_generation_input import MetadataGenerationInput
 from ...dataframe import DatasetFile
+from ...utils.parallel import MemoryBudget
 
 from ...veritas.rule_table_generation.rule_generation import RuleBook, CodependentRuleGroup
 from ...veritas.rule_table_generation.rule import Rule, TableRuleParameters, AttributeRuleParameters
@@ -20,6 +24,11 @@ from ...veritas.error_catalog_generation.result import MissingResult
 from _strptime import TimeRE
 
 
+# Memory per row a running table takes beyond the table itself: a boolean record mask,
+# and a float64 or datetime64 coerced view or the int64 codes of a key index
+RULE_WORKSPACE_BYTES_PER_ROW = 1 + 8 + 8
+
+
 class IndependentRuleExecutionStrategy(): 
 
     @abstractmethod
@@ -29,6 +38,10 @@ class IndependentRuleExecutionStrategy():
 
 class CodependentRuleExecutionStrategy():
 
+    @abstractmethod
+    def get_table_names(self, rule_group: CodependentRuleGroup) -> list[str]:
+        pass
+
     @abstractmethod
     def precondition_data(self, metadata_generation_input: MetadataGenerationInput, 
                           rule_parameter: TableRuleParameters) -> None:
@@ -53,6 +66,15 @@ class ReferenceKeyStrategy(CodependentRuleExecutionStrategy):
         primary_key_table = metadata_generation_input.get_dataset_file(foreign_key.primary_key_table_name)       
         return foreign_key_table, primary_key_table
 
+    def get_table_names(self, rule_group: CodependentRuleGroup) -> list[str]:
+        table_names = []
+        for rule in rule_group.iterate():
+            foreign_key = rule.rule_parameters.foreign_key
+            for table_name in [foreign_key.table_name, foreign_key.primary_key_table_name]:
+                if table_name not in table_names:
+                    table_names.append(table_name)
+        return table_names
+
     def precondition_data(self, metadata_generation_input: MetadataGenerationInput, rule_group: CodependentRuleGroup) -> None:
         for rule in rule_group.iterate(): 
             foreign_key = rule.rule_parameters.foreign_key
@@ -102,7 +124,7 @@ class KeyUniquenessStrategy(IndependentRuleExecutionStrategy):
         primary_key = rule_parameters.primary_key
         if primary_key.is_composite_key == True:
             dataset_file.create_composite_key(primary_key.attribute_names())
-        duplicate_IDs = dataset_file.get_rows_with_duplicate_values(primary_key.key_name)
+        duplicate_IDs = dataset_file.get_records_with_duplicate_values(primary_key.key_name)
         id_tags = PercentErroneousBasedIDTag()
         id_tags.location_ID = (LocationIDEnum.UNIQUENESS_VIOLATION, duplicate_IDs)
         id_tags.group_ID = (duplicate_IDs, dataset_file.num_rows)
@@ -115,11 +137,18 @@ class KeyUniquenessStrategy(IndependentRuleExecutionStrategy):
 class LowFrequencyStrategy(IndependentRuleExecutionStrategy): 
 
     def execute_rule(self, dataset_file: DatasetFile, rule_parameters: LowFrequencyRuleParameters) -> None:
-        low_frequency_values = dataset_file.get_rows_where_attribute_values_equal(rule_parameters.attribute_name, 
-                                                                                  rule_parameters.low_frequency_values)
+        if rule_parameters.lists_low_frequency_values:
+            low_frequency_values = dataset_file.get_records_where_attribute_values_equal(rule_parameters.attribute_name, 
+                                                                                         rule_parameters.low_frequency_values)
+            number_of_low_frequency_values = rule_parameters.number_of_low_frequency_values
+        else:
+            low_frequency_values, number_of_low_frequency_values = dataset_file.get_records_outside_frequency_constraint(
+                rule_parameters.attribute_name, rule_parameters.frequency_threshold_range)
+            if number_of_low_frequency_values == 0:
+                return
         id_tags = LowFrequencyBasedIDTag()
         id_tags.location_ID = LocationIDEnum.LOW_FREQUENCY
-        id_tags.group_ID = rule_parameters.number_of_low_frequency_values
+        id_tags.group_ID = number_of_low_frequency_values
         error_state = ErrorStateRegistry.get_error_state(id_tags)
         dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, low_frequency_values, error_state)
 
@@ -135,37 +164,37 @@ class NormalOutlierStrategy(IndependentRuleExecutionStrategy):
                                      location_ID: LocationIDEnum,
                                      bounded):
         range_std_dev_low, range_std_dev_high = rule_parameters.get_constraint_ranges_x_std_devs_from_mean(std_devs, bounded)
-        outside_range_df = dataset_file.get_values_outside_std_dev(rule_parameters.attribute_name,
-                                                                   range_std_dev_low, range_std_dev_high)
+        outside_range_records = dataset_file.get_records_outside_std_dev(rule_parameters.attribute_name,
+                                                                         range_std_dev_low, range_std_dev_high)
         id_tags = PercentErroneousBasedIDTag()
-        id_tags.location_ID = (location_ID, outside_range_df)
-        id_tags.group_ID = (outside_range_df, dataset_file.num_rows)
+        id_tags.location_ID = (location_ID, outside_range_records)
+        id_tags.group_ID = (outside_range_records, dataset_file.num_rows)
         error_state = ErrorStateRegistry.get_error_state(id_tags)
-        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, outside_range_df, error_state)
+        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, outside_range_records, error_state)
 
 
 class UnitOutlierStrategy(IndependentRuleExecutionStrategy):
 
     def execute_rule(self, dataset_file: DatasetFile, rule_parameters: UnitOutlierRuleParameters) -> None:
-        unit_outlier_df = dataset_file.get_rows_outside_numerical_constraint(rule_parameters.attribute_name, 
-                                                                             rule_parameters.unit_constraint_range)
+        unit_outlier_records = dataset_file.get_records_outside_numerical_constraint(rule_parameters.attribute_name, 
+                                                                                     rule_parameters.unit_constraint_range)
         id_tags = PercentErroneousBasedIDTag()
-        id_tags.location_ID = (LocationIDEnum.UNIT_OUTLIER, unit_outlier_df)
-        id_tags.group_ID = (unit_outlier_df, dataset_file.num_rows)
+        id_tags.location_ID = (LocationIDEnum.UNIT_OUTLIER, unit_outlier_records)
+        id_tags.group_ID = (unit_outlier_records, dataset_file.num_rows)
         error_state = ErrorStateRegistry.get_error_state(id_tags)
-        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, unit_outlier_df, error_state)        
+        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, unit_outlier_records, error_state)        
 
 
 class DateOutlierStrategy(IndependentRuleExecutionStrategy):
 
     def execute_rule(self, dataset_file: DatasetFile, rule_parameters: DateOutlierRuleParameters) -> None:
-        date_outlier_df = dataset_file.get_rows_outside_date_constraint(rule_parameters.attribute_name, 
-                                                                        rule_parameters.date_constraint_range)
+        date_outlier_records = dataset_file.get_records_outside_date_constraint(rule_parameters.attribute_name, 
+                                                                                rule_parameters.date_constraint_range)
         id_tags = PercentErroneousBasedIDTag()
-        id_tags.location_ID = (LocationIDEnum.DATE_OUTLIER, date_outlier_df)
-        id_tags.group_ID = (date_outlier_df, dataset_file.num_rows)
+        id_tags.location_ID = (LocationIDEnum.DATE_OUTLIER, date_outlier_records)
+        id_tags.group_ID = (date_outlier_records, dataset_file.num_rows)
         error_state = ErrorStateRegistry.get_error_state(id_tags)
-        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, date_outlier_df, error_state) 
+        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, date_outlier_records, error_state) 
 
 
 class FormatOutlierStrategy(IndependentRuleExecutionStrategy):
@@ -177,23 +206,23 @@ class FormatOutlierStrategy(IndependentRuleExecutionStrategy):
         
         time_re = TimeRE()
         format_regex = time_re.compile(format_str)
-        format_outlier_df = dataset_file.get_rows_outside_format_constraint(rule_parameters.attribute_name, format_regex)
+        format_outlier_records = dataset_file.get_records_outside_format_constraint(rule_parameters.attribute_name, format_regex)
 
         id_tags = PercentErroneousBasedIDTag()
-        id_tags.location_ID = (LocationIDEnum.FORMAT_OUTLIER, format_outlier_df)
-        id_tags.group_ID = (format_outlier_df, dataset_file.num_rows)
+        id_tags.location_ID = (LocationIDEnum.FORMAT_OUTLIER, format_outlier_records)
+        id_tags.group_ID = (format_outlier_records, dataset_file.num_rows)
         error_state = ErrorStateRegistry.get_error_state(id_tags)
-        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, format_outlier_df, error_state)
+        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, format_outlier_records, error_state)
 
 class SequentialOutlierStrategy(IndependentRuleExecutionStrategy):
 
     def execute_rule(self, dataset_file: DatasetFile, rule_parameters: SequentialOutlierRuleParameters) -> None:
-        sequential_outliers_df = dataset_file.identify_sequential_outliers(rule_parameters.attribute_name)
+        sequential_outlier_records = dataset_file.identify_sequential_outlier_records(rule_parameters.attribute_name)
         id_tags = PercentErroneousBasedIDTag()
-        id_tags.location_ID = (LocationIDEnum.SEQUENTIAL_OUTLIER, sequential_outliers_df)
-        id_tags.group_ID = (sequential_outliers_df, dataset_file.num_rows)
+        id_tags.location_ID = (LocationIDEnum.SEQUENTIAL_OUTLIER, sequential_outlier_records)
+        id_tags.group_ID = (sequential_outlier_records, dataset_file.num_rows)
         error_state = ErrorStateRegistry.get_error_state(id_tags)
-        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, sequential_outliers_df, error_state)
+        dataset_file.change_record_probability_lookup_index(rule_parameters.attribute_name, sequential_outlier_records, error_state)
 
 class RuleExecutionStrategyRegistry():
     def __init__(self): 
@@ -219,18 +248,61 @@ class RuleExecutionStrategyRegistry():
 
 class RuleBookExecution: 
 
-    def __init__(self): 
+    def __init__(self, processes=1, memory_budget=None): 
         self.__rule_execution_strategy_registry = RuleExecutionStrategyRegistry()
+        self.__processes = processes
+        self.__memory_budget = MemoryBudget(memory_budget)
 
     def execute_rules(self, metadata_generation_input: MetadataGenerationInput, rule_book: RuleBook) -> None: 
-        for rule in rule_book.iterate_independent_rules():
-            strategy = self.__rule_execution_strategy_registry.get_rule_execution_strategy(rule.rule_type)
-            rule_parameters = rule.rule_parameters
-            dataset_file = metadata_generation_input.get_dataset_file(rule_parameters.table_name)
-            strategy.execute_rule(dataset_file, rule_parameters)
+        if self.__processes > 1:
+            self.__execute_independent_rules_in_parallel(metadata_generation_input, rule_book)
+        else:
+            for rule in rule_book.iterate_independent_rules():
+                strategy = self.__rule_execution_strategy_registry.get_rule_execution_strategy(rule.rule_type)
+                rule_parameters = rule.rule_parameters
+                dataset_file = metadata_generation_input.get_dataset_file(rule_parameters.table_name)
+                strategy.execute_rule(dataset_file, rule_parameters)
         for rule_group in rule_book.iterate_codependent_rule_groups():
             strategy = self.__rule_execution_strategy_registry.get_rule_execution_strategy(rule_group.rule_group_ID)
-            strategy.precondition_data(metadata_generation_input, rule_group)
-            missing_result = strategy.execute_rule(metadata_generation_input, rule_group)
-            strategy.assign_error_values(metadata_generation_input, missing_result, 'composite_foreign_key')
-            strategy.postcondition_data(metadata_generation_input, rule_group)
\ No newline at end of file
+            # The tables of a group stay loaded until the group is done, composite keys live only in memory
+            table_names = strategy.get_table_names(rule_group)
+            for table_name in table_names:
+                metadata_generation_input.pin_dataset_file(table_name)
+            try:
+                strategy.precondition_data(metadata_generation_input, rule_group)
+                missing_result = strategy.execute_rule(metadata_generation_input, rule_group)
+                strategy.assign_error_values(metadata_generation_input, missing_result, 'composite_foreign_key')
+                strategy.postcondition_data(metadata_generation_input, rule_group)
+            finally:
+                for table_name in table_names:
+                    metadata_generation_input.unpin_dataset_file(table_name)
+
+    def __execute_independent_rules_in_parallel(self, metadata_generation_input: MetadataGenerationInput, rule_book: RuleBook) -> None:
+        # Independent rules only change the error states, probabilities and error log of
+        # their own table. Each worker runs the rules of one table in rule ID order, so
+        # every table ends up as it would after a serial run, changed in place by its worker.
+        table_rules = {}
+        for rule in rule_book.iterate_independent_rules():
+            table_rules.setdefault(rule.rule_parameters.table_name, []).append(rule)
+        # The dataset loads and evicts tables as they are handed out, one worker at a time
+        dataset_lock = threading.Lock()
+
+        def execute_table_rules(table_name):
+            with dataset_lock:
+                metadata_generation_input.pin_dataset_file(table_name)
+                dataset_file = metadata_generation_input.get_dataset_file(table_name)
+            # The table itself is already held by the dataset, the rules only add record
+            # masks over its rows, coerced views and key indices
+            estimated_memory = dataset_file.num_rows * RULE_WORKSPACE_BYTES_PER_ROW
+            self.__memory_budget.acquire(estimated_memory)
+            try:
+                for rule in table_rules[table_name]:
+                    strategy = self.__rule_execution_strategy_registry.get_rule_execution_strategy(rule.rule_type)
+                    strategy.execute_rule(dataset_file, rule.rule_parameters)
+            finally:
+                self.__memory_budget.release(estimated_memory)
+                with dataset_lock:
+                    metadata_generation_input.unpin_dataset_file(table_name)
+
+        with ThreadPoolExecutor(max_workers=self.__processes) as executor:
+            list(executor.map(execute_table_rules, table_rules.keys()))
@@ -149,6 +149,7 @@ class ReferenceRuleParameters(TableRuleParameters):
 class LowFrequencyRuleParameters(AttributeRuleParameters):
 
     _low_frequency_values: None
+    _frequency_threshold: Constraint = None
 
     def __init__(self): 
         self._low_frequency_values = []
@@ -157,6 +158,12 @@ class LowFrequencyRuleParameters(AttributeRuleParameters):
         metadata_attribute_parser = super().initialize_parameters(rule_generation_input)
 
         constraints = rule_generation_input.general_constraints
+        if not metadata_attribute_parser.lists_every_category():
+            # A truncated list leaves out the values under the threshold, the rule finds them by their counts when it runs
+            if not constraints.in_constraints('Frequency_Threshold'):
+                raise IOError("Constraint is missing: Frequency_Threshold")
+            self._frequency_threshold = constraints.get_constraint('Frequency_Threshold')
+            return
         for attribute_value, frequency_percent in metadata_attribute_parser.iterate_categorical():
             if not constraints.within_constraint('Frequency_Threshold', frequency_percent): 
                 self._low_frequency_values.append(attribute_value)
@@ -169,10 +176,18 @@ class LowFrequencyRuleParameters(AttributeRuleParameters):
     def number_of_low_frequency_values(self) -> int: 
         return len(self._low_frequency_values)
 
+    @property
+    def lists_low_frequency_values(self) -> bool:
+        return self._frequency_threshold == None
+
+    @property
+    def frequency_threshold_range(self) -> ConstraintRange:
+        return copy.deepcopy(self._frequency_threshold.get_constraint_range())
+
     @property
     def active_rule(self):
         active_rule = True
-        if self._low_frequency_values == []: 
+        if self._low_frequency_values == [] and self.lists_low_frequency_values: 
             active_rule = False
         return active_rule
 
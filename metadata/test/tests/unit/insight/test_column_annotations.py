@@ -0,0 +1,52 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import pytest
+import pandas as pd
+
+from metadata_generation.insight.column_annotations import ColumnAnnotations, ColumnAnnotationIndex
+
+
+def _get_annotations():
+    return pd.DataFrame({'Name': ['trip_id', 'distance', 'started_at'],
+                         'Data Quality Class': ['primary_key', '?numerical', 'date-time'],
+                         'Type': ['integer', '?number', 'string'],
+                         'Units': [None, 'km', None],
+                         'Format Function': [None, None, 'reachnow.format_time'],
+                         'Description': [None, 'Trip length â€“ road distance', ' '],
+                         'Manual Annotations': [None, '{"minimum": 0}', None]})
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * ColumnAnnotationIndex Tests * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_compiled_annotations_match_the_sheet():
+    annotations = _get_annotations()
+    column_annotation_index = ColumnAnnotationIndex(annotations)
+
+    assert len(column_annotation_index) == 3
+    assert column_annotation_index.get_record_by_name('distance') is column_annotation_index.get_record(1)
+    for column_index in range(3):
+        compiled_column_annotations = ColumnAnnotations(column_index, column_annotation_index)
+        sheet_column_annotations = ColumnAnnotations(column_index, annotations)
+        for annotation_getter in ['name', 'data_quality_class', 'llmd_type', 'units', 'format_module',
+                                  'description', 'description_exists', 'manual_annotations']:
+            assert getattr(compiled_column_annotations, annotation_getter)() == getattr(sheet_column_annotations, annotation_getter)()
+
+    distance_annotations = ColumnAnnotations(1, column_annotation_index)
+    assert distance_annotations.data_quality_class() == 'numerical'
+    assert distance_annotations.description() == 'Trip length - road distance'
+    assert distance_annotations.manual_annotations() == '{"minimum": 0}'
+    assert ColumnAnnotations(2, column_annotation_index).data_quality_class() == 'timestamp'
+    assert ColumnAnnotations(2, column_annotation_index).format_function() == 'format_time'
+
+
+def test_missing_sheet_columns_raise_key_error():
+    column_annotation_index = ColumnAnnotationIndex(_get_annotations()[['Name', 'Data Quality Class']])
+    column_annotations = ColumnAnnotations(0, column_annotation_index)
+
+    assert column_annotations.data_quality_class() == 'primary_key'
+    with pytest.raises(KeyError):
+        column_annotations.llmd_type()
+    assert column_annotations.manual_annotations() == None
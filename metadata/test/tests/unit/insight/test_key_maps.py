@@ -0,0 +1,32 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import pytest
+import nltk
+
+from metadata_generation.insight import key_maps
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * * Key Matching Tests * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+@pytest.mark.parametrize('s1, s2', [('vehicle_id', 'vehicle_id'), ('vehicle_id', 'vehicleid'), ('trip_id', 'trips_id'),
+                                    ('vin', 'vehicle_id'), ('', 'id'), ('abc', 'cab'), ('driver', 'drive_r')])
+def test_bounded_distance_is_the_edit_distance_up_to_the_bound(s1, s2):
+    for max_distance in range(4):
+        distance = nltk.edit_distance(s1, s2)
+        expected_distance = distance if distance <= max_distance else max_distance + 1
+        assert key_maps.calculate_bounded_Levenshtein(s1, s2, max_distance) == expected_distance
+
+
+def test_rank_key_matches_ranks_close_keys_of_other_tables():
+    dataset_primary_keys = {'trips': ['trip_id'], 'vehicle_models': ['model', 'vehicle_ids'], 'vehicles': ['vehicle_id']}
+    primary_key_name_index = key_maps.PrimaryKeyNameIndex(dataset_primary_keys)
+
+    with pytest.warns(UserWarning, match='multiple close matches'):
+        ranked_key_matches = key_maps.rank_key_matches('trips', 'vehicle_id', dataset_primary_keys, primary_key_name_index)
+    assert ranked_key_matches == {0: ('vehicles', 'vehicle_id'), 1: ('vehicle_models', 'vehicle_ids')}
+    assert key_maps.rank_key_matches('trips', 'trip_id', dataset_primary_keys, primary_key_name_index) == {}
+    with pytest.raises(IOError):
+        key_maps.rank_key_matches('trips', 'vehicle_id', {'vehicles': ['vehicle_id'], 'cars': ['vehicle_id']})
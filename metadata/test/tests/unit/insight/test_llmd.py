@@ -1,10 +1,16 @@
 # Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
 
 import pytest
+import numpy as np
 import pandas as pd
 import collections
+import copy
 
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.insight import manual_annotations
+from metadata_generation.insight.factory.llmd_factory import LLMDBuilder
 from metadata_generation.insight.formatting.json_formatting import FrequencyFormatter
+from metadata_generation.utils import statistics
 
 
 #####################################################################################################################################
@@ -17,7 +23,8 @@ from metadata_generation.insight.formatting.json_formatting import FrequencyForm
      (pd.DataFrame({'values' : ['1','1','1','2','2','1.0','1.0']}), [1,2], [5,2]),
      (pd.DataFrame({'values' : [1,'1',1,'2',2,1.0,'1.0']}), [1,2], [5,2]), 
      (pd.DataFrame({'values' : [1.78,'1',1.78,'2',2,1.0,'1.0']}), [1,1.78,2], [3,2,2]),
-     (pd.DataFrame({'values' : [1.78,'1','A',1.78,'2',2,1.0,'1.0']}), [1,'A',1.78,2], [3,1,2,2])]     
+     (pd.DataFrame({'values' : [1.78,'1','A',1.78,'2',2,1.0,'1.0']}), [1,'A',1.78,2], [3,1,2,2]),
+     (pd.DataFrame({'values' : ['3',' 3.0 ',3,'car','1_000',1000,True,'1e3','inf']}), [3,'car',1000,1,'inf'], [3,1,3,1,1])]     
 )
 def test_frequency_formatter(test_df, expected_keys, expected_values):
     frequency_formatter = FrequencyFormatter()
@@ -25,4 +32,87 @@ def test_frequency_formatter(test_df, expected_keys, expected_values):
     keys = frequencies.keys()
     values = list(frequencies.values())
     assert collections.Counter(keys) == collections.Counter(expected_keys)
-    assert collections.Counter(values) == collections.Counter(expected_values) 
\ No newline at end of file
+    assert collections.Counter(values) == collections.Counter(expected_values) 
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * LLMDBuilder Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_parallel_columns_give_the_serial_llmd(tmp_path):
+    rng = np.random.default_rng(1)
+    column_names = ['trip_id', 'distance', 'speed', 'mode', 'passengers', 'fare']
+    pd.DataFrame({'trip_id': np.arange(3000), 'distance': rng.lognormal(1, 0.5, 3000), 'speed': rng.normal(40, 9, 3000),
+                  'mode': rng.choice(['car', 'bike', 'bus'], 3000), 'passengers': rng.integers(1, 5, 3000),
+                  'fare': rng.normal(10, 2, 3000)}).to_csv(str(tmp_path / 'trips.csv'), index=False)
+    dataset_file = PandasDatasetFile(str(tmp_path / 'trips.csv'), ',')
+    annotations = pd.DataFrame({'Name': column_names,
+                                'Data Quality Class': ['primary_key', 'numerical', 'numerical', 'categorical', 'categorical', 'numerical'],
+                                'Type': ['integer', 'number', 'number', 'string', 'integer', 'number'], 'Units': [None] * 6,
+                                'Description': [None] * 6, 'Format Function': [None] * 6, 'Manual Annotations': [None] * 6})
+    partial_metadata = {'project_identifier': 'test', 'identifier': 'trips', 'title': 'Trips', 'description': 'Trips'}
+
+    llmds = []
+    for processes, memory_budget in [(1, None), (4, None), (3, 1)]:
+        llmd_builder = LLMDBuilder(partial_metadata, {'trips': ''}, processes, memory_budget)
+        llmd_builder.add_dataset_file_JSON('trips', dataset_file, annotations)
+        llmds.append(llmd_builder.get_LLMD())
+
+    assert [attribute['name'] for attribute in llmds[0]['objects'][0]['attributes']] == column_names
+    assert llmds[1] == llmds[0]
+    assert llmds[2] == llmds[0]
+
+
+def test_number_of_categories_counts_the_categories_a_truncated_list_leaves_out(tmp_path, monkeypatch):
+    monkeypatch.setattr(statistics, 'CATEGORY_CAP', 50)
+    monkeypatch.setattr(statistics, 'TOP_CATEGORIES', 10)
+    rng = np.random.default_rng(5)
+    stops = rng.zipf(1.5, 2000) % 400
+    pd.DataFrame({'trip_id': np.arange(2000), 'stop': stops, 'mode': rng.choice(['car', 'bike', 'bus'], 2000)}).to_csv(str(tmp_path / 'trips.csv'), index=False)
+    annotations = pd.DataFrame({'Name': ['trip_id', 'stop', 'mode'], 'Data Quality Class': ['primary_key', 'categorical', 'categorical'],
+                                'Type': ['integer', 'integer', 'string'], 'Units': [None] * 3, 'Description': [None] * 3,
+                                'Format Function': [None] * 3, 'Manual Annotations': [None] * 3})
+    llmd_builder = LLMDBuilder({'project_identifier': 'test', 'identifier': 'trips', 'title': 'Trips', 'description': 'Trips'}, {'trips': ''})
+    llmd_builder.add_dataset_file_JSON('trips', PandasDatasetFile(str(tmp_path / 'trips.csv'), ','), annotations)
+    attributes = llmd_builder.get_LLMD()['objects'][0]['attributes']
+    stop_categories, mode_categories = [next(metric for metric in attribute['dataQuality'] if metric['name'] == 'Number of Categories')
+                                        for attribute in attributes[1:]]
+
+    listed_counts = pd.Series(stops).value_counts().iloc[:10]
+    assert stop_categories['mode'] == statistics.TOP_FREQUENCIES
+    assert stop_categories['value'] == len(np.unique(stops))
+    assert [frequency['frequencyN'] for frequency in stop_categories['frequencies']] == listed_counts.to_list()
+    assert stop_categories['otherCategories'] == len(np.unique(stops)) - 10 and isinstance(stop_categories['otherCategories'], int)
+    assert stop_categories['otherFrequencyN'] == 2000 - listed_counts.sum()
+    assert mode_categories['mode'] == statistics.EXACT_FREQUENCIES and mode_categories['value'] == 3
+    assert 'otherCategories' not in mode_categories
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * Manual Annotations Tests * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def _get_annotated_table(table_name, foreign_key_references):
+    attributes = [{'name': 'id'}]
+    for column_name, references in foreign_key_references.items():
+        attributes.append({'name': column_name, 'manual_annotations': {'foreign_key_references': references}})
+    return {'name': table_name, 'type': 'table', 'relationships': {}, 'attributes': attributes}
+
+
+def test_tables_resolved_as_added_match_a_single_resolution():
+    tables = [_get_annotated_table('vehicles', {}),
+              _get_annotated_table('trips', {'vehicle_id': [{'table': 'vehicles', 'key': 'id'}],
+                                             'driver_id': [{'table': 'drivers', 'key': 'id', 'id': 2}]}),
+              _get_annotated_table('stops', {'trip_id': [{'table': 'trips', 'key': 'id'}, {'table': 'trips', 'key': 'leg', 'id': 1}]})]
+    expected_metadata = manual_annotations.resolve_manual_table_annotations({'objects': copy.deepcopy(tables)})
+
+    metadata = {'objects': []}
+    for table in tables:
+        metadata['objects'].append(table)
+        metadata = manual_annotations.resolve_manual_table_annotations(metadata, len(metadata['objects']) - 1)
+
+    assert metadata == expected_metadata
+    assert metadata['objects'][1]['relationships']['refersToPrimaryKeyTables']['drivers'] == [{'foreignKey': 'driver_id', 'foreignKeyRefersTo': 'id', 'keyID': 2}]
+    assert all('manual_annotations' not in attribute for table in metadata['objects'] for attribute in table['attributes'])
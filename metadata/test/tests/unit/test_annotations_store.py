@@ -0,0 +1,55 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import numpy as np
+import pandas as pd
+
+from metadata_generation.annotations_store import AnnotationsStore
+
+
+def _write_annotations(file_path):
+    with pd.ExcelWriter(file_path) as excel_writer:
+        pd.DataFrame({'Name': ['trip_id', 'distance'], 'Data Quality Class': ['primary_key', 'numerical'],
+                      'Units': [np.nan, 'km']}).to_excel(excel_writer, sheet_name='trips', index=False)
+        pd.DataFrame({'Name': ['vehicle_id'], 'Files': ['vehicles_2020']}).to_excel(excel_writer, sheet_name='vehicles', index=False)
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * AnnotationsStore Tests  * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_sheets_are_those_read_from_the_workbook(tmp_path):
+    file_path = str(tmp_path / 'annotations.xlsx')
+    _write_annotations(file_path)
+    annotations_store = AnnotationsStore(file_path)
+
+    assert annotations_store.sheet_names == pd.ExcelFile(file_path).sheet_names
+    for sheet_name in annotations_store.sheet_names:
+        pd.testing.assert_frame_equal(annotations_store.get_sheet(sheet_name), pd.read_excel(file_path, sheet_name=sheet_name))
+    # Changing a sheet that was handed out leaves the store unchanged
+    annotations_store.get_sheet('trips')['Name'] = 'changed'
+    assert annotations_store.get_sheet('trips')['Name'].to_list() == ['trip_id', 'distance']
+
+
+def test_cached_workbook_is_not_parsed_again(tmp_path, monkeypatch):
+    file_path = str(tmp_path / 'annotations.xlsx')
+    _write_annotations(file_path)
+    cache_directory_path = str(tmp_path / 'cache')
+    annotations_store = AnnotationsStore(file_path, cache_directory_path)
+    assert os.path.exists(annotations_store.get_cache_file_path())
+
+    def fail_to_parse(*args, **kwargs):
+        raise AssertionError('cached workbook was parsed')
+
+    monkeypatch.setattr(pd, 'read_excel', fail_to_parse)
+    cached_annotations_store = AnnotationsStore(file_path, cache_directory_path)
+
+    assert cached_annotations_store.sheet_names == annotations_store.sheet_names
+    for sheet_name in annotations_store.sheet_names:
+        pd.testing.assert_frame_equal(cached_annotations_store.get_sheet(sheet_name), annotations_store.get_sheet(sheet_name))
+    # A changed workbook has a cache file of its own
+    monkeypatch.undo()
+    with pd.ExcelWriter(file_path) as excel_writer:
+        pd.DataFrame({'Name': ['trip_id']}).to_excel(excel_writer, sheet_name='trips', index=False)
+    assert AnnotationsStore(file_path, cache_directory_path).sheet_names == ['trips']
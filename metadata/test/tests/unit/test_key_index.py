@@ -0,0 +1,51 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pandas as pd
+
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.key_index import KeyIndex
+from metadata_generation.veritas.datatypes import ForeignKey
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * KeyIndex Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_keys_match_as_a_set_of_them_would():
+    vehicle_ids = KeyIndex(pd.Series([1.0, np.nan, 2.5, 1.0, 7.0, None]))
+    known_vehicle_ids = KeyIndex(pd.Series([1, 2, 7, 7]))
+    named_vehicle_ids = KeyIndex(pd.Series(['1', '7', None]))
+
+    assert vehicle_ids.valid_mask.tolist() == [True, False, True, True, True, False]
+    assert vehicle_ids.duplicated_mask.tolist() == [False, False, False, True, False, False]
+    assert known_vehicle_ids.duplicated_mask.tolist() == [False, False, False, True]
+    # 1.0 is the key 1, the string '1' is not
+    assert vehicle_ids.get_missing_mask(known_vehicle_ids).tolist() == [False, False, True, False, False, False]
+    assert vehicle_ids.get_missing_mask(named_vehicle_ids).tolist() == [True, False, True, True, True, False]
+    assert not KeyIndex(pd.Series([None, None])).get_missing_mask(known_vehicle_ids).any()
+
+
+def test_primary_key_index_is_built_once_for_every_reference(tmp_path):
+    for table_name, table_text in [('vehicles', 'vehicle_id,make\n1,ford\n2,kia\n3,audi\n'),
+                                   ('trips', 'trip_id,vehicle_id\n1,1\n2,4\n3,\n4,4\n'),
+                                   ('repairs', 'repair_id,vehicle_id\n1,3\n2,2\n')]:
+        (tmp_path / (table_name + '.csv')).write_text(table_text)
+    vehicles = PandasDatasetFile(str(tmp_path / 'vehicles.csv'), ',')
+    trips = PandasDatasetFile(str(tmp_path / 'trips.csv'), ',')
+    repairs = PandasDatasetFile(str(tmp_path / 'repairs.csv'), ',')
+
+    orphan_trips = trips.get_rows_with_missing_values_from_compared(vehicles, ForeignKey('trips.csv', ['vehicle_id'], 'vehicles.csv', ['vehicle_id']))
+    vehicle_index = vehicles.get_key_index('vehicle_id')
+    assert repairs.get_rows_with_missing_values_from_compared(vehicles, ForeignKey('repairs.csv', ['vehicle_id'], 'vehicles.csv', ['vehicle_id'])) is None
+    assert vehicles.get_key_index('vehicle_id') is vehicle_index
+    assert orphan_trips.index.tolist() == [1, 3]
+    assert vehicles.get_records_with_duplicate_values('vehicle_id') is None
+
+    # A rewritten key column is indexed again
+    vehicles.create_composite_key(['vehicle_id'])
+    composite_key_index = vehicles.get_key_index('composite_key')
+    vehicles.drop_composite_key()
+    vehicles.create_composite_key(['make'])
+    assert vehicles.get_key_index('composite_key') is not composite_key_index
@@ -0,0 +1,87 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+
+from metadata_generation.dataframe import LazyDataset, PandasDatasetFile
+
+
+def _write_tables(directory_path, table_names):
+    file_paths = []
+    for table_name in table_names:
+        file_path = os.path.join(directory_path, table_name + '.csv')
+        with open(file_path, 'w') as dataset_file:
+            dataset_file.write('id,value\n' + ''.join('{},{}\n'.format(row, row * 2) for row in range(100)))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def _lazy_dataset(directory_path, table_names, memory_ceiling):
+    dataset = LazyDataset(memory_ceiling, str(directory_path))
+    for file_path in _write_tables(str(directory_path), table_names):
+        dataset.add_dataset_file(file_path, ',')
+    return dataset
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * LazyDataset Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_tables_load_on_first_access(tmp_path):
+    dataset = _lazy_dataset(tmp_path, ['a', 'b'], None)
+
+    assert list(dataset.get_dataset_file_names()) == ['a', 'b']
+    assert dataset.loaded_dataset_file_names == []
+
+    table = dataset.get_dataset_file('b')
+
+    assert dataset.loaded_dataset_file_names == ['b']
+    assert dataset.get_dataset_file('b') is table
+
+
+def test_least_recently_used_table_is_evicted(tmp_path):
+    dataset = _lazy_dataset(tmp_path, ['a', 'b', 'c'], 1)
+
+    dataset.get_dataset_file('a')
+    dataset.get_dataset_file('b')
+    dataset.pin_dataset_file('b')
+    dataset.get_dataset_file('c')
+
+    assert dataset.loaded_dataset_file_names == ['b', 'c']
+
+    dataset.unpin_dataset_file('b')
+
+    assert dataset.loaded_dataset_file_names == ['c']
+
+
+def test_tables_are_measured_again_as_they_grow(tmp_path):
+    loaded_memory = PandasDatasetFile(*_write_tables(str(tmp_path), ['a']), ',').memory_usage
+    # Room for both tables as they are loaded
+    dataset = _lazy_dataset(tmp_path, ['a', 'b'], 2 * loaded_memory)
+    table = dataset.get_dataset_file('a')
+
+    dataset.pin_dataset_file('a')
+    table.get_key_index('value')
+    table.mean('value')
+    dataset.unpin_dataset_file('a')
+
+    assert dataset.memory_in_use == table.memory_usage > loaded_memory
+    dataset.get_dataset_file('b')
+
+    assert dataset.loaded_dataset_file_names == ['b']
+
+
+def test_modified_table_is_spilled_and_restored(tmp_path):
+    dataset = _lazy_dataset(tmp_path, ['a', 'b'], 1)
+
+    dataset.get_dataset_file('a').add_missing(3)
+    dataset.get_dataset_file('b')
+
+    assert dataset.loaded_dataset_file_names == ['b']
+    assert os.path.exists(os.path.join(str(tmp_path), 'a.pkl'))
+
+    table = dataset.get_dataset_file('a')
+
+    assert table.modified
+    assert table.data_quality.missing_count == 3
+    assert not os.path.exists(os.path.join(str(tmp_path), 'a.pkl'))
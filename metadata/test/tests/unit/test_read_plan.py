@@ -0,0 +1,120 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import pytest
+import pandas as pd
+
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.read_plan import ReadPlan, ReadPlanBuilder
+
+
+def _annotations(rows):
+    return pd.DataFrame(rows, columns=['Name', 'Type', 'Data Quality Class', 'Units'])
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * ReadPlanBuilder Tests * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_build_read_plan():
+    annotations = _annotations([
+        ['trip_id', 'integer', 'primary_key', None],
+        ['speed', '?float', 'numerical', 'mph'],
+        ['mode', 'string', 'categorical', None],
+        ['notes', 'string', 'none', None],
+        ['start_date', 'date', 'date', None],
+        ['end_time', 'string', '?date-time', '%H:%M'],
+    ])
+
+    read_plan = ReadPlanBuilder.build_read_plan(annotations)
+
+    assert read_plan.usecols == ['trip_id', 'speed', 'mode', 'notes', 'start_date', 'end_time']
+    assert read_plan.dtypes == {'trip_id': 'Int64', 'speed': 'float64', 'mode': 'category', 'notes': 'str'}
+    assert read_plan.parse_dates == ['start_date']
+
+
+def test_read_csv_arguments_ignore_missing_columns():
+    read_plan = ReadPlan({'a': 'Int64', 'missing': 'float64'}, ['missing_date'], ['a', 'missing', 'missing_date'])
+
+    read_csv_arguments = read_plan.get_read_csv_arguments(['a', 'b'])
+
+    assert read_csv_arguments == {'usecols': ['a'], 'dtype': {'a': 'Int64'}, 'parse_dates': []}
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * Typed Loading Tests * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_typed_loading(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('trip_id,distance,mode,unannotated,start_date\n'
+                         '1,2,car,x,2020-01-01\n'
+                         '2,,bike,y,2020-01-02\n'
+                         '3,4.5,car,z,2020-01-03\n')
+    annotations = _annotations([
+        ['trip_id', 'integer', 'primary_key', None],
+        ['distance', 'integer', 'numerical', None],
+        ['mode', 'string', 'categorical', None],
+        ['start_date', 'date', 'date', None],
+    ])
+    read_plan = ReadPlanBuilder.build_read_plan(annotations)
+    read_plan.dtypes['distance'] = 'float64'
+
+    table = PandasDatasetFile(str(file_path), ',', read_plan)
+
+    assert list(table.data_column_order) == ['trip_id', 'distance', 'mode', 'start_date']
+    assert table.dataframe['trip_id'].dtype == 'int64'
+    assert table.dataframe['distance'].dtype == 'float64'
+    assert list(table.dataframe['mode'].cat.categories) == ['car', 'bike']
+    assert pd.api.types.is_datetime64_any_dtype(table.dataframe['start_date'])
+    assert table.mean('distance') == 3.25
+
+
+def test_typed_loading_falls_back_to_inferred_types(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('trip_id,distance\n1,2\nunknown,3\n')
+    annotations = _annotations([
+        ['trip_id', 'integer', 'primary_key', None],
+        ['distance', 'integer', 'numerical', None],
+    ])
+    read_plan = ReadPlanBuilder.build_read_plan(annotations)
+
+    table = PandasDatasetFile(str(file_path), ',', read_plan)
+
+    assert table.dataframe['trip_id'].to_list() == ['1', 'unknown']
+    assert table.dataframe['distance'].dtype == 'int64'
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * CSV Engine Tests  * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_arrow_engine_matches_pandas_engine(tmp_path, typed):
+    pytest.importorskip('pyarrow')
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('trip_id,distance,mode,start_date,notes\n'
+                         '1,2.0,car,2020-01-01,"line one\nline two"\n'
+                         '2,,bike,2020-01-02,\n'
+                         '3,4.5,car,,"say ""hi"""\n')
+    read_plan = None
+    if typed:
+        read_plan = ReadPlanBuilder.build_read_plan(_annotations([
+            ['trip_id', 'integer', 'primary_key', None],
+            ['distance', 'float', 'numerical', None],
+            ['mode', 'string', 'categorical', None],
+            ['start_date', 'date', 'date', None],
+            ['notes', 'string', 'none', None],
+        ]))
+
+    pandas_table = PandasDatasetFile(str(file_path), ',', read_plan, 'pandas')
+    arrow_table = PandasDatasetFile(str(file_path), ',', read_plan, 'pyarrow')
+
+    assert list(arrow_table.data_column_order) == list(pandas_table.data_column_order)
+    assert isinstance(arrow_table.dataframe['notes'].dtype, pd.StringDtype)
+    arrow_df = arrow_table.dataframe.astype(object)
+    pandas_df = pandas_table.dataframe.astype(object)
+    pd.testing.assert_frame_equal(arrow_df.where(arrow_df.notna(), None), pandas_df.where(pandas_df.notna(), None))
+    assert arrow_table.value_counts('mode').to_dict() == pandas_table.value_counts('mode').to_dict()
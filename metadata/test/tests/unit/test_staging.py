@@ -0,0 +1,62 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import pytest
+
+from metadata_generation.settings import DefaultFileLocations
+
+
+DATA_FILE_CONTENTS = 'id,value\n' + ''.join('{},{}\n'.format(row, row * 2) for row in range(20))
+
+
+@pytest.fixture
+def provided_input(tmp_path, monkeypatch):
+    input_path = tmp_path / 'provided'
+    (input_path / 'data').mkdir(parents=True)
+    (input_path / 'descriptive_information').mkdir()
+    (input_path / 'data' / 'trips.csv').write_text(DATA_FILE_CONTENTS)
+
+    staging_directory_path = str(tmp_path / 'input')
+    monkeypatch.setattr(DefaultFileLocations, 'STAGING_DIRECTORY_PATH', staging_directory_path)
+    monkeypatch.setattr(DefaultFileLocations, 'INPUT_DIRECTORY_PATH', staging_directory_path)
+    monkeypatch.setattr(DefaultFileLocations, 'DATA_DIRECTORY_PATH', os.path.join(staging_directory_path, 'data'))
+    monkeypatch.setattr(DefaultFileLocations, 'DESCRIPTIVE_INFO_PATH', os.path.join(staging_directory_path, 'descriptive_information'))
+    return str(input_path)
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * Input Staging Tests * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_in_place_staging_reads_provided_input(provided_input):
+    DefaultFileLocations.set_input(provided_input, -1, 1, 'in_place')
+
+    assert DefaultFileLocations.DATA_DIRECTORY_PATH == os.path.join(provided_input, 'data')
+    assert DefaultFileLocations.DESCRIPTIVE_INFO_PATH == os.path.join(provided_input, 'descriptive_information')
+    assert not os.path.exists(DefaultFileLocations.STAGING_DIRECTORY_PATH)
+
+
+@pytest.mark.parametrize('staging_mode', ['symlink', 'hardlink'])
+def test_linked_staging_does_not_copy_data(provided_input, staging_mode):
+    DefaultFileLocations.set_input(provided_input, -1, 1, staging_mode)
+
+    staged_file_path = os.path.join(DefaultFileLocations.DATA_DIRECTORY_PATH, 'trips.csv')
+    assert os.path.samefile(staged_file_path, os.path.join(provided_input, 'data', 'trips.csv'))
+    assert os.path.islink(staged_file_path) == (staging_mode == 'symlink')
+
+
+@pytest.mark.parametrize('staging_mode', ['in_place', 'symlink', 'hardlink'])
+def test_sampling_never_writes_into_provided_input(provided_input, staging_mode):
+    DefaultFileLocations.set_input(provided_input, 5, 1, staging_mode)
+
+    sampled_file_path = os.path.join(DefaultFileLocations.DATA_DIRECTORY_PATH, 'trips.csv')
+    with open(sampled_file_path) as sampled_file:
+        assert len(sampled_file.readlines()) == 6
+    with open(os.path.join(provided_input, 'data', 'trips.csv')) as provided_file:
+        assert provided_file.read() == DATA_FILE_CONTENTS
+
+
+def test_unknown_staging_mode(provided_input):
+    with pytest.raises(ValueError):
+        DefaultFileLocations.set_input(provided_input, -1, 1, 'move')
@@ -0,0 +1,143 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.utils import statistics
+from metadata_generation.streaming_statistics import StatisticsPlanBuilder, StreamingDatasetFile
+
+
+PROFILE_STATISTICS = ['count', 'min', 'max', 'mean', 'median', 'std_dev', 'skewness', 'kurtosis']
+
+
+def _write_trips(directory_path):
+    rng = np.random.default_rng(8)
+    trips = pd.DataFrame({
+        'trip_id': np.arange(5000),
+        'distance': np.where(np.arange(5000) % 13 == 0, np.nan, rng.lognormal(1, 0.5, 5000)),
+        'passengers': rng.integers(1, 5, 5000),
+        'mode': rng.choice(['car', 'bike', 'bus'], 5000),
+        'fare': np.where(np.arange(5000) % 500 == 1, 'free', rng.normal(10, 2, 5000).round(2).astype(str)),
+    })
+    # Integers in the first rows, a missing value further down
+    trips.loc[4000, 'passengers'] = None
+    file_path = str(directory_path / 'trips.csv')
+    trips.to_csv(file_path, index=False)
+    return file_path
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * StreamingDatasetFile Tests * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_single_chunk_statistics_are_those_of_the_loaded_table(tmp_path):
+    file_path = _write_trips(tmp_path)
+    dataset_file = PandasDatasetFile(file_path, ',')
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',')
+
+    assert list(streaming_dataset_file.data_column_order) == list(dataset_file.data_column_order)
+    assert streaming_dataset_file.num_rows == dataset_file.num_rows
+    assert streaming_dataset_file.num_columns == dataset_file.num_columns
+    for column_name in ['distance', 'passengers', 'fare']:
+        column_profile = dataset_file.profile(column_name)
+        streaming_column_profile = streaming_dataset_file.profile(column_name)
+        for statistic_name in PROFILE_STATISTICS:
+            assert getattr(streaming_column_profile, statistic_name) == getattr(column_profile, statistic_name)
+    pd.testing.assert_series_equal(streaming_dataset_file.value_counts('mode'), dataset_file.value_counts('mode'))
+
+
+def test_chunked_statistics_match_the_loaded_table(tmp_path):
+    file_path = _write_trips(tmp_path)
+    dataset_file = PandasDatasetFile(file_path, ',')
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', chunk_rows=700)
+
+    for column_name in ['distance', 'passengers']:
+        column_profile = dataset_file.profile(column_name)
+        streaming_column_profile = streaming_dataset_file.profile(column_name)
+        for statistic_name in PROFILE_STATISTICS:
+            expected_value = getattr(column_profile, statistic_name)
+            assert getattr(streaming_column_profile, statistic_name) == pytest.approx(expected_value, rel=1e-9)
+            assert type(getattr(streaming_column_profile, statistic_name)) == type(expected_value)
+    # Chunks of numbers and chunks of strings mix types like the parser does on large files
+    with pytest.raises(TypeError):
+        streaming_dataset_file.max('fare')
+    for statistic_name in ['mean', 'median', 'std_dev', 'skewness', 'kurtosis']:
+        expected_value = getattr(dataset_file, statistic_name)('fare')
+        assert getattr(streaming_dataset_file, statistic_name)('fare') == pytest.approx(expected_value, rel=1e-9)
+    assert streaming_dataset_file.count('fare') == dataset_file.count('fare')
+    pd.testing.assert_series_equal(streaming_dataset_file.value_counts('mode'), dataset_file.value_counts('mode'))
+
+
+def test_strings_with_missing_values_have_no_extremes(tmp_path):
+    file_path = str(tmp_path / 'vehicles.csv')
+    pd.DataFrame({'make': ['ford', 'kia', None, 'audi'] * 10}).to_csv(file_path, index=False)
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', chunk_rows=3)
+
+    with pytest.raises(TypeError):
+        streaming_dataset_file.profile('make')
+    with pytest.raises(TypeError):
+        streaming_dataset_file.min('make')
+    assert streaming_dataset_file.count('make') == 30
+    assert pd.isna(streaming_dataset_file.mean('make'))
+
+
+def test_statistics_plan_limits_the_gathered_statistics(tmp_path):
+    file_path = _write_trips(tmp_path)
+    annotations = pd.DataFrame({'Name': ['trip_id', 'distance', 'mode'],
+                                'Data Quality Class': ['primary_key', 'numerical', 'categorical']})
+
+    statistics_plan = StatisticsPlanBuilder.build_statistics_plan(annotations)
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', statistics_plan=statistics_plan, chunk_rows=1000)
+
+    assert statistics_plan.profiled_columns == ['distance']
+    assert statistics_plan.value_counted_columns == ['mode']
+    assert streaming_dataset_file.count('trip_id') == 5000
+    # A column outside the plan is gathered by a pass of its own
+    assert streaming_dataset_file.max('trip_id') == 4999
+
+
+def test_large_column_median_reports_sketch_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(statistics, 'MEDIAN_MEMORY_VALUES', 1000)
+    file_path = _write_trips(tmp_path)
+    dataset_file = PandasDatasetFile(file_path, ',')
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', chunk_rows=700, median_error_bound=0.01)
+
+    assert streaming_dataset_file.median_mode('distance') == statistics.APPROXIMATE_MEDIAN
+    assert dataset_file.median_mode('distance') == statistics.EXACT_MEDIAN
+    distances = dataset_file.dataframe['distance'].dropna()
+    assert abs((distances < streaming_dataset_file.median('distance')).mean() - 0.5) <= 0.01
+
+
+def test_category_cap_bounds_value_counts(tmp_path):
+    file_path = _write_trips(tmp_path)
+    dataset_file = PandasDatasetFile(file_path, ',')
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', chunk_rows=700, category_cap=100)
+
+    # Few categories are all counted, many are summarized
+    mode_profile = streaming_dataset_file.category_profile('mode')
+    assert mode_profile.mode == statistics.EXACT_FREQUENCIES and mode_profile.num_categories == 3
+    pd.testing.assert_series_equal(mode_profile.counts, dataset_file.category_profile('mode').counts)
+    category_profile = streaming_dataset_file.category_profile('trip_id')
+    assert category_profile.mode == statistics.APPROXIMATE_FREQUENCIES
+    assert len(category_profile.counts) <= 100
+    assert category_profile.num_categories == pytest.approx(5000, rel=0.05)
+    assert category_profile.num_other_values + category_profile.counts.sum() == 5000
+
+
+def test_chunks_count_the_values_of_the_whole_column(tmp_path):
+    file_path = str(tmp_path / 'batteries.csv')
+    # Numbers in the first chunks, strings further down, a number written as a float
+    battery_ids = ['6', '7'] * 10 + ['(null)', '6.0', '7', '(null)', '6']
+    pd.DataFrame({'battery_id': battery_ids, 'cycles': [str(cycle) for cycle in range(24)] + ['']}).to_csv(file_path, index=False)
+    dataset_file = PandasDatasetFile(file_path, ',')
+    streaming_dataset_file = StreamingDatasetFile(file_path, ',', chunk_rows=7)
+
+    for column_name in ['battery_id', 'cycles']:
+        pd.testing.assert_series_equal(streaming_dataset_file.value_counts(column_name), dataset_file.value_counts(column_name))
+        assert streaming_dataset_file.count(column_name) == dataset_file.count(column_name)
+    assert streaming_dataset_file.value_counts('battery_id').to_dict() == {'6': 11, '7': 11, '(null)': 2, '6.0': 1}
+    # Integers with a missing value are counted as the floats the whole column is read as
+    assert streaming_dataset_file.value_counts('cycles').index.dtype == np.float64
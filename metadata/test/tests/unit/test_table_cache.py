@@ -0,0 +1,84 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import mmap
+import numpy as np
+import pandas as pd
+
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.table_cache import ParsedTableCache
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * ParsedTableCache Tests  * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_cache_round_trip_keeps_values_and_dtypes(tmp_path):
+    df = pd.DataFrame({
+        'id': np.arange(4),
+        'speed': [1.5, np.nan, 3.0, 4.25],
+        'flag': [True, False, True, True],
+        'date': pd.to_datetime(['2020-01-01', None, '2020-01-03', '2020-01-04']),
+        'name': ['a', np.nan, 'b', 'a'],
+        'mixed': [1, 'one', 1.0, np.nan],
+        'mode': pd.Categorical(['car', 'bike', None, 'car']),
+        'notes': pd.array(['x', None, 'y', 'x'], dtype='string'),
+    })
+    table_cache = ParsedTableCache(str(tmp_path))
+
+    table_cache.store('key', df)
+    cached_df = table_cache.load('key')
+
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert cached_df['mixed'].to_list()[:3] == [1, 'one', 1.0]
+    assert table_cache.load('missing_key') is None
+
+
+def test_cache_key_depends_on_contents_and_read_options(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,value\n1,2\n')
+    table_cache = ParsedTableCache(str(tmp_path / 'cache'))
+
+    cache_key = table_cache.get_cache_key(str(file_path), {'delimiter': ','})
+
+    assert table_cache.get_cache_key(str(file_path), {'delimiter': ','}) == cache_key
+    assert table_cache.get_cache_key(str(file_path), {'delimiter': ';'}) != cache_key
+    file_path.write_text('id,value\n1,3\n')
+    assert table_cache.get_cache_key(str(file_path), {'delimiter': ','}) != cache_key
+
+
+def test_cached_table_is_not_parsed_again(tmp_path, monkeypatch):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,value,mode\n1,2.5,car\n2,,bike\n')
+    table_cache = ParsedTableCache(str(tmp_path / 'cache'))
+    parsed_table = PandasDatasetFile(str(file_path), ',', table_cache=table_cache)
+
+    def fail_to_parse(*args):
+        raise AssertionError('cached table was parsed')
+
+    monkeypatch.setattr(PandasDatasetFile, '_read_dataframe', staticmethod(fail_to_parse))
+    cached_table = PandasDatasetFile(str(file_path), ',', table_cache=table_cache)
+
+    pd.testing.assert_frame_equal(cached_table.dataframe, parsed_table.dataframe)
+
+
+def _is_mapped(values):
+    while values is not None:
+        if isinstance(values, mmap.mmap):
+            return True
+        values = getattr(values, 'base', None)
+    return False
+
+
+def test_cached_columns_without_infinite_values_stay_mapped(tmp_path, monkeypatch):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,speed,ratio\n1,2.5,inf\n2,,0.5\n')
+    table_cache = ParsedTableCache(str(tmp_path / 'cache'))
+    parsed_df = pd.DataFrame({'id': [1, 2], 'speed': [2.5, np.nan], 'ratio': [np.inf, 0.5]})
+    monkeypatch.setattr(PandasDatasetFile, '_read_dataframe', staticmethod(lambda *args: parsed_df.copy()))
+    PandasDatasetFile(str(file_path), ',', table_cache=table_cache)
+    cached_df = PandasDatasetFile(str(file_path), ',', table_cache=table_cache).dataframe
+
+    assert _is_mapped(cached_df['id'].to_numpy()) and _is_mapped(cached_df['speed'].to_numpy())
+    # Only the column holding infinite values is rewritten
+    assert pd.isna(cached_df['ratio'][0]) and not _is_mapped(cached_df['ratio'].to_numpy())
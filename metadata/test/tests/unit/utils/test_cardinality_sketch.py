@@ -0,0 +1,39 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pytest
+
+from metadata_generation.utils.cardinality_sketch import HyperLogLog, hash_values
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * HyperLogLog Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+@pytest.mark.parametrize('num_distinct_values', [5, 3000, 400000])
+def test_estimate_is_within_a_few_standard_errors(num_distinct_values):
+    values = np.random.default_rng(4).permutation(np.repeat(np.arange(num_distinct_values).astype(str), 2))
+    sketch = HyperLogLog()
+
+    for chunk in np.array_split(values, 7):
+        sketch.update(chunk)
+
+    assert sketch.estimate() == pytest.approx(num_distinct_values, rel=4 * 1.04 / np.sqrt(sketch.num_registers))
+
+
+def test_merged_sketches_estimate_the_union():
+    first_sketch, second_sketch, union_sketch = HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+    first_sketch.update(np.arange(0, 60000))
+    second_sketch.update(np.arange(40000, 100000))
+    union_sketch.update(np.arange(0, 100000))
+
+    first_sketch.merge(second_sketch)
+
+    assert first_sketch.estimate() == union_sketch.estimate()
+    with pytest.raises(ValueError):
+        first_sketch.merge(HyperLogLog(14))
+
+
+def test_numbers_hash_alike_as_integers_and_floats():
+    assert (hash_values(np.array([3, 7, -2])) == hash_values(np.array([3.0, 7.0, -2.0]))).all()
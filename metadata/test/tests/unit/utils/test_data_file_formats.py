@@ -0,0 +1,45 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import pandas as pd
+
+from metadata_generation.dataframe import Dataset, PandasDatasetFile
+from metadata_generation.read_plan import ReadPlan
+from metadata_generation.utils.data_file_formats import get_compression, is_data_file, strip_data_file_extension
+from metadata_generation.utils.string_ops import find_match
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * Data File Format Tests * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_compound_extensions_are_stripped():
+    assert strip_data_file_extension('trips.csv.gz') == 'trips'
+    assert strip_data_file_extension('battery.test.parquet') == 'battery.test'
+    assert strip_data_file_extension('notes.txt') == 'notes'
+    assert Dataset.get_dataset_file_name('/data/trips.csv.zst') == 'trips'
+    assert get_compression('trips.csv.bz2') == 'bz2' and get_compression('trips.csv') == None
+    assert not is_data_file('trips.gz')
+    assert find_match('trips', ['vehicles.csv', 'trips.csv.gz']) == 'trips.csv.gz'
+
+
+def test_compressed_and_columnar_tables_read_like_csv(tmp_path):
+    table = pd.DataFrame({'id': [1, 2, 3], 'speed': [1.5, None, 3.0], 'mode': ['car', None, 'bike']})
+    table.to_csv(str(tmp_path / 'trips.csv'), index=False)
+    table.to_csv(str(tmp_path / 'trips.csv.gz'), index=False)
+    table.to_parquet(str(tmp_path / 'trips.parquet'))
+    table.to_feather(str(tmp_path / 'trips.feather'))
+
+    expected_df = PandasDatasetFile(str(tmp_path / 'trips.csv'), ',').dataframe
+    for file_name in ['trips.csv.gz', 'trips.parquet', 'trips.feather']:
+        pd.testing.assert_frame_equal(PandasDatasetFile(str(tmp_path / file_name), ',').dataframe, expected_df)
+
+
+def test_columnar_read_projects_planned_columns(tmp_path):
+    pd.DataFrame({'id': [1, 2], 'date': ['2020-01-01', '2020-01-02'], 'unused': ['a', 'b']}).to_parquet(str(tmp_path / 'trips.parquet'))
+    read_plan = ReadPlan(usecols=['id', 'date'], parse_dates=['date'])
+
+    dataset_file = PandasDatasetFile(str(tmp_path / 'trips.parquet'), ',', read_plan)
+
+    assert list(dataset_file.data_column_order) == ['id', 'date']
+    assert pd.api.types.is_datetime64_any_dtype(dataset_file.dataframe['date'])
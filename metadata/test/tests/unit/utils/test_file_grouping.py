@@ -0,0 +1,41 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+from metadata_generation.utils.file_grouping import DataQualityAggregation
+from metadata_generation.utils.statistics import EXACT_FREQUENCIES, TOP_FREQUENCIES
+
+
+def _number_of_categories(value, frequencies, mode, **other_categories):
+    return {'name': 'Number of Categories', 'value': value, 'units': 'n/a', 'description': 'Number of distinct/unique values for attribute/column',
+            'frequencies': [{'name': name, 'frequencyN': count, 'frequencyPercent': count / 10} for name, count in frequencies],
+            'mode': mode, **other_categories}
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * DataQualityAggregation Tests * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_grouped_frequency_lists_stay_truncated():
+    data_quality_aggregation = DataQualityAggregation()
+    data_quality_aggregation.add_quality([_number_of_categories(2, [('car', 600), ('bus', 400)], EXACT_FREQUENCIES)])
+    data_quality_aggregation.add_quality([_number_of_categories(50, [('car', 500), ('bike', 300)], TOP_FREQUENCIES,
+                                                                otherCategories=48, otherFrequencyN=200, otherFrequencyPercent=20.0)])
+
+    number_of_categories, = data_quality_aggregation.get_data_quality_aggregate()
+
+    assert number_of_categories['mode'] == TOP_FREQUENCIES
+    assert sorted(frequency['name'] for frequency in number_of_categories['frequencies']) == ['bike', 'bus', 'car']
+    # The list of every category leaves none out
+    assert number_of_categories['otherCategories'] == 24
+    assert number_of_categories['otherFrequencyN'] == 100 and number_of_categories['otherFrequencyPercent'] == 10.0
+
+
+def test_grouped_lists_of_every_category_stay_exact():
+    data_quality_aggregation = DataQualityAggregation()
+    for frequencies in [[('car', 600), ('bus', 400)], [('car', 500)]]:
+        data_quality_aggregation.add_quality([_number_of_categories(len(frequencies), frequencies, EXACT_FREQUENCIES)])
+
+    number_of_categories, = data_quality_aggregation.get_data_quality_aggregate()
+
+    assert number_of_categories['mode'] == EXACT_FREQUENCIES
+    assert 'otherCategories' not in number_of_categories
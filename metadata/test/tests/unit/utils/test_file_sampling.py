@@ -0,0 +1,171 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import gzip
+import numpy as np
+import pandas as pd
+
+from metadata_generation.utils import file_sampling
+from metadata_generation.utils.file_sampling import Reservoir_Sampler, KeyConsistentSampler
+from metadata_generation.utils.file_sampling import SamplingKeyRelationshipReader, SamplingKeyRelationships, SamplingForeignKey
+
+
+def _write_data_file(directory_path, file_name, num_rows, trailing_newline=True):
+    rows = ['{},{}'.format(row, row * 3) for row in range(num_rows)]
+    contents = 'id,value\n' + '\n'.join(rows) + ('\n' if trailing_newline else '')
+    with open(os.path.join(directory_path, file_name), 'w') as data_file:
+        data_file.write(contents)
+    return contents
+
+
+def _read_sample(directory_path, file_name):
+    with open(os.path.join(directory_path, file_name)) as sample_file:
+        return sample_file.read()
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * Reservoir_Sampler Tests * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_sample_keeps_whole_records_in_file_order(tmp_path, monkeypatch):
+    # Small scan chunks so record boundaries fall across chunks
+    monkeypatch.setattr(file_sampling, 'SCAN_CHUNK_BYTES', 7)
+    (tmp_path / 'out').mkdir()
+    _write_data_file(str(tmp_path), 'trips.csv', 500)
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'out'), 50, seed=1).sample()
+
+    sample_lines = _read_sample(str(tmp_path / 'out'), 'trips.csv').splitlines()
+    sampled_ids = [int(line.split(',')[0]) for line in sample_lines[1:]]
+    assert sample_lines[0] == 'id,value'
+    assert len(sampled_ids) == 50
+    assert sampled_ids == sorted(set(sampled_ids))
+    assert all(line == '{},{}'.format(row, row * 3) for row, line in zip(sampled_ids, sample_lines[1:]))
+
+
+def test_sample_is_reproducible_with_seed(tmp_path):
+    for output_directory_name in ['serial', 'parallel', 'other_seed']:
+        (tmp_path / output_directory_name).mkdir()
+    for file_index in range(3):
+        _write_data_file(str(tmp_path), 'table_{}.csv'.format(file_index), 200 * (file_index + 1))
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'serial'), 20, 1, seed=7).sample()
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'parallel'), 20, 3, seed=7).sample()
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'other_seed'), 20, 1, seed=8).sample()
+
+    for file_index in range(3):
+        file_name = 'table_{}.csv'.format(file_index)
+        assert _read_sample(str(tmp_path / 'serial'), file_name) == _read_sample(str(tmp_path / 'parallel'), file_name)
+    assert _read_sample(str(tmp_path / 'serial'), 'table_2.csv') != _read_sample(str(tmp_path / 'other_seed'), 'table_2.csv')
+
+
+def test_file_smaller_than_sample_is_kept_whole(tmp_path):
+    (tmp_path / 'out').mkdir()
+    contents = _write_data_file(str(tmp_path), 'trips.csv', 5, trailing_newline=False)
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'out'), 10).sample()
+
+    assert _read_sample(str(tmp_path / 'out'), 'trips.csv') == contents + '\n'
+
+
+def test_sample_keeps_quoted_newlines_in_their_record(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_sampling, 'SCAN_CHUNK_BYTES', 5)
+    (tmp_path / 'out').mkdir()
+    rows = ['{},"note {}\nsecond ""line"" {}",{}'.format(row, row, row, row * 3) for row in range(200)]
+    with open(str(tmp_path / 'trips.csv'), 'w') as data_file:
+        data_file.write('id,"multi\nline header",value\n' + '\n'.join(rows) + '\n')
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'out'), 30, seed=2).sample()
+
+    sample = pd.read_csv(str(tmp_path / 'out' / 'trips.csv'))
+    assert list(sample.columns) == ['id', 'multi\nline header', 'value']
+    assert len(sample.index) == 30
+    assert (sample['value'] == sample['id'] * 3).all()
+    assert (sample['multi\nline header'] == sample['id'].map('note {0}\nsecond "line" {0}'.format)).all()
+
+
+def test_compressed_sample_keeps_compression_and_whole_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_sampling, 'SCAN_CHUNK_BYTES', 11)
+    (tmp_path / 'out').mkdir()
+    rows = ['{},"note {}\nline",{}'.format(row, row, row * 3) for row in range(400)]
+    with gzip.open(str(tmp_path / 'trips.csv.gz'), 'wt') as data_file:
+        data_file.write('id,note,value\n' + '\n'.join(rows))
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'out'), 40, seed=5).sample()
+
+    sample = pd.read_csv(str(tmp_path / 'out' / 'trips.csv.gz'))
+    assert len(sample.index) == 40
+    assert sample['id'].is_monotonic_increasing and sample['id'].is_unique
+    assert (sample['value'] == sample['id'] * 3).all()
+    assert (sample['note'] == sample['id'].map('note {}\nline'.format)).all()
+
+
+def test_columnar_sample_keeps_types(tmp_path):
+    (tmp_path / 'out').mkdir()
+    table = pd.DataFrame({'id': np.arange(5000), 'speed': np.arange(5000) / 2, 'mode': ['car', 'bike'] * 2500})
+    table.to_parquet(str(tmp_path / 'trips.parquet'), row_group_size=300)
+    table.to_feather(str(tmp_path / 'vehicles.feather'))
+
+    Reservoir_Sampler(str(tmp_path), str(tmp_path / 'out'), 25, seed=6).sample()
+
+    for sample in [pd.read_parquet(str(tmp_path / 'out' / 'trips.parquet')), pd.read_feather(str(tmp_path / 'out' / 'vehicles.feather'))]:
+        assert len(sample.index) == 25
+        assert sample['id'].is_monotonic_increasing and sample['id'].is_unique
+        pd.testing.assert_frame_equal(sample, table.iloc[sample['id']].reset_index(drop=True))
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * KeyConsistentSampler Tests * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_read_key_relationships(tmp_path):
+    (tmp_path / 'data').mkdir()
+    for file_name in ['vehicles.csv', 'trips.csv']:
+        (tmp_path / 'data' / file_name).write_text('id\n')
+    annotations_file_path = str(tmp_path / 'annotations.xlsx')
+    with pd.ExcelWriter(annotations_file_path) as excel_writer:
+        pd.DataFrame({'Name': ['vehicle_id', 'make'], 'Data Quality Class': ['primary_key', 'categorical'],
+                      'Manual Annotations': [None, None]}).to_excel(excel_writer, sheet_name='vehicles', index=False)
+        pd.DataFrame({'Name': ['trip_id', 'vehicle_id'], 'Data Quality Class': ['?primary_key', 'foreign_key'],
+                      'Manual Annotations': [None, '{"foreign_key_references": [{"table": "vehicles", "key": "vehicle_id"}]}']
+                      }).to_excel(excel_writer, sheet_name='trips', index=False)
+
+    key_relationships = SamplingKeyRelationshipReader.read_key_relationships(annotations_file_path, str(tmp_path / 'data'))
+
+    assert key_relationships.primary_keys == {'vehicles': ('vehicle_id',), 'trips': ('trip_id',)}
+    assert key_relationships.foreign_keys == [SamplingForeignKey('trips', ('vehicle_id',), 'vehicles', ('vehicle_id',))]
+
+
+def test_key_sample_keeps_children_of_sampled_parents(tmp_path):
+    (tmp_path / 'out').mkdir()
+    vehicles = pd.DataFrame({'vehicle_id': range(400)})
+    vehicles.to_csv(str(tmp_path / 'vehicles.csv'), index=False)
+    # Every tenth trip points to a vehicle that does not exist
+    trips = pd.DataFrame({'trip_id': range(4000), 'vehicle_id': [row % 400 if row % 10 else 1000 + row for row in range(4000)]})
+    trips.loc[5, 'vehicle_id'] = None
+    trips.to_csv(str(tmp_path / 'trips.csv'), index=False)
+    key_relationships = SamplingKeyRelationships({'vehicles': ('vehicle_id',)},
+                                                 [SamplingForeignKey('trips', ('vehicle_id',), 'vehicles', ('vehicle_id',))])
+
+    KeyConsistentSampler(str(tmp_path), str(tmp_path / 'out'), 0.25, key_relationships, seed=3).sample()
+
+    sampled_vehicles = pd.read_csv(str(tmp_path / 'out' / 'vehicles.csv'))
+    sampled_trips = pd.read_csv(str(tmp_path / 'out' / 'trips.csv'))
+    orphan_mask = ~sampled_trips['vehicle_id'].isin(vehicles['vehicle_id']) & sampled_trips['vehicle_id'].notna()
+    assert 0 < len(sampled_vehicles.index) < 400
+    assert sampled_trips.loc[~orphan_mask, 'vehicle_id'].dropna().isin(sampled_vehicles['vehicle_id']).all()
+    assert 0.05 < orphan_mask.mean() < 0.15
+    # Trips of a kept vehicle are all kept
+    assert sampled_trips['vehicle_id'].isin(sampled_vehicles['vehicle_id']).sum() == trips['vehicle_id'].isin(sampled_vehicles['vehicle_id']).sum()
+
+
+def test_key_sample_keeps_cells_as_written(tmp_path):
+    (tmp_path / 'out').mkdir()
+    (tmp_path / 'vehicles.csv').write_text('vehicle_id,make\n1,NA\n2,null\n4,N/A\n,NaN\n')
+    key_relationships = SamplingKeyRelationships({'vehicles': ('vehicle_id',)}, [])
+
+    KeyConsistentSampler(str(tmp_path), str(tmp_path / 'out'), 1.0, key_relationships, seed=3).sample()
+
+    assert (tmp_path / 'out' / 'vehicles.csv').read_text() == 'vehicle_id,make\n1,NA\n2,null\n4,N/A\n,NaN\n'
@@ -0,0 +1,79 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import threading
+import pytest
+
+from metadata_generation.settings import MetadataGenerationSettings
+from metadata_generation.metadata_generation_input import MetadataGenerationInputReader
+from metadata_generation.read_plan import ReadPlan
+from metadata_generation.utils.parallel import MemoryBudget
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * MemoryBudget Tests  * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_memory_budget_blocks_until_released():
+    memory_budget = MemoryBudget(100)
+    memory_budget.acquire(60)
+    acquired = threading.Event()
+
+    def acquire_more():
+        memory_budget.acquire(60)
+        acquired.set()
+
+    worker = threading.Thread(target=acquire_more)
+    worker.start()
+    assert not acquired.wait(0.1)
+
+    memory_budget.release(60)
+    worker.join(1)
+    assert acquired.is_set()
+    assert memory_budget.bytes_in_use == 60
+
+
+def test_memory_budget_admits_oversized_request_when_idle():
+    memory_budget = MemoryBudget(10)
+    memory_budget.acquire(50)
+    assert memory_budget.bytes_in_use == 50
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * Parallel Loading Tests  * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_parallel_read_dataset_keeps_serial_order(tmp_path):
+    for table_index in range(8):
+        rows = ''.join('{},{}\n'.format(row, row * table_index) for row in range(50 * (8 - table_index)))
+        (tmp_path / 'table_{}.csv'.format(table_index)).write_text('id,value\n' + rows)
+
+    settings = MetadataGenerationSettings()
+    serial_dataset = MetadataGenerationInputReader.read_dataset(settings, str(tmp_path))
+    settings.processes = 4
+    settings.memory_budget = 1
+    parallel_dataset = MetadataGenerationInputReader.read_dataset(settings, str(tmp_path))
+
+    assert list(parallel_dataset.get_dataset_file_names()) == list(serial_dataset.get_dataset_file_names())
+    for (_, serial_file), (_, parallel_file) in zip(serial_dataset.dataset_files, parallel_dataset.dataset_files):
+        assert serial_file.dataframe.equals(parallel_file.dataframe)
+
+
+def test_streaming_statistics_read_dataset_lazily(tmp_path):
+    (tmp_path / 'trips.csv').write_text('id,value\n1,2\n2,4\n')
+    settings = MetadataGenerationSettings()
+    settings.streaming_statistics = True
+    dataset = MetadataGenerationInputReader.read_dataset(settings, str(tmp_path))
+
+    assert dataset.loaded_dataset_file_names == []
+    assert dataset.get_dataset_file('trips').num_rows == 2
+
+
+def test_failed_typed_read_is_reported(tmp_path):
+    (tmp_path / 'trips.csv').write_text('id,value\n1,2\nfirst,4\n')
+    settings = MetadataGenerationSettings()
+
+    with pytest.warns(UserWarning, match="Typed read of '.*trips.csv' failed"):
+        dataset = MetadataGenerationInputReader.read_dataset(settings, str(tmp_path), read_plans={'trips': ReadPlan(dtypes={'id': 'Int64'}, usecols=['id', 'value'])})
+    assert dataset.get_dataset_file('trips').dataframe['id'].to_list() == ['1', 'first']
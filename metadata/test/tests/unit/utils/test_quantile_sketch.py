@@ -0,0 +1,56 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import numpy as np
+import pytest
+
+from metadata_generation.utils.quantile_sketch import KLLSketch, get_k_for_error_bound
+
+
+def _rank_error(values, estimate):
+    return abs(np.mean(values < estimate) - 0.5)
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * * KLLSketch Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+@pytest.mark.parametrize('error_bound', [0.05, 0.01])
+def test_median_is_within_error_bound(error_bound):
+    values = np.random.default_rng(9).lognormal(0, 2, 200000)
+    sketch = KLLSketch.from_error_bound(error_bound)
+
+    for chunk in np.array_split(values, 9):
+        sketch.update(chunk)
+
+    assert sketch.count == 200000
+    assert _rank_error(values, sketch.quantile(0.5)) <= error_bound
+    assert sketch.num_retained < 4 * get_k_for_error_bound(error_bound)
+
+
+def test_merged_sketches_cover_every_chunk():
+    values = np.random.default_rng(10).normal(50, 10, 120000)
+    worker_sketches = [KLLSketch.from_error_bound(0.01, seed=worker) for worker in range(4)]
+    for worker_sketch, chunk in zip(worker_sketches, np.array_split(values, 4)):
+        worker_sketch.update(chunk)
+
+    sketch = KLLSketch.from_error_bound(0.01)
+    for worker_sketch in worker_sketches:
+        sketch.merge(worker_sketch)
+
+    assert sketch.count == 120000
+    assert _rank_error(values, sketch.quantile(0.5)) <= 0.01
+
+
+def test_small_inputs_are_kept_whole():
+    sketch = KLLSketch.from_error_bound(0.01)
+    sketch.update(np.array([3.0, np.nan, 1.0, 2.0]))
+
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 2.0
+    assert np.isnan(KLLSketch().quantile(0.5))
+
+
+def test_invalid_error_bound():
+    with pytest.raises(ValueError):
+        KLLSketch.from_error_bound(0)
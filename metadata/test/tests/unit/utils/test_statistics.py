@@ -2,8 +2,13 @@
 
 import pytest 
 import numpy as np 
+import pandas as pd
 
-from metadata_generation.utils.statistics import NormalDistribution, monotonicity_ratio
+from metadata_generation.dataframe import PandasDatasetFile
+from metadata_generation.utils import statistics
+from metadata_generation.utils.statistics import NormalDistribution, monotonicity_ratio, profile_numeric_values
+from metadata_generation.utils.statistics import CentralMoments, FrequencyAccumulator, MedianAccumulator, EXACT_MEDIAN, APPROXIMATE_MEDIAN
+from metadata_generation.utils.statistics import profile_category_counts, EXACT_FREQUENCIES, TOP_FREQUENCIES, APPROXIMATE_FREQUENCIES
 
 
 #####################################################################################################################################
@@ -45,3 +50,145 @@ def test_monotonicity_ratio(sequence: list, expected_value: float) -> None:
     monotonicity = monotonicity_ratio(sequence_np)
     assert monotonicity == expected_value
 
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * Column Profile Tests  * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+@pytest.mark.parametrize(
+    'values',
+    [np.random.default_rng(1).lognormal(2, 1, 20000),
+     np.where(np.arange(20000) % 7 == 0, np.nan, np.random.default_rng(2).normal(5, 2, 20000)),
+     np.random.default_rng(3).integers(-10**6, 10**6, 20000),
+     np.array([2.5, 2.5, 2.5, 2.5]),
+     np.array([1.0, np.nan, 3.0]),
+     np.array([np.nan, np.nan]),
+     np.array([], dtype=float)]
+)
+def test_profile_matches_pandas_exactly(values):
+    column = pd.Series(values)
+    column_profile = profile_numeric_values(values)
+
+    expected_statistics = {'count': column.count(), 'min': column.min(), 'max': column.max(), 'mean': column.mean(),
+                           'median': column.median(), 'std_dev': column.std(), 'skewness': column.skew(), 'kurtosis': column.kurt()}
+    for statistic_name, expected_value in expected_statistics.items():
+        profiled_value = getattr(column_profile, statistic_name)
+        if pd.isna(expected_value):
+            assert pd.isna(profiled_value), statistic_name
+        else:
+            assert profiled_value == expected_value and type(profiled_value) == type(expected_value), statistic_name
+
+
+def test_profile_matches_column_statistics(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,speed,reading\n1,2.5,4\n2,,x\n3,7.25,6\n4,1.0,9\n5,3.5,7\n')
+    table = PandasDatasetFile(str(file_path), ',')
+
+    for column_name in ['id', 'speed', 'reading']:
+        column_profile = table.profile(column_name)
+        assert column_profile.count == table.count(column_name)
+        assert column_profile.min == table.min(column_name) and column_profile.max == table.max(column_name)
+        assert column_profile.mean == table.mean(column_name) and column_profile.median == table.median(column_name)
+        assert column_profile.std_dev == table.std_dev(column_name)
+        assert column_profile.skewness == table.skewness(column_name) and column_profile.kurtosis == table.kurtosis(column_name)
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * Accumulator Tests * * * * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_merged_moments_match_pandas():
+    values = np.where(np.arange(30000) % 11 == 0, np.nan, np.random.default_rng(4).gamma(2, 3, 30000))
+    column = pd.Series(values)
+
+    central_moments = CentralMoments()
+    for chunk in np.array_split(values, 7):
+        central_moments = central_moments.merge(CentralMoments.from_values(chunk))
+
+    assert central_moments.count == column.count()
+    assert central_moments.mean == pytest.approx(column.mean(), rel=1e-12)
+    assert central_moments.std_dev() == pytest.approx(column.std(), rel=1e-12)
+    assert central_moments.skewness() == pytest.approx(column.skew(), rel=1e-10)
+    assert central_moments.kurtosis() == pytest.approx(column.kurt(), rel=1e-10)
+
+
+@pytest.mark.parametrize('num_values', [1, 2, 501, 1000])
+def test_spilled_median_is_exact(tmp_path, monkeypatch, num_values):
+    # Past the in memory limit the median is selected from the spill file
+    monkeypatch.setattr(statistics, 'MEDIAN_MEMORY_VALUES', 10)
+    monkeypatch.setattr(statistics, 'SPILL_READ_VALUES', 64)
+    values = np.random.default_rng(num_values).normal(0, 1e3, num_values).round(1)
+
+    median_accumulator = MedianAccumulator(str(tmp_path / 'values'))
+    for chunk in np.array_split(values, 3):
+        median_accumulator.add_values(chunk)
+
+    assert median_accumulator.median() == np.median(values)
+
+
+def test_sketched_median_past_exact_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(statistics, 'MEDIAN_MEMORY_VALUES', 1000)
+    values = np.random.default_rng(6).exponential(3, 50000)
+
+    median_accumulator = MedianAccumulator(str(tmp_path / 'values'), error_bound=0.01)
+    median_accumulator.add_values(values[:800])
+    assert median_accumulator.mode == EXACT_MEDIAN
+    assert median_accumulator.median() == np.median(values[:800])
+
+    for chunk in np.array_split(values[800:], 5):
+        median_accumulator.add_values(chunk)
+    assert median_accumulator.mode == APPROXIMATE_MEDIAN
+    assert abs(np.mean(values < median_accumulator.median()) - 0.5) <= 0.01
+    # The exact values are no longer kept
+    assert not (tmp_path / 'values').exists()
+
+
+def test_spilled_value_counts_match_pandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(statistics, 'FREQUENCY_SPILL_VALUES', 4)
+    column = pd.Series(np.random.default_rng(5).choice(['car', 'bike', 'bus', 'walk', 'train', 'tram', None], 1000))
+
+    frequency_accumulator = FrequencyAccumulator(str(tmp_path / 'counts'))
+    for chunk_start in range(0, 1000, 90):
+        frequency_accumulator.add_values(column.iloc[chunk_start:chunk_start + 90])
+
+    pd.testing.assert_series_equal(frequency_accumulator.value_counts(), column.value_counts(), check_index_type=False)
+
+
+def test_category_profile_lists_top_categories_past_cap(monkeypatch):
+    monkeypatch.setattr(statistics, 'CATEGORY_CAP', 50)
+    monkeypatch.setattr(statistics, 'TOP_CATEGORIES', 10)
+    column = pd.Series(np.random.default_rng(2).zipf(1.5, 5000) % 400)
+
+    few_categories_profile = profile_category_counts(column[column < 30].value_counts())
+    category_profile = profile_category_counts(column.value_counts())
+
+    assert few_categories_profile.mode == EXACT_FREQUENCIES
+    assert len(few_categories_profile.counts) == few_categories_profile.num_categories == column[column < 30].nunique()
+    assert category_profile.mode == TOP_FREQUENCIES
+    pd.testing.assert_series_equal(category_profile.counts, column.value_counts().iloc[:10])
+    assert category_profile.num_categories == column.nunique()
+    assert category_profile.num_other_values == 5000 - category_profile.counts.sum()
+
+
+def test_capped_value_counts_keep_heavy_hitters(tmp_path):
+    rng = np.random.default_rng(3)
+    # A few frequent values among many that appear once or twice
+    column = pd.Series(rng.permutation(np.concatenate((np.repeat(['car', 'bike', 'bus'], [3000, 2000, 1000]),
+                                                       rng.integers(0, 20000, 14000).astype(str)))))
+
+    frequency_accumulator = FrequencyAccumulator(str(tmp_path / 'counts'), category_cap=200)
+    for chunk_start in range(0, 20000, 1500):
+        frequency_accumulator.add_values(column.iloc[chunk_start:chunk_start + 1500])
+    category_profile = frequency_accumulator.category_profile()
+
+    expected_counts = column.value_counts()
+    assert category_profile.mode == APPROXIMATE_FREQUENCIES
+    assert list(category_profile.counts.index[:3]) == ['car', 'bike', 'bus']
+    for value in ['car', 'bike', 'bus']:
+        # Misra-Gries counts are low by at most the number of values over the number of counters
+        assert expected_counts[value] - 20000 / 201 <= category_profile.counts[value] <= expected_counts[value]
+    assert category_profile.num_categories == pytest.approx(column.nunique(), rel=0.05)
+    assert category_profile.num_other_values == 20000 - category_profile.counts.sum()
+    assert not (tmp_path / 'counts').exists()
@@ -0,0 +1,180 @@
+# Copyright 2026, Battelle Energy Alliance, LLC, ALL RIGHTS RESERVED
+
+import os
+import numpy as np
+import pandas as pd
+
+from metadata_generation.dataframe import ERRORS_COLUMNS, LazyDataset, PandasDatasetFile
+from metadata_generation.insight.formatting.json_formatting import FrequencyFormatter
+from metadata_generation.utils.constraints import Constraint, ConstraintRange
+from metadata_generation.veritas.error_catalog_generation.error_state import ErrorState
+from metadata_generation.veritas.datatypes import RuleTypeEnum
+from metadata_generation.veritas.rule_table_generation.rule import Rule, LowFrequencyRuleParameters
+from metadata_generation.veritas.rule_table_generation.rule_generation import RuleBook, CodependentRules, IndependentRules
+from metadata_generation.veritas.error_catalog_generation.rule_execution import LowFrequencyStrategy, RuleBookExecution
+
+
+TABLE_NAMES = ['trips', 'vehicles', 'stations']
+
+
+def _lazy_dataset(directory_path, memory_ceiling=None):
+    dataset = LazyDataset(memory_ceiling, str(directory_path))
+    for table_index, table_name in enumerate(TABLE_NAMES):
+        file_path = os.path.join(str(directory_path), table_name + '.csv')
+        modes = ['car', 'bike', 'bus', 'car', 'tram'][table_index:] * 20
+        pd.DataFrame({'id': range(len(modes)), 'mode': modes, 'color': (['red', 'blue'] * 50)[:len(modes)]}).to_csv(file_path, index=False)
+        dataset.add_dataset_file(file_path, ',')
+    return dataset
+
+
+def _low_frequency_rule(rule_id, table_name, attribute_name, low_frequency_values):
+    rule_parameters = LowFrequencyRuleParameters()
+    rule_parameters._table_name = table_name
+    rule_parameters._attribute_name = attribute_name
+    rule_parameters._low_frequency_values = low_frequency_values
+    return Rule(rule_id, RuleTypeEnum.LOW_FREQUENCY, rule_parameters)
+
+
+def _rule_book():
+    independent_rules = IndependentRules()
+    rule_id = 0
+    for attribute_name, low_frequency_values in [('mode', ['bus', 'tram']), ('color', ['blue']), ('mode', ['car'])]:
+        for table_name in TABLE_NAMES:
+            independent_rules.add_rule(_low_frequency_rule(rule_id, table_name, attribute_name, low_frequency_values))
+            rule_id += 1
+    return RuleBook(CodependentRules(), independent_rules)
+
+
+#####################################################################################################################################
+# * * * * * * * * * * * * * * * * * * * * * * * * * * * * RuleBookExecution Tests * * * * * * * * * * * * * * * * * * * * * * * * * #
+#####################################################################################################################################
+
+
+def test_parallel_rules_give_the_serial_error_catalog(tmp_path):
+    os.makedirs(tmp_path / 'serial')
+    os.makedirs(tmp_path / 'parallel')
+    serial_dataset = _lazy_dataset(tmp_path / 'serial')
+    # A ceiling of one byte evicts every table no worker is using
+    parallel_dataset = _lazy_dataset(tmp_path / 'parallel', memory_ceiling=1)
+
+    RuleBookExecution().execute_rules(serial_dataset, _rule_book())
+    RuleBookExecution(processes=3, memory_budget=1).execute_rules(parallel_dataset, _rule_book())
+
+    for table_name in TABLE_NAMES:
+        serial_table = serial_dataset.get_dataset_file(table_name)
+        parallel_table = parallel_dataset.get_dataset_file(table_name)
+        pd.testing.assert_frame_equal(parallel_table.dataframe, serial_table.dataframe)
+        pd.testing.assert_frame_equal(parallel_table.errors, serial_table.errors)
+        assert parallel_table.errors['attribute_name'].to_list() == ['mode', 'color', 'mode']
+
+
+def test_erroneous_records_are_the_rows_found(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,speed,mode\n1,2.5,car\n2,,bus\n3,7.0,car\n4,91.0,tram\n5,-3.5,bus\n1,4.0,\n')
+    table = PandasDatasetFile(str(file_path), ',')
+    constraint_range = ConstraintRange()
+    constraint_range.lower_bound = 0
+    constraint_range.upper_bound = 90
+
+    unit_outlier_records = table.get_records_outside_numerical_constraint('speed', constraint_range)
+    assert unit_outlier_records.positions.tolist() == [3, 4]
+    assert unit_outlier_records.num_records == 2 and unit_outlier_records.example_value == 91.0
+    assert table.get_rows_outside_numerical_constraint('speed', constraint_range).index.tolist() == [3, 4]
+    duplicate_records = table.get_records_with_duplicate_values('id')
+    assert duplicate_records.positions.tolist() == [5] and duplicate_records.example_value == 1
+    low_frequency_records = table.get_records_where_attribute_values_equal('mode', ['bus', 'tram'])
+    assert low_frequency_records.positions.tolist() == [1, 3, 4] and low_frequency_records.example_value == 'bus'
+    assert table.get_records_where_attribute_values_equal('mode', ['bike']) is None
+
+
+def test_columns_are_coerced_once_until_written(tmp_path, monkeypatch):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,fare,started\n1,2.5,2001-05-01\n2,free,1890-01-01\n3,91.0,\n4,7.0,2003-02-11\n')
+    table = PandasDatasetFile(str(file_path), ',')
+    constraint_range = ConstraintRange()
+    constraint_range.lower_bound = 1900
+    constraint_range.upper_bound = 2020
+    coerced_column_names = []
+    for coercion_name in ['to_numeric', 'to_datetime']:
+        def counting_coercion(column, *args, coercion=getattr(pd, coercion_name), **kwargs):
+            coerced_column_names.append(column.name)
+            return coercion(column, *args, **kwargs)
+        monkeypatch.setattr(pd, coercion_name, counting_coercion)
+
+    # Statistics and rules share the view coerced by the first of them
+    assert table.mean('fare') == table.profile('fare').mean == 33.5
+    assert table.get_records_outside_date_constraint('started', constraint_range).positions.tolist() == [1]
+    date_records = table.get_records_outside_date_constraint('started', constraint_range)
+    assert date_records.num_records == 1 and date_records.example_value == pd.Timestamp('1890-01-01')
+    assert coerced_column_names == ['fare', 'started']
+
+    table.create_composite_key(['id'])
+    table.std_dev('composite_key')
+    table.drop_composite_key()
+    table.create_composite_key(['fare'])
+    table.std_dev('composite_key')
+    # The rewritten column is coerced again
+    assert coerced_column_names == ['fare', 'started', 'composite_key', 'composite_key']
+
+
+def test_memory_usage_counts_coerced_copies_only(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,speed,fare\n' + ''.join('{},{}.5,{}\n'.format(row, row, 'free' if row % 3 else row) for row in range(300)))
+    table = PandasDatasetFile(str(file_path), ',')
+    table_memory = table.memory_usage
+
+    # The numeric view of a numeric column is the column itself, only its mask is added
+    table.mean('speed')
+    assert table.memory_usage == table_memory + 300
+    table.mean('fare')
+    assert table.memory_usage == table_memory + 600 + table._numeric_column('fare').memory_usage(deep=True)
+
+
+def test_errors_are_typed_by_column(tmp_path):
+    file_path = tmp_path / 'trips.csv'
+    file_path.write_text('id,mode\n1,car\n2,bus\n')
+    table = PandasDatasetFile(str(file_path), ',')
+    example_values = [3, 2.5, 'bus', True, None, pd.Timestamp('2001-05-01'), np.int64(7)]
+    error_states = [ErrorState(2**0, 1, 'single_record_orphan'), ErrorState(2**3, 0.5, 'date_outlier'), ErrorState(2**5, 0, 'low_frequency')]
+
+    for row, example_value in enumerate(example_values):
+        table._add_new_errors_row(row + 1, example_value, error_states[row % 3], 'mode')
+
+    errors = table.errors
+    assert list(errors.columns) == ERRORS_COLUMNS
+    assert errors.dtypes.to_dict() == {'table_name': object, 'attribute_name': object, 'error_state': object, 'probability': np.float64,
+                                       'num_affected': np.int64, 'example_affected_value': object}
+    # Example values keep their own types, probabilities are floats
+    assert errors['example_affected_value'].to_list()[:4] == [3, 2.5, 'bus', True]
+    assert errors.to_csv(index=False).splitlines()[1:4] == ['trips.csv,mode,single_record_orphan,1.0,1,3',
+                                                            'trips.csv,mode,date_outlier,0.5,2,2.5',
+                                                            'trips.csv,mode,low_frequency,0.0,3,bus']
+    assert errors.to_csv(index=False).splitlines()[5:7] == ['trips.csv,mode,date_outlier,0.5,5,',
+                                                            'trips.csv,mode,low_frequency,0.0,6,2001-05-01 00:00:00']
+
+
+def test_truncated_frequency_lists_find_the_listed_low_frequency_values(tmp_path):
+    rng = np.random.default_rng(4)
+    modes = np.concatenate((np.repeat(['car', 'bike', '3'], [600, 300, 20]), ['v' + str(value) for value in rng.integers(0, 80, 80)], ['3.0'] * 5))
+    pd.DataFrame({'id': range(1005), 'mode': rng.permutation(modes)}).to_csv(str(tmp_path / 'trips.csv'), index=False)
+    listed_table = PandasDatasetFile(str(tmp_path / 'trips.csv'), ',')
+    threshold_table = PandasDatasetFile(str(tmp_path / 'trips.csv'), ',')
+    frequency_threshold = Constraint(1, 'n/a')
+    frequencies = FrequencyFormatter.get_counts(listed_table.value_counts('mode'))
+    low_frequency_values = [value for value, count in frequencies.items()
+                            if not frequency_threshold.within_constraint(FrequencyFormatter.get_frequency_percent(count, 1005))]
+    listed_rule_parameters = _low_frequency_rule(0, 'trips', 'mode', low_frequency_values).rule_parameters
+    threshold_rule_parameters = _low_frequency_rule(0, 'trips', 'mode', []).rule_parameters
+    threshold_rule_parameters._frequency_threshold = frequency_threshold
+
+    LowFrequencyStrategy().execute_rule(listed_table, listed_rule_parameters)
+    LowFrequencyStrategy().execute_rule(threshold_table, threshold_rule_parameters)
+
+    assert threshold_rule_parameters.active_rule
+    pd.testing.assert_frame_equal(threshold_table.dataframe, listed_table.dataframe)
+    pd.testing.assert_frame_equal(threshold_table.errors, listed_table.errors)
+    low_frequency_records, number_of_low_frequency_values = threshold_table.get_records_outside_frequency_constraint(
+        'mode', frequency_threshold.get_constraint_range())
+    assert number_of_low_frequency_values == len(low_frequency_values)
+    # '3' and '3.0' are counted as one category over the threshold, as the frequency list counts them
+    assert not (threshold_table.dataframe['mode'][low_frequency_records.mask] == '3.0').any()